@@ -0,0 +1,159 @@
+import sys
+from collections import OrderedDict
+from functools import wraps
+
+# A bounded, least recently used memo of the pure HandAnalysis routines.
+#
+# Arguments are keyed by suit isomorphism: the cards of every mask argument
+# are split by suit, and the suits are put in a canonical order by their
+# rank masks, so AsKs on Qs Ts 2c shares its entry with AhKh on Qh Th 2d. A
+# miss calls the routine on the relabeled cards; routines that return a
+# card mask have it relabeled back. Other arguments, such as a hand type,
+# are part of the key as they are.
+#
+# The memo is shared by all the routines and bounded both in entries and in
+# the approximate bytes its keys and values take. Set a limit to 0 to turn
+# the memo off.
+class AnalysisMemo:
+    DEFAULT_MAX_ENTRIES = 100000
+    DEFAULT_MAX_BYTES = 64 << 20
+
+    MaxEntries = DEFAULT_MAX_ENTRIES
+    MaxBytes = DEFAULT_MAX_BYTES
+    Hits = 0
+    Misses = 0
+    Evictions = 0
+    Bytes = 0
+
+    # key -> (value, bytes), least recently used first
+    __Entries = OrderedDict()
+
+    # Decorates a routine so its results are memoized. The first cards
+    # positional arguments are card masks, or lists of card masks such as
+    # opponent pockets; the rest are keyed as they are. Keyword arguments,
+    # such as workers, do not change the result and are not keyed.
+    # cards - number of leading card arguments
+    # relabel - True for routines returning a card mask
+    @staticmethod
+    def Memoized(cards: int, relabel: bool = False):
+        def decorate(function):
+            @wraps(function)
+            def memoized(*args, **kwargs):
+                if AnalysisMemo.MaxEntries == 0 or AnalysisMemo.MaxBytes == 0:
+                    return function(*args, **kwargs)
+
+                suits, order = AnalysisMemo.__Suits(args[:cards])
+                key = (function, suits, args[cards:])
+                entry = AnalysisMemo.__Entries.get(key)
+                if entry is not None:
+                    AnalysisMemo.__Entries.move_to_end(key)
+                    AnalysisMemo.Hits += 1
+                    value = entry[0]
+                else:
+                    AnalysisMemo.Misses += 1
+                    value = function(*(AnalysisMemo.__Canonical(args[:cards], order) + args[cards:]), **kwargs)
+                    AnalysisMemo.__Put(key, value)
+                return AnalysisMemo.__Restore(value, order) if relabel else value
+            return memoized
+        return decorate
+
+    # Returns the fraction of calls answered from the memo
+    @staticmethod
+    def HitRatio():
+        calls = AnalysisMemo.Hits + AnalysisMemo.Misses
+        return AnalysisMemo.Hits / calls if calls != 0 else 0.0
+
+    # Returns the number of results held
+    @staticmethod
+    def Count():
+        return len(AnalysisMemo.__Entries)
+
+    # Returns a dict of the memo's counters and sizes
+    @staticmethod
+    def Stats():
+        return {"entries": AnalysisMemo.Count(), "bytes": AnalysisMemo.Bytes, "hits": AnalysisMemo.Hits,
+                "misses": AnalysisMemo.Misses, "evictions": AnalysisMemo.Evictions, "hitRatio": AnalysisMemo.HitRatio()}
+
+    # Sets the limits, evicting results until the memo fits them
+    # maxEntries - most results held, 0 to turn the memo off
+    # maxBytes - most bytes held, 0 to turn the memo off
+    @staticmethod
+    def Configure(maxEntries: int = DEFAULT_MAX_ENTRIES, maxBytes: int = DEFAULT_MAX_BYTES):
+        if __debug__:
+            if maxEntries < 0 or maxBytes < 0:
+                raise Exception("Memo limits must not be negative")
+
+        AnalysisMemo.MaxEntries = maxEntries
+        AnalysisMemo.MaxBytes = maxBytes
+        AnalysisMemo.__Evict()
+
+    # Drops every result and resets the counters
+    @staticmethod
+    def Clear():
+        AnalysisMemo.__Entries.clear()
+        AnalysisMemo.Hits = AnalysisMemo.Misses = AnalysisMemo.Evictions = AnalysisMemo.Bytes = 0
+
+    @staticmethod
+    def __Put(key, value):
+        size = AnalysisMemo.__Size(key) + AnalysisMemo.__Size(value)
+        AnalysisMemo.__Entries[key] = (value, size)
+        AnalysisMemo.Bytes += size
+        AnalysisMemo.__Evict()
+
+    @staticmethod
+    def __Evict():
+        entries = AnalysisMemo.__Entries
+        while len(entries) > 0 and (len(entries) > AnalysisMemo.MaxEntries or AnalysisMemo.Bytes > AnalysisMemo.MaxBytes):
+            key, (value, size) = entries.popitem(last=False)
+            AnalysisMemo.Bytes -= size
+            AnalysisMemo.Evictions += 1
+
+    # Approximate bytes an object takes, counting the items of tuples and
+    # lists
+    @staticmethod
+    def __Size(value):
+        size = sys.getsizeof(value)
+        if isinstance(value, (tuple, list)):
+            size += sum(AnalysisMemo.__Size(item) for item in value)
+        return size
+
+    # Returns the rank masks of every suit across the card arguments, one
+    # 13 bit field per mask, in canonical order with the number of masks,
+    # and that order as the original suit of every canonical suit
+    @staticmethod
+    def __Suits(args):
+        suit0 = suit1 = suit2 = suit3 = count = 0
+        for arg in args:
+            for mask in (arg if isinstance(arg, (list, tuple)) else (arg,)):
+                mask = int(mask)
+                suit0 = (suit0 << 13) | (mask & 0x1FFF)
+                suit1 = (suit1 << 13) | ((mask >> 13) & 0x1FFF)
+                suit2 = (suit2 << 13) | ((mask >> 26) & 0x1FFF)
+                suit3 = (suit3 << 13) | (mask >> 39)
+                count += 1
+        suits = sorted(((suit0, 0), (suit1, 1), (suit2, 2), (suit3, 3)), reverse=True)
+        return (suits[0][0], suits[1][0], suits[2][0], suits[3][0], count), [suits[0][1], suits[1][1], suits[2][1], suits[3][1]]
+
+    # Returns the card arguments with the suits relabeled into canonical
+    # order
+    @staticmethod
+    def __Canonical(args, order):
+        return tuple([AnalysisMemo.__Relabel(mask, order) for mask in arg] if isinstance(arg, (list, tuple))
+                     else AnalysisMemo.__Relabel(arg, order) for arg in args)
+
+    @staticmethod
+    def __Relabel(mask, order):
+        mask = int(mask)
+        result = 0
+        for newSuit, suit in enumerate(order):
+            result |= ((mask >> (13 * suit)) & 0x1FFF) << (13 * newSuit)
+        return result
+
+    # Relabels a canonical card mask back to the caller's suits
+    @staticmethod
+    def __Restore(mask, order):
+        result = 0
+        for newSuit, suit in enumerate(order):
+            result |= ((mask >> (13 * newSuit)) & 0x1FFF) << (13 * suit)
+        return result
+#end AnalysisMemo
@@ -0,0 +1,422 @@
+from HandEvaluator import Hand, FastHand
+from HandAnalysis import HandAnalysis
+from EvaluatorBackends import SevenCardTableBackend, RankHashBackend, ColexIndex
+from SuitIsomorphism import SuitIsomorphism
+from BoardContext import BoardContext, BoardRanking
+from EnumerationPool import EnumerationPool
+from MonteCarlo import StoppingRule
+from PocketHands import PocketHands
+from PreflopEquity import PreflopEquity
+from EquityCache import EquityCache
+from AnalysisMemo import AnalysisMemo
+from FlopTables import FlopTables
+from RiverEquity import RiverEquity
+from TurnEquity import TurnEquity
+import os
+import subprocess
+import sys
+import tempfile
+from itertools import islice
+import numpy as np
+import random
+from timeit import default_timer as timer
+
+# Micro benchmarks for the hand evaluator. Run with "python Benchmark.py".
+# Each benchmark prints the time per call (or per hand for the batch and
+# iterator entry points) so numbers can be compared before and after a change.
+
+# Returns the average number of seconds a call to func takes
+# func - function to time, called with no arguments
+# count - number of calls
+def TimePerCall(func, count: int):
+    start = timer()
+    i = 0
+    while i < count:
+        func()
+        i += 1
+    return (timer() - start) / count
+
+def Report(name: str, seconds: float):
+    print("{0:<44} {1:>12.3f} us".format(name, seconds * 1e6))
+
+random.seed(0)
+noCards = 0
+sevenCardMasks = [Hand.RandomHand(noCards, 7) for i in range(100000)]
+
+def EvaluateScalar():
+    start = timer()
+    for mask in sevenCardMasks:
+        Hand.Evaluate(mask, 7)
+    return (timer() - start) / len(sevenCardMasks)
+
+def EvaluateBatch():
+    masks = np.array(sevenCardMasks * 10, dtype=np.uint64)
+    start = timer()
+    Hand.EvaluateBatch(masks, 7)
+    return (timer() - start) / len(masks)
+
+def HandsIterator(hands):
+    shared = Hand.ParseHand("As Kd")[0]
+    dead = Hand.ParseHand("2c")[0]
+    start = timer()
+    count = 0
+    for mask in hands(shared, dead, 5):
+        count += 1
+    return (timer() - start) / count
+
+def EntryPoints():
+    pocket = Hand.ParseHand("As Ks")[0]
+    flop = Hand.ParseHand("Qs Ts 2c")[0]
+    turn = Hand.ParseHand("Qs Ts 2c 7d")[0]
+    river = Hand.ParseHand("Qs Ts 2c 7d 3h")[0]
+    dead = noCards
+    opponents = [Hand.ParseHand("Qc Qd")[0]]
+    mask = sevenCardMasks[0]
+
+    Report("ParseHand", TimePerCall(lambda: Hand.ParseHand("As Ks Qs Ts 2c 7d 3h"), 20000))
+    Report("Evaluate(mask, 7)", EvaluateScalar())
+    Report("Evaluate(mask)", TimePerCall(lambda: Hand.Evaluate(mask), 20000))
+    Report("EvaluateType(mask, 7)", TimePerCall(lambda: Hand.EvaluateType(mask, 7), 20000))
+    Report("BitCount", TimePerCall(lambda: Hand.BitCount(mask), 50000))
+    Report("CardMask", TimePerCall(lambda: Hand.CardMask(mask, Hand.SPADES), 50000))
+    Report("Hands(shared, dead, 5) per hand", HandsIterator(Hand.Hands))
+    Report("RandomHand(dead, 7)", TimePerCall(lambda: Hand.RandomHand(dead, 7), 20000))
+    rng = np.random.default_rng(0)
+    Report("RandomHandsArray(0, dead, 7, n) per hand", TimePerCall(lambda: Hand.RandomHandsArray(0, dead, 7, 100000, rng), 20) / 100000)
+    Report("EvaluateBatch (7 cards, per hand)", EvaluateBatch())
+    Report("HandStrength(pocket, flop)", TimePerCall(lambda: HandAnalysis.HandStrength(pocket, flop), 20))
+    Report("HandDistance(pocket, flop)", TimePerCall(lambda: HandAnalysis.HandDistance(pocket, flop), 20))
+    Report("StraightDrawCount(pocket, flop, dead)", TimePerCall(lambda: HandAnalysis.StraightDrawCount(pocket, flop, dead), 2000))
+    Report("FlushDrawCount(pocket, flop, dead)", TimePerCall(lambda: HandAnalysis.FlushDrawCount(pocket, flop, dead), 2000))
+    Report("DrawCount(pocket, flop, dead, FLUSH)", TimePerCall(lambda: HandAnalysis.DrawCount(pocket, flop, dead, Hand.HandTypes.FLUSH), 200))
+    Report("OutsMask(pocket, turn, opponents)", TimePerCall(lambda: HandAnalysis.OutsMask(pocket, turn, opponents), 200))
+    Report("OutsMaskDiscounted(pocket, turn, [])", TimePerCall(lambda: HandAnalysis.OutsMaskDiscounted(pocket, turn, []), 200))
+    Report("HandWinOdds(pocket, river)", TimePerCall(lambda: HandAnalysis.HandWinOdds(pocket, river), 20))
+    Report("WinOdds(pocket, turn, dead)", TimePerCall(lambda: HandAnalysis.WinOdds(pocket, turn, dead), 20))
+    Report("HandPotential(pocket, turn)", TimePerCall(lambda: HandAnalysis.HandPotential(pocket, turn), 2))
+
+# Compares the overloaded Hand entry points with the FastHand ones they
+# route to. The difference is the dispatch and validation cost per call.
+def FastEntryPoints():
+    mask = sevenCardMasks[0]
+    dead = Hand.ParseHand("As Ks")[0]
+    pairs = [
+        ("Evaluate(mask, 7)", lambda: Hand.Evaluate(mask, 7), lambda: FastHand.Evaluate7(mask), 50000),
+        ("Evaluate(mask)", lambda: Hand.Evaluate(mask), lambda: FastHand.EvaluateMask(mask), 50000),
+        ("EvaluateType(mask, 7)", lambda: Hand.EvaluateType(mask, 7), lambda: FastHand.EvaluateType(mask, 7), 50000),
+        ("RandomHand(dead, 2)", lambda: Hand.RandomHand(dead, 2), lambda: FastHand.RandomHand(0, dead, 2), 50000),
+    ]
+    print("{0:<44} {1:>15} {2:>15} {3:>15}".format("", "Hand", "FastHand", "saved"))
+    for name, slow, fast, count in pairs:
+        slowTime = TimePerCall(slow, count)
+        fastTime = TimePerCall(fast, count)
+        print("{0:<44} {1:>12.3f} us {2:>12.3f} us {3:>12.3f} us".format(name, slowTime * 1e6, fastTime * 1e6, (slowTime - fastTime) * 1e6))
+    slowTime = HandsIterator(Hand.Hands)
+    fastTime = HandsIterator(FastHand.Hands)
+    print("{0:<44} {1:>12.3f} us {2:>12.3f} us {3:>12.3f} us".format("Hands(shared, dead, 5) per hand", slowTime * 1e6, fastTime * 1e6, (slowTime - fastTime) * 1e6))
+
+# The 7 card table backend. Needs the table built with
+# "python EvaluatorBackends.py"
+def TableBackend():
+    backend = SevenCardTableBackend()
+    if not os.path.exists(backend.Path):
+        print("Table7 skipped, " + backend.Path + " not built")
+        return
+    mask = sevenCardMasks[0]
+    masks = np.array(sevenCardMasks * 10, dtype=np.uint64)
+    backend.Load()
+    Report("Table7 Evaluate(mask, 7)", TimePerCall(lambda: backend.Evaluate(mask, 7), 50000))
+    Report("Table7 EvaluateBatch (7 cards, per hand)", TimePerCall(lambda: backend.EvaluateBatch(masks, 7), 5) / len(masks))
+
+    # the tally the commented out test_7CardsHands took 17 minutes for
+    start = timer()
+    counts = np.bincount(backend.Table, minlength=len(backend.Values))
+    np.bincount(backend.Values >> Hand.HANDTYPE_SHIFT, weights=counts)
+    Report("Table7 hand type tally of all 7 card hands", timer() - start)
+
+# The rank hash backend, built in memory unless its table file exists
+def RankHash():
+    backend = RankHashBackend()
+    mask = sevenCardMasks[0]
+    masks = np.array(sevenCardMasks * 10, dtype=np.uint64)
+    start = timer()
+    backend.Load()
+    Report("RankHash Load", timer() - start)
+    print("{0:<44} {1:>12.0f} KB".format("RankHash table size", sum(table.nbytes for table in backend.Tables.values()) / 1024))
+    Report("RankHash Evaluate(mask, 7)", TimePerCall(lambda: backend.Evaluate(mask, 7), 50000))
+    Report("RankHash EvaluateBatch (7 cards, per hand)", TimePerCall(lambda: backend.EvaluateBatch(masks, 7), 5) / len(masks))
+
+# Hand value ordinals, and a showdown histogram with and without them
+def Ordinals():
+    value = Hand.Evaluate(sevenCardMasks[0], 7)
+    masks = np.array(sevenCardMasks * 10, dtype=np.uint64)
+    Hand.OrdinalValues()
+    Report("ValueToOrdinal", TimePerCall(lambda: Hand.ValueToOrdinal(value), 50000))
+    Report("EvaluateOrdinalBatch (7 cards, per hand)", TimePerCall(lambda: Hand.EvaluateOrdinalBatch(masks, 7), 5) / len(masks))
+    rankHash = RankHashBackend()
+    rankHash.Load()
+    Report("RankHash EvaluateOrdinalBatch (per hand)", TimePerCall(lambda: rankHash.EvaluateOrdinalBatch(masks, 7), 5) / len(masks))
+
+    values = Hand.EvaluateBatch(masks, 7)
+    ordinals = Hand.EvaluateOrdinalBatch(masks, 7)
+    Report("histogram via np.unique (per hand)", TimePerCall(lambda: np.unique(values, return_counts=True), 5) / len(masks))
+    Report("histogram via np.bincount (per hand)", TimePerCall(lambda: np.bincount(ordinals, minlength=Hand.ORDINAL_COUNT), 5) / len(masks))
+    print("{0:<44} {1:>12} bytes per hand".format("values / ordinals", str(values.itemsize) + " / " + str(ordinals.itemsize)))
+
+# Every pocket on one board, one Evaluate call per pocket against one
+# BoardContext batch
+def BoardContextPockets():
+    flop = Hand.ParseHand("Qs Ts 2c")[0]
+    river = Hand.ParseHand("Qs Ts 2c 7d 3h")[0]
+    for name, board in (("flop", flop), ("river", river)):
+        pockets = [int(pocket) for pocket in BoardContext.Pockets if (int(pocket) & board) == 0]
+        ncards = Hand.BitCount(board) + 2
+        Report("Evaluate all pockets (" + name + ", scalar)", TimePerCall(lambda: [FastHand.Evaluate(pocket | board, ncards) for pocket in pockets], 20))
+        Report("BoardContext.EvaluateAllPockets (" + name + ")", TimePerCall(lambda: BoardContext(board).EvaluateAllPockets(), 200))
+
+# Board rankings, built once per board and then queried per hero pocket
+def BoardRankingQueries():
+    pocket = Hand.ParseHand("As Ks")[0]
+    flop = Hand.ParseHand("Qs Ts 2c")[0]
+    ranking = BoardRanking.Get(flop)
+    Report("BoardRanking build (flop)", TimePerCall(lambda: BoardRanking(flop), 200))
+    Report("BoardRanking.WinTieLoss(pocket)", TimePerCall(lambda: ranking.WinTieLoss(pocket), 50000))
+    Report("HandStrength(pocket, flop), cached ranking", TimePerCall(lambda: HandAnalysis.HandStrength(pocket, flop), 20000))
+    Report("HandDistance(pocket, flop), cached ranking", TimePerCall(lambda: HandAnalysis.HandDistance(pocket, flop), 20000))
+
+# Cold start of a fresh interpreter importing a module, with numpy imported
+# first so its own start up cost is left out. Reports the wall time and the
+# resident memory added by the import.
+# statement - import statement to time
+# compiled - True to use the cached bytecode, False to compile the sources
+def ImportTime(statement: str, compiled: bool = True, runs: int = 10):
+    script = "import os, numpy, time\n" \
+        "def rss(): return int(open('/proc/self/statm').read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024\n" \
+        "before = rss(); start = time.perf_counter()\n" + statement + "\n" \
+        "print(time.perf_counter() - start, rss() - before)"
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    seconds = []
+    kilobytes = []
+    with tempfile.TemporaryDirectory() as cache:
+        # an empty bytecode cache that is never written to forces a compile
+        flags = [] if compiled else ["-B", "-X", "pycache_prefix=" + cache]
+        for i in range(runs):
+            output = subprocess.run([sys.executable] + flags + ["-c", script], cwd=cwd, env=env, capture_output=True, text=True, check=True).stdout.split()
+            seconds.append(float(output[0]))
+            kilobytes.append(int(output[1]))
+    name = statement + ("" if compiled else " (no .pyc)")
+    Report("import " + name, min(seconds))
+    print("{0:<44} {1:>12.0f} KB".format("RSS " + name, min(kilobytes)))
+
+def ImportTimes():
+    for statement in ("from HandEvaluator import Hand", "from HandAnalysis import HandAnalysis"):
+        ImportTime(statement)
+        ImportTime(statement, compiled=False, runs=3)
+
+# Returns the time per hand of enumerating hands(), which yields masks or
+# arrays of masks
+def HandsPerMask(hands):
+    start = timer()
+    count = 0
+    for item in hands():
+        count += len(item) if isinstance(item, np.ndarray) else 1
+    return (timer() - start) / count
+
+# Enumerating and evaluating every 7 card hand holding a pocket, one mask
+# at a time and as arrays
+def HandsArrayEnumeration():
+    shared = Hand.ParseHand("As Kd")[0]
+    dead = Hand.ParseHand("2c")[0]
+    Report("Hands(shared, dead, 7) per hand", HandsPerMask(lambda: Hand.Hands(shared, dead, 7)))
+    Report("HandsArray(shared, dead, 7) per hand", HandsPerMask(lambda: Hand.HandsArray(shared, dead, 7)))
+    start = timer()
+    count = 0
+    for masks in Hand.HandsArray(shared, dead, 7):
+        Hand.EvaluateBatch(masks, 7)
+        count += len(masks)
+    Report("HandsArray + EvaluateBatch per hand", (timer() - start) / count)
+
+# Jumping into the 7 card enumeration
+def HandsRandomAccess():
+    mask = Hand.ParseHand("As Kd 7c 7h 2s Td 3c")[0]
+    Report("HandAt(index, 0, 0, 7)", TimePerCall(lambda: Hand.HandAt(98765432, 0, 0, 7), 20000))
+    Report("HandIndex(mask, 0)", TimePerCall(lambda: Hand.HandIndex(mask, 0), 20000))
+    Report("Hands(0, 0, 7, start, stop) per hand", HandsPerMask(lambda: Hand.Hands(0, 0, 7, 98765432, 99765432)))
+    Report("Hands(0, 0, 7) first 1M per hand", HandsPerMask(lambda: islice(Hand.Hands(0, 0, 7), 1000000)))
+
+# The exhaustive routines in this process and on one worker per CPU
+def ExhaustiveWorkers():
+    pocket = Hand.ParseHand("As Ks")[0]
+    flop = Hand.ParseHand("Qs Ts 2c")[0]
+    dead = Hand.ParseHand("3h")[0]
+    pockets = ["As Ks", "7h 7d", "Jc Tc"]
+    for workers in (1, None):
+        name = " workers={0}".format(EnumerationPool.Workers(workers))
+        Report("HandWinOdds(pocket, flop)" + name, TimePerCall(lambda: HandAnalysis.HandWinOdds(pocket, flop, workers=workers), 1))
+        Report("HandPotential(pocket, flop)" + name, TimePerCall(lambda: HandAnalysis.HandPotential(pocket, flop, workers=workers), 1))
+        Report("WinOdds(pocket, flop, dead)" + name, TimePerCall(lambda: HandAnalysis.WinOdds(pocket, flop, dead, workers=workers), 1))
+        Report("HandWinOdds(3 pockets, preflop)" + name, TimePerCall(lambda: HandAnalysis.HandWinOdds(pockets, "", "3h", workers=workers), 1))
+        Report("WinOdds(pocket, flop, 0, 3, 20000)" + name, TimePerCall(lambda: HandAnalysis.WinOdds(pocket, flop, 0, 3, 20000, rng=1, workers=workers), 1))
+    EnumerationPool.Shutdown()
+
+# Time per trial of the Monte Carlo routines against three opponents, and
+# of WinOdds against the most opponents
+def MonteCarloTrials():
+    pocket = Hand.ParseHand("As Ks")[0]
+    flop = Hand.ParseHand("Qs Ts 2c")[0]
+    rule = StoppingRule.FixedTrials(20000)
+    HandAnalysis.HandStrength(pocket, flop, 3, StoppingRule.FixedTrials(100)) # load the tables first
+    Report("HandStrength(pocket, flop, 3) per trial", HandAnalysis.HandStrength(pocket, flop, 3, rule, rng=1).Elapsed / 20000)
+    Report("WinOdds(pocket, flop, 0, 3) per trial", HandAnalysis.WinOdds(pocket, flop, 0, 3, rule, rng=1).Elapsed / 20000)
+    Report("HandWinOdds(pocket, flop, 3) per trial", HandAnalysis.HandWinOdds(pocket, flop, 3, rule, rng=1).Elapsed / 20000)
+    Report("HandPotential(pocket, flop, 3) per trial", HandAnalysis.HandPotential(pocket, flop, 3, rule, rng=1).Elapsed / 20000)
+    Report("HandPlayerMultiOpponentOdds per trial", HandAnalysis.HandPlayerMultiOpponentOdds(pocket, flop, 3, rule, rng=1).Elapsed / 20000)
+    Report("WinOdds(pocket, flop, 0, 22) per trial", HandAnalysis.WinOdds(pocket, flop, 0, 22, rule, rng=1).Elapsed / 20000)
+    result = HandAnalysis.WinOdds(pocket, flop, 0, 3, StoppingRule.Precision(0.005), rng=1)
+    print("WinOdds(pocket, flop, 0, 3) to +-0.005 at 95%: {0} trials, {1:.3f} s".format(result.Trials, result.Elapsed))
+
+# Compiling a pocket query the first time and from the cache
+def PocketQueries():
+    query = "AKs, QQ+, T9s-65s, A5o+"
+    def compile():
+        PocketHands.ClearCache()
+        PocketHands.Compile(query)
+    Report("PocketHands.Compile(query), first time", TimePerCall(compile, 200))
+    Report("PocketHands.Compile(query), cached", TimePerCall(lambda: PocketHands.Compile(query), 200000))
+    Report("PocketHands.Query(query, dead)", TimePerCall(lambda: PocketHands.Query(query, 0x7), 20000))
+
+# Range against range equity, exact and Monte Carlo
+def RangeEquity():
+    flop = Hand.ParseHand("Qs Ts 2c")[0]
+    turn = Hand.ParseHand("Qs Ts 2c 8d")[0]
+    Report("RangeEquity(AK vs QQ+ JTs, flop), exact", TimePerCall(lambda: HandAnalysis.RangeEquity(["AK", "QQ+, JTs"], flop), 3))
+    Report("RangeEquity(* vs *, turn), exact", TimePerCall(lambda: HandAnalysis.RangeEquity(["*", "*"], turn), 1))
+    Report("RangeEquity(* vs *, preflop), +-0.002", TimePerCall(lambda: HandAnalysis.RangeEquity(["*", "*"], 0, rule=HandAnalysis.RANGE_DEFAULT_RULE), 3))
+
+# Heads up preflop equity from the PreflopEquity table
+def PreflopEquities():
+    if not PreflopEquity.Available():
+        print("PreflopEquity table not built, run: python PreflopEquity.py")
+        return
+    ourCards = Hand.ParseHand("As Ks")[0]
+    oppCards = Hand.ParseHand("Qc Qh")[0]
+    Report("PreflopEquity.Equity(AsKs, QcQh)", TimePerCall(lambda: PreflopEquity.Equity(ourCards, oppCards), 10000))
+    Report("RangeEquity(AK vs QQ+ JTs, preflop), exact", TimePerCall(lambda: HandAnalysis.RangeEquity(["AK", "QQ+, JTs"]), 100))
+    Report("RangeEquity(* vs *, preflop), exact", TimePerCall(lambda: HandAnalysis.RangeEquity(["*", "*"]), 3))
+
+# Persistent result cache, a miss and then hits
+def EquityCacheHits():
+    pocket = Hand.ParseHand("As Ks")[0]
+    flop = Hand.ParseHand("Qs Ts 2c")[0]
+    with tempfile.TemporaryDirectory() as directory:
+        cache = EquityCache(os.path.join(directory, "cache.sqlite"))
+        Report("EquityCache.WinOdds(pocket, flop), miss", TimePerCall(lambda: cache.WinOdds(pocket, flop), 1))
+        Report("EquityCache.WinOdds(pocket, flop), hit", TimePerCall(lambda: cache.WinOdds(pocket, flop), 10000))
+        cache.Close()
+
+# The in-process memo of HandAnalysis, routines run with it off and then
+# answered from it
+def MemoHits():
+    pocket = Hand.ParseHand("As Ks")[0]
+    flop = Hand.ParseHand("Qs Ts 2c")[0]
+    routines = [("HandStrength", lambda: HandAnalysis.HandStrength(pocket, flop)),
+                ("OutsMaskEx", lambda: HandAnalysis.OutsMaskEx(pocket, flop, 0)),
+                ("DrawCount", lambda: HandAnalysis.DrawCount(pocket, flop, 0, 4))]
+    for name, routine in routines:
+        AnalysisMemo.Configure(0, 0)
+        Report(name + "(pocket, flop), memo off", TimePerCall(routine, 1000))
+        AnalysisMemo.Configure()
+        Report(name + "(pocket, flop), memo hit", TimePerCall(routine, 10000))
+    AnalysisMemo.Configure(0, 0)
+    Report("HandPotential(pocket, flop), memo off", TimePerCall(lambda: HandAnalysis.HandPotential(pocket, flop), 1))
+    AnalysisMemo.Configure()
+    HandAnalysis.HandPotential(pocket, flop)
+    Report("HandPotential(pocket, flop), memo hit", TimePerCall(lambda: HandAnalysis.HandPotential(pocket, flop), 10000))
+    print(AnalysisMemo.Stats())
+
+# HandStrength and HandPotential on a flop from the FlopTables table, and
+# HandPotential enumerated
+def FlopTableLookups():
+    if not FlopTables.Available():
+        print("FlopTables table not built, run: python FlopTables.py")
+        return
+    AnalysisMemo.Configure(0, 0)
+    pocket = Hand.ParseHand("As Ks")[0]
+    flop = Hand.ParseHand("Qs Ts 2c")[0]
+    Report("FlopTables.Lookup(pocket, flop)", TimePerCall(lambda: FlopTables.Lookup(pocket, flop), 10000))
+    Report("HandStrength(pocket, flop), table", TimePerCall(lambda: HandAnalysis.HandStrength(pocket, flop), 10000))
+    Report("HandPotential(pocket, flop), table", TimePerCall(lambda: HandAnalysis.HandPotential(pocket, flop), 10000))
+    Report("EffectiveHandStrength(pocket, flop), table", TimePerCall(lambda: HandAnalysis.EffectiveHandStrength(pocket, flop), 10000))
+    directory = FlopTables.DIRECTORY
+    with tempfile.TemporaryDirectory() as empty:
+        FlopTables.DIRECTORY = empty
+        Report("HandPotential(pocket, flop), enumerated", TimePerCall(lambda: HandAnalysis.HandPotential(pocket, flop), 1))
+    FlopTables.DIRECTORY = directory
+
+# Exact river odds against several opponents, and Monte Carlo for them
+def RiverEquities():
+    pocket = Hand.ParseHand("As Qd")[0]
+    river = Hand.ParseHand("Qs Ts 2c 8d 5s")[0]
+    for n in (1, 3, 9):
+        Report("RiverEquity.Tally(pocket, river, " + str(n) + " opponents)", TimePerCall(lambda: RiverEquity.Tally(pocket, river, 0, n), 20))
+    rule = StoppingRule.FixedTrials(100000)
+    Report("WinOdds(AsQd, river, 9 opponents), 100000 trials", TimePerCall(lambda: HandAnalysis.WinOdds("AsQd", "Qs Ts 2c 8d 5s", "", 9, rule), 1))
+
+# Turn queries, from the river rankings and by enumerating the rivers
+def TurnEquities():
+    pocket = Hand.ParseHand("As Ks")[0]
+    turn = Hand.ParseHand("Qs Ts 2c 8d")[0]
+    Report("TurnEquity(turn), building the river rankings", TimePerCall(lambda: TurnEquity(turn), 20))
+    Report("TurnEquity.Tally(pocket)", TimePerCall(lambda: TurnEquity.Get(turn).Tally(pocket), 1000))
+    Report("HandWinOdds(pocket, turn)", TimePerCall(lambda: HandAnalysis.HandWinOdds(pocket, turn), 100))
+    Report("WinOdds(pocket, turn, 0)", TimePerCall(lambda: HandAnalysis.WinOdds(pocket, turn, 0), 100))
+    Report("_WinOddsTally over the rivers", TimePerCall(lambda: HandAnalysis._WinOddsTally(pocket, turn, 0, 0, 46), 20))
+    Report("TurnEquity.MultiwayTally(pocket, 3 opponents)", TimePerCall(lambda: TurnEquity.Get(turn).MultiwayTally(pocket, 3), 5))
+
+# Suit isomorphic indices of flop situations
+def SuitIsomorphismIndex():
+    pocket = Hand.ParseHand("As Ks")[0]
+    flop = Hand.ParseHand("Qs Ts 2c")[0]
+    pockets = ColexIndex.Masks(2, 52)
+    flops = np.full(len(pockets), flop, dtype=np.uint64)
+    keep = (pockets & flops) == 0
+    pockets = np.tile(pockets[keep], 100)
+    flops = np.tile(flops[keep], 100)
+    Report("SuitIsomorphism.Index(pocket, flop)", TimePerCall(lambda: SuitIsomorphism.Index(pocket, flop), 20000))
+    Report("SuitIsomorphism.IndexBatch (flop, per row)", TimePerCall(lambda: SuitIsomorphism.IndexBatch(pockets, flops), 5) / len(pockets))
+
+if __name__ == '__main__':
+    # time the routines themselves; MemoHits times the memo
+    AnalysisMemo.Configure(0, 0)
+    EntryPoints()
+    print()
+    FastEntryPoints()
+    print()
+    TableBackend()
+    RankHash()
+    print()
+    Ordinals()
+    print()
+    BoardContextPockets()
+    BoardRankingQueries()
+    print()
+    SuitIsomorphismIndex()
+    print()
+    HandsArrayEnumeration()
+    HandsRandomAccess()
+    print()
+    ExhaustiveWorkers()
+    print()
+    MonteCarloTrials()
+    PocketQueries()
+    RangeEquity()
+    PreflopEquities()
+    EquityCacheHits()
+    MemoHits()
+    FlopTableLookups()
+    RiverEquities()
+    TurnEquities()
+    print()
+    ImportTimes()
@@ -0,0 +1,212 @@
+import numpy as np
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from HandEvaluator import Hand, FastHand
+
+# The state of one board, computed once and shared by every holding that is
+# evaluated against it.
+#
+# The HandAnalysis routines evaluate pocket | board for every opponent pocket
+# on the same board. A BoardContext splits the board into its suit masks
+# once; EvaluateAllPockets then ORs them into precomputed suit masks of all
+# 1326 pockets and evaluates them in a single batch.
+class BoardContext:
+    POCKET_COUNT = 1326
+
+    # Every two card pocket in colex order: pocket index hi * (hi - 1) / 2 + lo
+    # for the card indices lo < hi
+    Pockets = np.array([(1 << lo) | (1 << hi) for hi in range(52) for lo in range(hi)], dtype=np.uint64)
+
+    # Returns the 13 bit club, diamond, heart and spade masks of an array
+    # of card masks
+    @staticmethod
+    def __SplitSuits(masks):
+        x = np.uint64(0x1FFF)
+        return tuple(((masks >> np.uint64(13 * suit)) & x).astype(np.uint32) for suit in (Hand.CLUBS, Hand.DIAMONDS, Hand.HEARTS, Hand.SPADES))
+
+    __PocketSuits = __SplitSuits(Pockets)
+
+    # board - board mask, 0 to 5 cards
+    # dead - cards that no pocket may hold
+    def __init__(self, board: int, dead: int = 0):
+        board = int(board)
+        dead = int(dead)
+        if __debug__:
+            if Hand.BitCount(board) > 5:
+                raise Exception("Board must have no more than 5 cards")
+            if (board & dead) != 0:
+                raise Exception("Board and dead cards must not overlap")
+
+        self.Board = board
+        self.Dead = dead
+        self.BoardCards = Hand.BitCount(board)
+
+        # per suit rank masks of the board and the number of board cards of
+        # every rank
+        self.Suits = tuple(Hand.CardMask(board, suit) for suit in (Hand.CLUBS, Hand.DIAMONDS, Hand.HEARTS, Hand.SPADES))
+        self.Ranks = self.Suits[0] | self.Suits[1] | self.Suits[2] | self.Suits[3]
+        self.RankCounts = [sum((suit >> rank) & 1 for suit in self.Suits) for rank in range(13)]
+        self.__Values = None
+
+    # Returns the index of a pocket in Pockets and in the EvaluateAllPockets
+    # array
+    @staticmethod
+    def PocketIndex(pocket: int):
+        pocket = int(pocket)
+        if __debug__:
+            if Hand.BitCount(pocket) != 2:
+                raise Exception("Pocket must have exactly two cards")
+        lo = (pocket & -pocket).bit_length() - 1
+        hi = pocket.bit_length() - 1
+        return hi * (hi - 1) // 2 + lo
+
+    # Returns the value of a pocket played with the board
+    # pocket - two card pocket mask, not overlapping the board
+    def Evaluate(self, pocket: int):
+        return FastHand.Evaluate(self.Board | int(pocket), self.BoardCards + 2)
+
+    # Returns a np.bool_ array, one entry per pocket in Pockets, that is
+    # true for the pockets that hold none of the board, dead or excluded
+    # cards
+    # exclude - extra cards the pockets must not hold, such as the player's
+    #           own pocket
+    def ValidPockets(self, exclude: int = 0):
+        return (BoardContext.Pockets & np.uint64(self.Board | self.Dead | int(exclude))) == 0
+
+    # Returns the value of every pocket played with the board as a read only
+    # np.uint32 array indexed like Pockets. Pockets holding a board or dead
+    # card get 0. The array is computed on the first call.
+    def EvaluateAllPockets(self):
+        if self.__Values is None:
+            pocketSuits = BoardContext.__PocketSuits
+            values = Hand.EvaluateSuitsBatch(
+                pocketSuits[0] | np.uint32(self.Suits[0]),
+                pocketSuits[1] | np.uint32(self.Suits[1]),
+                pocketSuits[2] | np.uint32(self.Suits[2]),
+                pocketSuits[3] | np.uint32(self.Suits[3]),
+                self.BoardCards + 2)
+            values[~self.ValidPockets()] = 0
+            values.flags.writeable = False
+            self.__Values = values
+        return self.__Values
+#end BoardContext
+
+
+# The opponent hand values on one board, sorted, with the number of
+# opponent pockets at each value.
+#
+# Hand strength, distance from the nuts and win/tie/loss counts for a hero
+# pocket are binary searches. The hero's own cards remove the opponent
+# pockets holding them; the sorted values of the pockets holding each card
+# are kept so that correction is a binary search too. Get caches rankings
+# per board with a least recently used policy.
+class BoardRanking:
+    # Number of rankings Get keeps
+    CACHE_SIZE = 64
+    __Cache = OrderedDict()
+
+    # Low and high card index of every pocket in BoardContext.Pockets
+    __PocketLow = np.array([lo for hi in range(52) for lo in range(hi)], dtype=np.int64)
+    __PocketHigh = np.array([hi for hi in range(52) for lo in range(hi)], dtype=np.int64)
+
+    # board - board mask, 3 to 5 cards
+    # dead - cards that no opponent may hold
+    def __init__(self, board: int, dead: int = 0):
+        board = int(board)
+        if __debug__:
+            if Hand.BitCount(board) < 3 or Hand.BitCount(board) > 5:
+                raise Exception("Board must have 3, 4, or 5 cards")
+
+        context = BoardContext(board, dead)
+        self.Board = context.Board
+        self.Dead = context.Dead
+        self.__NCards = context.BoardCards + 2
+
+        valid = context.ValidPockets()
+        values = context.EvaluateAllPockets()[valid]
+        self.Values, self.Counts = np.unique(values, return_counts=True)
+        self.Total = len(values)
+
+        # the binary searches run on lists; below[i] is the number of
+        # pockets valued less than Values[i]
+        self.__Values = self.Values.tolist()
+        self.__Below = [0] + np.cumsum(self.Counts).tolist()
+
+        # sorted values of the pockets holding each card
+        order = np.argsort(values, kind='stable')
+        sortedValues = values[order]
+        low = BoardRanking.__PocketLow[valid][order]
+        high = BoardRanking.__PocketHigh[valid][order]
+        self.__CardValues = [sortedValues[(low == card) | (high == card)].tolist() for card in range(52)]
+
+    # Returns the ranking of a board, building it if it is not cached
+    # board - board mask, 3 to 5 cards
+    # dead - cards that no opponent may hold
+    @staticmethod
+    def Get(board: int, dead: int = 0):
+        key = (int(board), int(dead))
+        cache = BoardRanking.__Cache
+        ranking = cache.get(key)
+        if ranking is None:
+            ranking = BoardRanking(board, dead)
+            cache[key] = ranking
+            while len(cache) > BoardRanking.CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return ranking
+
+    # Empties the Get cache
+    @staticmethod
+    def ClearCache():
+        BoardRanking.__Cache.clear()
+
+    # Returns the value of a pocket played with the board
+    def Evaluate(self, pocket: int):
+        return FastHand.Evaluate(self.Board | int(pocket), self.__NCards)
+
+    # Returns a Tuple<wins, ties, losses>, the number of opponent pockets
+    # the hero pocket beats, ties and loses to. Opponent pockets holding one
+    # of the hero's cards are not counted.
+    # pocket - hero pocket mask, not overlapping the board or dead cards
+    def WinTieLoss(self, pocket: int):
+        pocket = int(pocket)
+        if __debug__:
+            if Hand.BitCount(pocket) != 2:
+                raise Exception("Pocket must have exactly two cards")
+            if (pocket & (self.Board | self.Dead)) != 0:
+                raise Exception("Pocket must not hold board or dead cards")
+
+        value = FastHand.Evaluate(self.Board | pocket, self.__NCards)
+        i = bisect_left(self.__Values, value)
+        wins = self.__Below[i]
+        ties = self.__Below[i + 1] - wins
+        losses = self.Total - wins - ties
+
+        # take out the pockets holding either hero card; the hero pocket
+        # itself holds both and ties, so it is taken out twice
+        for card in ((pocket & -pocket).bit_length() - 1, pocket.bit_length() - 1):
+            cardValues = self.__CardValues[card]
+            lo = bisect_left(cardValues, value)
+            hi = bisect_right(cardValues, value)
+            wins -= lo
+            ties -= hi - lo
+            losses -= len(cardValues) - hi
+        ties += 1
+        return (wins, ties, losses)
+
+    # Returns the hand strength of a pocket, the fraction of opponent
+    # pockets it beats counting ties as half
+    def Strength(self, pocket: int):
+        wins, ties, losses = self.WinTieLoss(pocket)
+        return (wins + 0.5 * ties) / (wins + ties + losses)
+
+    # Returns the number of distinct opponent hand values better than the
+    # pocket's; 0 is the nuts. The hero's cards do not remove any values.
+    def Distance(self, pocket: int):
+        value = self.Evaluate(pocket)
+        i = bisect_left(self.__Values, value)
+        if i == len(self.__Values) or self.__Values[i] != value:
+            return -1
+        return len(self.__Values) - 1 - i
+#end BoardRanking
@@ -0,0 +1,132 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from HandEvaluator import Hand
+from HandRandom import HandRandom
+
+# Runs an exhaustive enumeration over Hand.Hands(shared, dead, ncards), or
+# a fixed number of Monte Carlo trials, on several processes.
+#
+# The enumeration is cut into contiguous start/stop ranges, which Hand.Hands
+# can jump to directly. A tally function counts one range in a worker
+# process, and the counts of all ranges are summed. The counts are integers,
+# so the sum does not depend on how the work was split and matches the
+# serial result exactly. Trials are cut into HandRandom blocks, each with
+# its own seed, the same way.
+class EnumerationPool:
+    # Ranges per worker, so workers that finish early pick up more work
+    SHARDS_PER_WORKER = 4
+
+    # Enumerations shorter than this run in the calling process
+    MIN_PARALLEL_HANDS = 64
+
+    __Pool = None
+    __PoolWorkers = 0
+
+    # Returns the number of processes a workers argument asks for
+    # workers - number of processes, or None for one per CPU
+    @staticmethod
+    def Workers(workers: int = None):
+        if workers is None:
+            return os.cpu_count() or 1
+        if __debug__:
+            if workers < 1:
+                raise Exception("Workers must be at least 1")
+        return workers
+
+    # Returns the start/stop bounds of the ranges count hands are cut into
+    @staticmethod
+    def Shards(count: int, shards: int):
+        shards = max(1, min(count, shards))
+        return [(count * i // shards, count * (i + 1) // shards) for i in range(shards)]
+
+    # Returns the sum of tally(*args, start, stop) over the whole of
+    # Hand.Hands(shared, dead, ncards)
+    # tally - a function counting one range; it must be picklable, that is
+    #         a module level function or a static method whose name is not
+    #         mangled (no leading __), and return a np.int64 array of the
+    #         same shape for every range
+    # args - the arguments tally takes before start and stop
+    # shared, dead, ncards - the enumeration tally walks
+    # workers - number of processes, 1 to run in this process, None for one
+    #           per CPU
+    @staticmethod
+    def Run(tally, args, shared: int, dead: int, ncards: int, workers: int = 1):
+        workers = EnumerationPool.Workers(workers)
+        count = Hand.HandCount(shared, dead, ncards)
+        if workers == 1 or count < EnumerationPool.MIN_PARALLEL_HANDS:
+            return tally(*args, 0, count)
+
+        pool = EnumerationPool.__GetPool(workers)
+        futures = [pool.submit(tally, *args, start, stop)
+                   for start, stop in EnumerationPool.Shards(count, workers * EnumerationPool.SHARDS_PER_WORKER)]
+        total = futures[0].result()
+        for future in futures[1:]:
+            total = total + future.result()
+        return total
+
+    # Returns the sum of tally(*args, count, seed) over the blocks of a run
+    # of trials, count being the trials in the block and seed its
+    # SeedSequence. Block i always gets HandRandom.BlockSeed(seed, i), so for
+    # a given rng seed the sum is the same for any number of workers.
+    # tally - a picklable function sampling one block, see Run
+    # args - the arguments tally takes before count and seed
+    # trials - the number of trials, at least 1
+    # rng - the seed of the run, see HandRandom.Seed
+    # workers - number of processes, 1 to run in this process, None for one
+    #           per CPU
+    @staticmethod
+    def RunTrials(tally, args, trials: int, rng=None, workers: int = 1):
+        if __debug__:
+            if trials < 1:
+                raise Exception("Trials must be at least 1")
+
+        return EnumerationPool.RunBlocks(tally, args, HandRandom.Seed(rng), 0, HandRandom.Blocks(trials), workers)
+
+    # Returns the sum of tally(*args, count, seed) over consecutive blocks
+    # of a run, numbered from first
+    # seed - the SeedSequence of the run
+    # blocks - the number of trials in each block
+    # workers - number of processes, 1 to run in this process, None for one
+    #           per CPU
+    @staticmethod
+    def RunBlocks(tally, args, seed, first: int, blocks, workers: int = 1):
+        workers = EnumerationPool.Workers(workers)
+        if workers == 1 or len(blocks) == 1:
+            return EnumerationPool._RunBlocks(tally, args, seed, first, blocks)
+
+        pool = EnumerationPool.__GetPool(workers)
+        futures = [pool.submit(EnumerationPool._RunBlocks, tally, args, seed, first + start, blocks[start:stop])
+                   for start, stop in EnumerationPool.Shards(len(blocks), workers * EnumerationPool.SHARDS_PER_WORKER)]
+        total = futures[0].result()
+        for future in futures[1:]:
+            total = total + future.result()
+        return total
+
+    # Returns the sum of tally over consecutive blocks, the first being
+    # block first of the run
+    @staticmethod
+    def _RunBlocks(tally, args, seed, first: int, blocks):
+        total = None
+        for i, count in enumerate(blocks):
+            result = tally(*args, count, HandRandom.BlockSeed(seed, first + i))
+            total = result if total is None else total + result
+        return total
+
+    # Shuts down the worker processes; the next parallel Run starts new ones
+    @staticmethod
+    def Shutdown():
+        if EnumerationPool.__Pool is not None:
+            EnumerationPool.__Pool.shutdown()
+            EnumerationPool.__Pool = None
+            EnumerationPool.__PoolWorkers = 0
+
+    # The worker processes are kept between runs; starting them costs more
+    # than a small enumeration
+    @staticmethod
+    def __GetPool(workers: int):
+        if EnumerationPool.__PoolWorkers != workers:
+            EnumerationPool.Shutdown()
+            EnumerationPool.__Pool = ProcessPoolExecutor(workers)
+            EnumerationPool.__PoolWorkers = workers
+        return EnumerationPool.__Pool
+#end EnumerationPool
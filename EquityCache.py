@@ -0,0 +1,235 @@
+import os
+import pickle
+import sqlite3
+import hashlib
+import time
+from HandTables import HandTables
+from FlopTables import FlopTables
+from HandAnalysis import HandAnalysis
+from MonteCarlo import StoppingRule
+from SuitIsomorphism import SuitIsomorphism
+
+# A persistent cache of WinOdds, HandWinOdds, HandStrength and HandPotential
+# results, shared by every process on the machine and kept across restarts.
+#
+# A result is keyed by the function, the suit isomorphic canonical form of
+# (pocket, board, dead) (see SuitIsomorphism.Canonical), the number of
+# opponents and the precision: "exact" for the enumerating routines, or the
+# StoppingRule of a Monte Carlo one. A miss runs the routine on the
+# canonical cards, so every isomorphic situation gets the same answer.
+#
+# The store is an sqlite database in WAL mode: readers never block, writers
+# take turns, and each process opens its own connection. It keeps about
+# MaxEntries results, the least recently used going first. The count is
+# checked every EVICT_INTERVAL puts of a connection, so every writing
+# process may take the store up to EVICT_INTERVAL results past the limit
+# before it evicts; call Evict for an exact count. A version stamp,
+# the hash of the evaluator tables, of FlopTables.npy when it is built and
+# of VERSION, is kept with the results; a cache written by other tables is
+# emptied when it is opened. PreflopEquity only feeds RangeEquity, which is
+# not cached.
+# path - database file, DEFAULT_PATH for None
+# maxEntries - most results kept after an eviction
+class EquityCache:
+    DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "EquityCache.sqlite")
+
+    # Bump when the results of a routine change
+    VERSION = 1
+
+    DEFAULT_MAX_ENTRIES = 1000000
+
+    # Puts between two checks of the number of results
+    EVICT_INTERVAL = 256
+
+    # Seconds a hit may go without refreshing its access time, so that most
+    # hits only read
+    ACCESS_RESOLUTION = 60.0
+
+    # Seconds to wait for another process's write
+    BUSY_TIMEOUT = 30.0
+
+    __Stamp = None
+
+    def __init__(self, path: str = None, maxEntries: int = DEFAULT_MAX_ENTRIES):
+        if __debug__:
+            if maxEntries < 1:
+                raise Exception("The cache must hold at least one result")
+
+        self.Path = path if path else EquityCache.DEFAULT_PATH
+        self.MaxEntries = maxEntries
+        self.Hits = 0
+        self.Misses = 0
+        self.__Connection = None
+        self.__Pid = None
+        self.__Puts = 0
+
+    # Returns the version stamp of the evaluator and flop tables
+    @staticmethod
+    def Stamp():
+        if EquityCache.__Stamp is None:
+            digest = hashlib.sha1(str(EquityCache.VERSION).encode())
+            for name in sorted(HandTables.Names()):
+                with open(HandTables.Path(name), "rb") as tableFile:
+                    digest.update(tableFile.read())
+            if FlopTables.Available():
+                digest.update(b"FlopTables")
+                with open(FlopTables.Path(), "rb") as tableFile:
+                    for block in iter(lambda: tableFile.read(1 << 20), b""):
+                        digest.update(block)
+            EquityCache.__Stamp = digest.hexdigest()
+        return EquityCache.__Stamp
+
+    # Returns the exact heads up WinOdds(pocket, board, dead), or the
+    # MonteCarloResult of WinOdds against numberOfOpponents under rule
+    def WinOdds(self, pocket: int, board: int, dead: int = 0, numberOfOpponents: int = 1, rule: StoppingRule = None, workers: int = 1):
+        if rule is None:
+            EquityCache.__CheckExact(numberOfOpponents)
+            return self.Cached("WinOdds", pocket, board, dead, 1, None,
+                               lambda p, b, d: HandAnalysis.WinOdds(p, b, d, workers=workers))
+        return self.Cached("WinOdds", pocket, board, dead, numberOfOpponents, rule,
+                           lambda p, b, d: HandAnalysis.WinOdds(p, b, d, numberOfOpponents, rule, workers=workers))
+
+    # Returns the exact HandWinOdds(pocket, board), or the MonteCarloResult
+    # of HandWinOdds against numberOfOpponents under rule
+    def HandWinOdds(self, pocket: int, board: int, numberOfOpponents: int = 1, rule: StoppingRule = None, workers: int = 1):
+        if rule is None:
+            EquityCache.__CheckExact(numberOfOpponents)
+            return self.Cached("HandWinOdds", pocket, board, 0, 1, None,
+                               lambda p, b, d: HandAnalysis.HandWinOdds(p, b, workers=workers))
+        return self.Cached("HandWinOdds", pocket, board, 0, numberOfOpponents, rule,
+                           lambda p, b, d: HandAnalysis.HandWinOdds(p, b, numberOfOpponents, rule, workers=workers))
+
+    # Returns the exact HandStrength(pocket, board), or the MonteCarloResult
+    # of HandStrength against numberOfOpponents under rule
+    def HandStrength(self, pocket: int, board: int, numberOfOpponents: int = 1, rule: StoppingRule = None, workers: int = 1):
+        if rule is None:
+            EquityCache.__CheckExact(numberOfOpponents)
+            return self.Cached("HandStrength", pocket, board, 0, 1, None,
+                               lambda p, b, d: HandAnalysis.HandStrength(p, b))
+        return self.Cached("HandStrength", pocket, board, 0, numberOfOpponents, rule,
+                           lambda p, b, d: HandAnalysis.HandStrength(p, b, numberOfOpponents, rule, workers=workers))
+
+    # Returns the exact HandPotential(pocket, board), or the MonteCarloResult
+    # of HandPotential against numberOfOpponents under rule
+    def HandPotential(self, pocket: int, board: int, numberOfOpponents: int = 1, rule: StoppingRule = None, workers: int = 1):
+        if rule is None:
+            EquityCache.__CheckExact(numberOfOpponents)
+            return self.Cached("HandPotential", pocket, board, 0, 1, None,
+                               lambda p, b, d: HandAnalysis.HandPotential(p, b, workers=workers))
+        return self.Cached("HandPotential", pocket, board, 0, numberOfOpponents, rule,
+                           lambda p, b, d: HandAnalysis.HandPotential(p, b, numberOfOpponents, rule, workers=workers))
+
+    # Returns the cached result of a situation, or computes, stores and
+    # returns it
+    # function - name of the routine
+    # pocket, board, dead - the situation's masks
+    # numberOfOpponents - number of opponents
+    # rule - the StoppingRule, None for an exact result
+    # compute - function of the canonical (pocket, board, dead) masks
+    #           returning the result
+    def Cached(self, function: str, pocket: int, board: int, dead: int, numberOfOpponents: int, rule, compute):
+        key = EquityCache.Key(function, pocket, board, dead, numberOfOpponents, rule)
+        value = self.Get(key)
+        if value is not None:
+            return value
+        value = compute(key[1], key[2], key[3])
+        self.Put(key, value)
+        return value
+
+    # Returns the key of a situation: (function, canonical pocket, canonical
+    # board, canonical dead, number of opponents, precision)
+    @staticmethod
+    def Key(function: str, pocket: int, board: int, dead: int, numberOfOpponents: int, rule):
+        pocket, board, dead = SuitIsomorphism.Canonical(int(pocket), int(board), int(dead))
+        precision = "exact" if rule is None else repr(rule)
+        return (function, pocket, board, dead, numberOfOpponents, precision)
+
+    # Returns the result stored under key, None when there is none
+    def Get(self, key):
+        connection = self.__Connect()
+        row = connection.execute("SELECT value, accessed FROM results WHERE function = ? AND pocket = ? AND board = ? "
+                                 "AND dead = ? AND opponents = ? AND precision = ?", key).fetchone()
+        if row is None:
+            self.Misses += 1
+            return None
+
+        self.Hits += 1
+        now = EquityCache.__Now()
+        if now - row[1] > EquityCache.ACCESS_RESOLUTION:
+            connection.execute("UPDATE results SET accessed = ? WHERE function = ? AND pocket = ? AND board = ? "
+                               "AND dead = ? AND opponents = ? AND precision = ?", (now,) + key)
+        return pickle.loads(row[0])
+
+    # Stores a result under key
+    def Put(self, key, value):
+        connection = self.__Connect()
+        connection.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                           key + (pickle.dumps(value, pickle.HIGHEST_PROTOCOL), EquityCache.__Now()))
+        self.__Puts += 1
+        if self.__Puts % EquityCache.EVICT_INTERVAL == 0:
+            self.Evict()
+
+    # Drops the least recently used results beyond MaxEntries
+    def Evict(self):
+        connection = self.__Connect()
+        count = connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        if count > self.MaxEntries:
+            connection.execute("DELETE FROM results WHERE rowid IN "
+                               "(SELECT rowid FROM results ORDER BY accessed LIMIT ?)", (count - self.MaxEntries,))
+
+    # Returns the number of results stored
+    def Count(self):
+        return self.__Connect().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    # Removes every result
+    def Clear(self):
+        self.__Connect().execute("DELETE FROM results")
+
+    # Closes this process's connection; the next call opens a new one
+    def Close(self):
+        if self.__Connection is not None and self.__Pid == os.getpid():
+            self.__Connection.close()
+        self.__Connection = None
+
+    # Returns this process's connection, opening it and checking the
+    # version stamp the first time. A connection inherited through fork is
+    # never used.
+    def __Connect(self):
+        if self.__Connection is not None and self.__Pid == os.getpid():
+            return self.__Connection
+
+        connection = sqlite3.connect(self.Path, timeout=EquityCache.BUSY_TIMEOUT, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+            connection.execute("CREATE TABLE IF NOT EXISTS results (function TEXT, pocket INTEGER, board INTEGER, "
+                               "dead INTEGER, opponents INTEGER, precision TEXT, value BLOB, accessed REAL, "
+                               "UNIQUE (function, pocket, board, dead, opponents, precision))")
+            connection.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+            row = connection.execute("SELECT value FROM meta WHERE name = 'stamp'").fetchone()
+            if row is None or row[0] != EquityCache.Stamp():
+                connection.execute("DELETE FROM results")
+                connection.execute("INSERT OR REPLACE INTO meta VALUES ('stamp', ?)", (EquityCache.Stamp(),))
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            connection.close()
+            raise
+
+        self.__Connection = connection
+        self.__Pid = os.getpid()
+        return connection
+
+    @staticmethod
+    def __CheckExact(numberOfOpponents: int):
+        if __debug__:
+            if numberOfOpponents != 1:
+                raise Exception("Exact results are heads up only, give a StoppingRule for more opponents")
+
+    # Wall clock time, so access times compare across processes
+    @staticmethod
+    def __Now():
+        return time.time()
+#end EquityCache
@@ -0,0 +1,536 @@
+import os
+import sys
+import numpy as np
+from math import comb
+from itertools import combinations_with_replacement
+from HandEvaluator import Hand, FastHand
+
+# Pluggable hand evaluation backends.
+#
+# A backend turns card masks into the same hand values Hand.Evaluate returns,
+# using whatever lookup structures it likes. Every backend has a Name and
+# implements Supports(ncards), Evaluate(mask, ncards) and
+# EvaluateBatch(masks, ncards). Evaluator keeps the registry and sends calls
+# to the selected backend, falling back to the default backend for card
+# counts the selected one does not support.
+
+
+# The base class every backend derives from
+class EvaluatorBackend:
+    Name = ""
+
+    # Returns true if the backend can evaluate masks of ncards cards
+    def Supports(self, ncards: int):
+        return False
+
+    # Returns the hand value of a card mask, identical to Hand.Evaluate
+    # mask - card mask (int)
+    # ncards - number of cards in mask
+    def Evaluate(self, mask: int, ncards: int):
+        raise NotImplementedError()
+
+    # Returns the hand values of an array of card masks as a np.uint32 array
+    # masks - array of card masks
+    # ncards - number of cards in each mask
+    def EvaluateBatch(self, masks, ncards: int):
+        raise NotImplementedError()
+
+    # Returns the ordinal of a card mask, see Hand.ValueToOrdinal
+    def EvaluateOrdinal(self, mask: int, ncards: int):
+        return Hand.ValueToOrdinal(self.Evaluate(mask, ncards))
+
+    # Returns the ordinals of an array of card masks as a np.uint16 array
+    def EvaluateOrdinalBatch(self, masks, ncards: int):
+        return Hand.ValueToOrdinalBatch(self.EvaluateBatch(masks, ncards))
+
+
+# The bit twiddling evaluator in HandEvaluator.py. Needs no tables on disk
+# and handles any number of cards from 1 to 7.
+class HandBackend(EvaluatorBackend):
+    Name = "Hand"
+
+    def Supports(self, ncards: int):
+        return 1 <= ncards <= 7
+
+    def Evaluate(self, mask: int, ncards: int):
+        return FastHand.Evaluate(mask, ncards)
+
+    def EvaluateBatch(self, masks, ncards: int):
+        return Hand.EvaluateBatch(masks, ncards)
+
+
+# Colex combinatorial index of a card mask.
+#
+# With the cards of a mask sorted c1 < c2 < ... < ck the colex index is
+# C(c1, 1) + C(c2, 2) + ... + C(ck, k). Every k card mask gets a distinct
+# index in 0 to C(52, k) - 1, and the masks that only use the first n cards
+# get the first C(n, k) indices, so a table over a smaller deck is a prefix
+# of the full table.
+class ColexIndex:
+
+    # Returns the table T where T[suit][k][cards] is the part of the index
+    # contributed by the 13 bit rank mask cards of suit, given k cards in
+    # the lower suits
+    @staticmethod
+    def __BuildSuitTables():
+        nBits = np.array(Hand.nBitsTable, dtype=np.int64)
+        patterns = np.arange(8192, dtype=np.int64)
+        maxCards = 7 # so at most 7 cards in the lower suits
+
+        # comb(card, i) for i up to 7, zero past that since such masks have
+        # too many cards to be indexed
+        combTable = np.zeros((52, 14 + maxCards), dtype=np.int64)
+        for card in range(52):
+            for i in range(1, maxCards + 1):
+                combTable[card][i] = comb(card, i)
+
+        tables = np.zeros((4, maxCards + 1, 8192), dtype=np.int64)
+        for suit in range(4):
+            for k in range(maxCards + 1):
+                for bit in range(13):
+                    below = nBits[patterns & ((1 << bit) - 1)]
+                    has = ((patterns >> bit) & 1) != 0
+                    tables[suit][k] += np.where(has, combTable[13 * suit + bit][k + below + 1], 0)
+        return tables.astype(np.uint32)
+
+    # Built on first use, so importing the backends stays cheap
+    SuitTables = None
+    __SuitLists = None
+
+    # Builds the suit tables. Called on first use.
+    @staticmethod
+    def Load():
+        ColexIndex.SuitTables = ColexIndex.__BuildSuitTables()
+        ColexIndex.__SuitLists = ColexIndex.SuitTables.tolist()
+
+    # Returns the colex index of a card mask of up to 7 cards
+    @staticmethod
+    def Index(mask: int):
+        nBitsTable = Hand.nBitsTable
+        suitLists = ColexIndex.__SuitLists
+        if suitLists is None:
+            ColexIndex.Load()
+            suitLists = ColexIndex.__SuitLists
+        sc = mask & 0x1FFF
+        sd = (mask >> 13) & 0x1FFF
+        sh = (mask >> 26) & 0x1FFF
+        ss = (mask >> 39) & 0x1FFF
+        nc = nBitsTable[sc]
+        ncd = nc + nBitsTable[sd]
+        return suitLists[0][0][sc] + suitLists[1][nc][sd] + suitLists[2][ncd][sh] + \
+            suitLists[3][ncd + nBitsTable[sh]][ss]
+
+    # Returns the colex indices of an array of card masks as a np.int64 array
+    @staticmethod
+    def IndexBatch(masks):
+        masks = np.asarray(masks, dtype=np.uint64)
+        if ColexIndex.SuitTables is None:
+            ColexIndex.Load()
+        tables = ColexIndex.SuitTables
+        nBits = Hand.nBitsArray
+        sc = (masks & np.uint64(0x1FFF)).astype(np.intp)
+        sd = ((masks >> np.uint64(13)) & np.uint64(0x1FFF)).astype(np.intp)
+        sh = ((masks >> np.uint64(26)) & np.uint64(0x1FFF)).astype(np.intp)
+        ss = ((masks >> np.uint64(39)) & np.uint64(0x1FFF)).astype(np.intp)
+        nc = nBits[sc].astype(np.intp)
+        ncd = nc + nBits[sd]
+        index = tables[0, 0, sc].astype(np.int64)
+        index += tables[1, nc, sd]
+        index += tables[2, ncd, sh]
+        index += tables[3, ncd + nBits[sh], ss]
+        return index
+
+    # Returns the masks of every k card combination of the first n cards,
+    # ordered by colex index. The j card combinations whose top card is t
+    # are the (j - 1) card combinations of the cards below t plus t, and
+    # those are a prefix of the (j - 1) card list, so each list is built
+    # from slices of the previous one.
+    @staticmethod
+    def Masks(k: int, n: int):
+        if __debug__:
+            if k < 0 or k > 7 or n < k or n > 52:
+                raise Exception("Invalid combination size")
+
+        masks = np.zeros(1, dtype=np.uint64)
+        j = 1
+        while j <= k:
+            masks = np.concatenate([masks[:comb(t, j - 1)] | np.uint64(1 << t) for t in range(j - 1, n - (k - j))])
+            j += 1
+        return masks
+#end ColexIndex
+
+
+# All the 7 card hand values in one table indexed by colex index.
+#
+# The table holds C(52, 7) = 133,784,560 entries. Each entry is the np.uint16
+# ordinal of the hand value (see Hand.ValueToOrdinal), so the table is 268MB
+# on disk. It is opened with np.load(mmap_mode='r'), which
+# maps the file instead of reading it: start up is instant and processes on
+# the same machine share the pages.
+#
+# Build the table once with "python EvaluatorBackends.py Table7 [path]".
+class SevenCardTableBackend(EvaluatorBackend):
+    Name = "Table7"
+    DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "HandTable7.npy")
+
+    # Number of masks evaluated at a time while building the table
+    __BUILD_CHUNK = 1 << 21
+
+    # path - table file to load
+    def __init__(self, path: str = None):
+        self.Path = path if path else SevenCardTableBackend.DEFAULT_PATH
+        self.Table = None
+        self.Values = None
+
+    # Maps the table into memory. Called on first use.
+    def Load(self):
+        if not os.path.exists(self.Path):
+            raise Exception("7 card table " + self.Path + " is missing, build it with: python EvaluatorBackends.py Table7")
+        self.Values = Hand.OrdinalValues()
+        self.__ValueList = self.Values.tolist()
+        self.Table = np.load(self.Path, mmap_mode='r')
+
+    def Supports(self, ncards: int):
+        return ncards == 7
+
+    def Evaluate(self, mask: int, ncards: int = 7):
+        if self.Table is None:
+            self.Load()
+        return self.__ValueList[self.Table[ColexIndex.Index(mask)]]
+
+    def EvaluateBatch(self, masks, ncards: int = 7):
+        if self.Table is None:
+            self.Load()
+        return self.Values[self.Table[ColexIndex.IndexBatch(masks)]]
+
+    def EvaluateOrdinal(self, mask: int, ncards: int = 7):
+        if self.Table is None:
+            self.Load()
+        return int(self.Table[ColexIndex.Index(mask)])
+
+    def EvaluateOrdinalBatch(self, masks, ncards: int = 7):
+        if self.Table is None:
+            self.Load()
+        return self.Table[ColexIndex.IndexBatch(masks)]
+
+    # Evaluates every 7 card hand of the first deckCards cards and writes
+    # the table to path. A table over fewer than 52 cards is a prefix of the
+    # full one and is only useful for tests.
+    # path - file to write
+    # deckCards - number of cards in the deck, 7 to 52
+    @staticmethod
+    def Build(path: str, deckCards: int = 52):
+        if __debug__:
+            if deckCards < 7 or deckCards > 52:
+                raise Exception("Invalid number of cards in deck")
+
+        table = np.lib.format.open_memmap(path, mode='w+', dtype=np.uint16, shape=(comb(deckCards, 7),))
+        lower = ColexIndex.Masks(6, deckCards - 1)
+        chunk = SevenCardTableBackend.__BUILD_CHUNK
+        top = 6
+        while top < deckCards:
+            # hands with top card "top" take the next C(top, 6) indices
+            offset = comb(top, 7)
+            count = comb(top, 6)
+            start = 0
+            while start < count:
+                stop = min(start + chunk, count)
+                handValues = Hand.EvaluateBatch(lower[start:stop] | np.uint64(1 << top), 7)
+                table[offset + start:offset + stop] = Hand.ValueToOrdinalBatch(handValues)
+                start = stop
+            top += 1
+
+        table.flush()
+        del table
+#end SevenCardTableBackend
+
+
+# A low memory backend for 5, 6 and 7 card hands.
+#
+# Flushes come from a table of the 8192 possible 13 bit suit masks: a hand of
+# at most 7 cards has at most one suit with 5 or more cards, and when it has
+# one nothing beats the flush (or straight flush) in that suit.
+#
+# Every other hand is worth what its ranks are worth. Each rank has a key,
+# chosen so that sums of up to 7 keys are distinct for each number of cards,
+# and the key sum of a hand is looked up in a displacement perfect hash:
+# row = sum >> HASH_SHIFT picks an offset, and offset + (sum & HASH_MASK)
+# is the slot. Slots hold the np.uint16 ordinals of the hand values.
+#
+# All the tables together take about 400KB. They are built in a few seconds
+# on first use, or loaded from a file written with
+# "python EvaluatorBackends.py RankHash [path]".
+class RankHashBackend(EvaluatorBackend):
+    Name = "RankHash"
+    DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "HandRankHash.npz")
+
+    RANK_KEYS = [0, 1, 5, 22, 98, 453, 2031, 8698, 22854, 83661, 262349, 636345, 1479181]
+    HASH_SHIFT = 9
+    HASH_MASK = (1 << HASH_SHIFT) - 1
+
+    # Width of the window of candidate offsets tried at once while building
+    __BUILD_WINDOW = 2048
+
+    # path - table file to load; built in memory when it does not exist
+    def __init__(self, path: str = None):
+        self.Path = path if path else RankHashBackend.DEFAULT_PATH
+        self.Tables = None
+
+    # Loads the tables, or builds them if there is no table file
+    def Load(self):
+        if os.path.exists(self.Path):
+            with np.load(self.Path) as tables:
+                self.Tables = dict(tables)
+        else:
+            self.Tables = RankHashBackend.BuildTables()
+
+        # key sum of every 13 bit rank mask
+        keys = np.array(RankHashBackend.RANK_KEYS, dtype=np.int64)
+        patterns = np.arange(8192)
+        keySums = np.zeros(8192, dtype=np.int64)
+        for rank in range(13):
+            keySums += np.where((patterns >> rank) & 1 != 0, keys[rank], 0)
+        self.Tables["keySums"] = keySums
+
+        # python lists for the scalar path, indexing them is much faster than
+        # indexing numpy arrays one element at a time
+        self.__KeySumList = keySums.tolist()
+        self.__FlushList = self.Tables["flush"].tolist()
+        values = Hand.OrdinalValues()
+        self.__HashLists = {}
+        for ncards in (5, 6, 7):
+            offsets = self.Tables["offsets" + str(ncards)].tolist()
+            slots = values[self.Tables["slots" + str(ncards)]].tolist()
+            self.__HashLists[ncards] = (offsets, slots)
+
+    def Supports(self, ncards: int):
+        return 5 <= ncards <= 7
+
+    def Evaluate(self, mask: int, ncards: int):
+        if self.Tables is None:
+            self.Load()
+        sc = mask & 0x1FFF
+        sd = (mask >> 13) & 0x1FFF
+        sh = (mask >> 26) & 0x1FFF
+        ss = (mask >> 39) & 0x1FFF
+
+        flushList = self.__FlushList
+        flush = flushList[sc] | flushList[sd] | flushList[sh] | flushList[ss]
+        if flush != 0:
+            return flush
+
+        keySumList = self.__KeySumList
+        key = keySumList[sc] + keySumList[sd] + keySumList[sh] + keySumList[ss]
+        offsets, slots = self.__HashLists[ncards]
+        return slots[offsets[key >> RankHashBackend.HASH_SHIFT] + (key & RankHashBackend.HASH_MASK)]
+
+    # masks - array of card masks
+    # ncards - number of cards in every mask, 5 to 7
+    def EvaluateOrdinalBatch(self, masks, ncards: int):
+        if self.Tables is None:
+            self.Load()
+        if __debug__:
+            if not self.Supports(ncards):
+                raise Exception("Invalid number of cards")
+
+        tables = self.Tables
+        masks = np.asarray(masks, dtype=np.uint64)
+        sc = (masks & np.uint64(0x1FFF)).astype(np.intp)
+        sd = ((masks >> np.uint64(13)) & np.uint64(0x1FFF)).astype(np.intp)
+        sh = ((masks >> np.uint64(26)) & np.uint64(0x1FFF)).astype(np.intp)
+        ss = ((masks >> np.uint64(39)) & np.uint64(0x1FFF)).astype(np.intp)
+
+        keySums = tables["keySums"]
+        key = keySums[sc] + keySums[sd] + keySums[sh] + keySums[ss]
+        offsets = tables["offsets" + str(ncards)]
+        slots = tables["slots" + str(ncards)]
+        result = slots[offsets[key >> RankHashBackend.HASH_SHIFT] + (key & RankHashBackend.HASH_MASK)]
+
+        flushTable = tables["flushOrdinals"]
+        flush = flushTable[sc] | flushTable[sd] | flushTable[sh] | flushTable[ss]
+        return np.where(flush != 0, flush, result)
+
+    def EvaluateBatch(self, masks, ncards: int):
+        return Hand.OrdinalToValueBatch(self.EvaluateOrdinalBatch(masks, ncards))
+
+    # Returns the perfect hash offsets of a sorted array of distinct keys
+    # and the number of slots used. Rows with the most keys are placed
+    # first, each at the lowest offset where all its slots are free.
+    @staticmethod
+    def __Displace(keys):
+        window = RankHashBackend.__BUILD_WINDOW
+        rows = keys >> RankHashBackend.HASH_SHIFT
+        cols = keys & RankHashBackend.HASH_MASK
+        nrows = int(rows[-1]) + 1
+        bounds = np.searchsorted(rows, np.arange(nrows + 1))
+        sizes = np.diff(bounds)
+
+        free = np.ones(4 * len(keys) + 2 * (RankHashBackend.HASH_MASK + 1) + 2 * window, dtype=bool)
+        offsets = np.zeros(nrows, dtype=np.int32)
+        firstFree = 0
+        for row in np.argsort(-sizes, kind='stable'):
+            if sizes[row] == 0:
+                break
+            rowCols = cols[bounds[row]:bounds[row + 1]]
+            while not free[firstFree]:
+                firstFree += 1
+
+            # the lowest candidate puts the first key of the row in the first
+            # free slot; slots must not be negative
+            offset = max(firstFree - int(rowCols[0]), -int(rowCols[0]))
+            while True:
+                fits = free[offset + rowCols[0]:offset + rowCols[0] + window].copy()
+                for col in rowCols[1:]:
+                    fits &= free[offset + col:offset + col + window]
+                hits = np.flatnonzero(fits)
+                if len(hits) != 0:
+                    offset += int(hits[0])
+                    break
+                offset += window
+
+            free[offset + rowCols] = False
+            offsets[row] = offset
+        return offsets, int(np.flatnonzero(~free)[-1]) + 1
+
+    # Builds and returns the flush tables and the perfect hash for 5, 6 and
+    # 7 cards
+    @staticmethod
+    def BuildTables():
+        nBits = Hand.nBitsArray
+        flush = np.zeros(8192, dtype=np.uint32)
+        for pattern in np.flatnonzero((nBits >= 5) & (nBits <= 7)):
+            flush[pattern] = FastHand.Evaluate(int(pattern), int(nBits[pattern]))
+
+        # the worst flush is far above ordinal 0, so 0 still means no flush
+        flushOrdinals = np.zeros(8192, dtype=np.uint16)
+        flushOrdinals[flush != 0] = Hand.ValueToOrdinalBatch(flush[flush != 0])
+        tables = {"flush": flush, "flushOrdinals": flushOrdinals}
+        hashes = []
+        for ncards in (5, 6, 7):
+            # one hand for every multiset of ranks, with the suits dealt in
+            # turn so that no suit gets more than 2 cards
+            keys = []
+            masks = []
+            for ranks in combinations_with_replacement(range(13), ncards):
+                if max(ranks.count(rank) for rank in ranks) > 4:
+                    continue
+                mask = 0
+                suit = 0
+                for rank in ranks:
+                    mask |= 1 << (13 * suit + rank)
+                    suit = (suit + 1) & 3
+                keys.append(sum(RankHashBackend.RANK_KEYS[rank] for rank in ranks))
+                masks.append(mask)
+
+            keys = np.array(keys, dtype=np.int64)
+            order = np.argsort(keys)
+            keys = keys[order]
+            if (np.diff(keys) == 0).any():
+                raise Exception("Rank keys are not unique for " + str(ncards) + " cards")
+            values = Hand.EvaluateBatch(np.array(masks, dtype=np.uint64)[order], ncards)
+            hashes.append((ncards, keys, values))
+
+        for ncards, keys, values in hashes:
+            offsets, size = RankHashBackend.__Displace(keys)
+            slots = np.zeros(size, dtype=np.uint16)
+            slots[offsets[keys >> RankHashBackend.HASH_SHIFT] + (keys & RankHashBackend.HASH_MASK)] = \
+                Hand.ValueToOrdinalBatch(values)
+            tables["offsets" + str(ncards)] = offsets
+            tables["slots" + str(ncards)] = slots
+        return tables
+
+    # Builds the tables and writes them to path
+    @staticmethod
+    def Build(path: str):
+        np.savez(path, **RankHashBackend.BuildTables())
+#end RankHashBackend
+
+
+# Registry of evaluation backends and the entry points that use the
+# selected one.
+#
+# Besides the calls below, the Monte Carlo kernels of HandAnalysis evaluate
+# their deals with the selected backend. The exhaustive routines do not:
+# BoardContext splits the board into suits once for all the pockets and
+# evaluates them with Hand.EvaluateSuitsBatch. Select before the first
+# call that uses workers; a process pool already running keeps the backend
+# it started with.
+class Evaluator:
+    __Backends = {}
+    __Default = HandBackend()
+    __Current = __Default
+
+    # Adds a backend to the registry under its Name
+    @staticmethod
+    def Register(backend: EvaluatorBackend):
+        Evaluator.__Backends[backend.Name] = backend
+
+    # Selects the backend used by Evaluate and EvaluateBatch
+    # backend - a registered backend name or a backend instance
+    @staticmethod
+    def Select(backend):
+        if isinstance(backend, str):
+            if backend not in Evaluator.__Backends:
+                raise Exception("Unknown evaluator backend " + backend)
+            backend = Evaluator.__Backends[backend]
+        Evaluator.__Current = backend
+
+    # Returns the selected backend
+    @staticmethod
+    def Current():
+        return Evaluator.__Current
+
+    # Returns the names of the registered backends
+    @staticmethod
+    def Names():
+        return list(Evaluator.__Backends.keys())
+
+    # Returns the hand value of a card mask with the selected backend
+    @staticmethod
+    def Evaluate(mask: int, ncards: int):
+        backend = Evaluator.__Current
+        if not backend.Supports(ncards):
+            backend = Evaluator.__Default
+        return backend.Evaluate(mask, ncards)
+
+    # Returns the hand values of an array of card masks with the selected
+    # backend
+    @staticmethod
+    def EvaluateBatch(masks, ncards: int):
+        backend = Evaluator.__Current
+        if not backend.Supports(ncards):
+            backend = Evaluator.__Default
+        return backend.EvaluateBatch(masks, ncards)
+
+    # Returns the ordinal of a card mask with the selected backend
+    @staticmethod
+    def EvaluateOrdinal(mask: int, ncards: int):
+        backend = Evaluator.__Current
+        if not backend.Supports(ncards):
+            backend = Evaluator.__Default
+        return backend.EvaluateOrdinal(mask, ncards)
+
+    # Returns the np.uint16 ordinals of an array of card masks with the
+    # selected backend, ready for np.bincount
+    @staticmethod
+    def EvaluateOrdinalBatch(masks, ncards: int):
+        backend = Evaluator.__Current
+        if not backend.Supports(ncards):
+            backend = Evaluator.__Default
+        return backend.EvaluateOrdinalBatch(masks, ncards)
+
+Evaluator.Register(HandBackend())
+Evaluator.Register(SevenCardTableBackend())
+Evaluator.Register(RankHashBackend())
+
+
+# Builds a backend table file: python EvaluatorBackends.py [Table7|RankHash] [path]
+if __name__ == '__main__':
+    name = sys.argv[1] if len(sys.argv) > 1 else SevenCardTableBackend.Name
+    path = sys.argv[2] if len(sys.argv) > 2 else None
+    if name == SevenCardTableBackend.Name:
+        SevenCardTableBackend.Build(path if path else SevenCardTableBackend.DEFAULT_PATH)
+    elif name == RankHashBackend.Name:
+        RankHashBackend.Build(path if path else RankHashBackend.DEFAULT_PATH)
+    else:
+        raise Exception("Unknown evaluator backend " + name)
@@ -0,0 +1,146 @@
+import os
+import sys
+import numpy as np
+from HandEvaluator import FastHand
+from BoardContext import BoardContext
+from EnumerationPool import EnumerationPool
+from SuitIsomorphism import SuitIsomorphism, HandIndexer
+
+# HandStrength and HandPotential of every pocket on every flop.
+#
+# Pockets on a flop fall into SuitIsomorphism.IndexCount(3) = 1,286,792
+# suit isomorphic classes, and every one has a canonical flop: one of the
+# 1,755 flops that SuitIsomorphism leaves as they are. The generator walks
+# those flops. For each it evaluates all the pockets on every turn and
+# river with BoardContext.EvaluateAllPockets and counts, for every pair of
+# pockets, the runouts the first one wins; the ties follow, since the two
+# pockets see C(45, 2) = 990 runouts. Grouping the opponents by where they
+# stand on the flop then gives the HandPotential tallies of every pocket
+# at once, and HandStrength is the flop grouping itself. The values are
+# computed with the same formulas as HandAnalysis, so they are the same
+# floats.
+#
+# The table holds the strength, positive potential and negative potential
+# of every class as np.float64, indexed by SuitIsomorphism.Index(pocket,
+# flop). It is a .npy file next to this module, memory-mapped on first use.
+# Build it once, on every CPU, with "python FlopTables.py [directory]".
+class FlopTables:
+    DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+    TABLE_NAME = "FlopTables"
+
+    # Columns of the table
+    STRENGTH = 0
+    PPOT = 1
+    NPOT = 2
+
+    # Runouts two pockets see from the flop
+    RUNOUTS = 990
+
+    __Table = None
+
+    # Returns the path of the table file
+    @staticmethod
+    def Path(directory: str = None):
+        return os.path.join(FlopTables.DIRECTORY if directory is None else directory, FlopTables.TABLE_NAME + ".npy")
+
+    # Returns True when the table is built
+    @staticmethod
+    def Available():
+        return os.path.exists(FlopTables.Path())
+
+    # Maps the table into memory. Called on first use.
+    @staticmethod
+    def Load():
+        if not FlopTables.Available():
+            raise Exception("Flop table " + FlopTables.Path() + " is missing, build it with: python FlopTables.py")
+        FlopTables.__Table = np.load(FlopTables.Path(), mmap_mode='r')
+
+    # Returns (strength, ppot, npot) of a pocket on a flop
+    # pocket - two card pocket mask
+    # flop - three card board mask
+    @staticmethod
+    def Lookup(pocket: int, flop: int):
+        if FlopTables.__Table is None:
+            FlopTables.Load()
+        strength, ppot, npot = FlopTables.__Table[SuitIsomorphism.Index(pocket, flop)].tolist()
+        return (strength, ppot, npot)
+
+    # Returns the table rows of arrays of pockets and flops as an n x 3
+    # np.float64 array
+    @staticmethod
+    def LookupBatch(pockets, flops):
+        if FlopTables.__Table is None:
+            FlopTables.Load()
+        return FlopTables.__Table[SuitIsomorphism.IndexBatch(pockets, flops)]
+
+    # Computes the table and writes it to directory
+    # directory - where to write the file, this module's directory for None
+    # workers - number of processes, None for one per CPU
+    @staticmethod
+    def Build(directory: str = None, workers: int = None):
+        table = EnumerationPool.Run(FlopTables._BuildTally, (), 0, 0, 3, workers)
+        np.save(FlopTables.Path(directory), table)
+        FlopTables.__Table = None
+
+    # Fills in the rows of the canonical flops among flops start to stop of
+    # Hands(0, 0, 3). Returns the whole table, zero in the other rows, so
+    # the rows of all the ranges add up.
+    @staticmethod
+    def _BuildTally(start: int, stop: int):
+        table = np.zeros((SuitIsomorphism.IndexCount(3), 3), dtype=np.float64)
+        flops = np.fromiter(FastHand.Hands(0, 0, 3, start, stop), dtype=np.uint64, count=stop - start)
+        for flop in flops[HandIndexer.CanonicalBatch([flops])[0] == flops].tolist():
+            pockets, rows = FlopTables.__FlopRows(flop)
+            table[SuitIsomorphism.IndexBatch(pockets, np.full(len(pockets), flop, dtype=np.uint64))] = rows
+        return table
+
+    # Returns the pockets left on a flop and their (strength, ppot, npot)
+    @staticmethod
+    def __FlopRows(flop: int):
+        ahead = 2
+        tied = 1
+        behind = 0
+
+        values = BoardContext(flop).EvaluateAllPockets()
+        live = np.flatnonzero(values != 0)
+        pockets = BoardContext.Pockets[live]
+        now = values[live].astype(np.int64)
+
+        # wins[i, j]: the runouts pocket i wins against pocket j. Pockets
+        # on the runout have value 0, so they never win, and never lose
+        # either once they are the largest value.
+        wins = np.zeros((len(live), len(live)), dtype=np.int16)
+        for runout in FastHand.Hands(0, flop, 2):
+            river = BoardContext(flop | runout).EvaluateAllPockets()[live]
+            losers = np.where(river == 0, np.uint32(0xFFFFFFFF), river)
+            np.add(wins, river[:, None] > losers[None, :], out=wins, casting='unsafe')
+
+        final = np.zeros((3, len(live), len(live)), dtype=np.int64)
+        final[ahead] = wins
+        final[tied] = FlopTables.RUNOUTS - final[ahead] - final[ahead].T
+        final[behind] = FlopTables.RUNOUTS - final[ahead] - final[tied]
+
+        # where every opponent stands now, as in HandAnalysis.HandPotential
+        opponents = (pockets[:, None] & pockets[None, :]) == 0
+        index = np.where(now[:, None] > now[None, :], ahead, np.where(now[:, None] == now[None, :], tied, behind))
+        hpTotal = np.zeros((len(live), 3), dtype=np.int64)
+        hp = np.zeros((len(live), 3, 3), dtype=np.int64)
+        for i in range(3):
+            group = opponents & (index == i)
+            hpTotal[:, i] = group.sum(axis=1)
+            for j in range(3):
+                hp[:, i, j] = (group * final[j]).sum(axis=1)
+
+        mult = float(FlopTables.RUNOUTS)
+        den1 = mult * (hpTotal[:, behind] + (hpTotal[:, tied] / 2.0))
+        den2 = mult * (hpTotal[:, ahead] + (hpTotal[:, tied] / 2.0))
+        ppot = (hp[:, behind, ahead] + (hp[:, behind, tied] / 2) + (hp[:, tied, ahead] / 2)) / np.where(den1 > 0, den1, 1.0)
+        npot = (hp[:, ahead, behind] + (hp[:, ahead, tied] / 2) + (hp[:, tied, behind] / 2)) / np.where(den2 > 0, den2, 1.0)
+        strength = (hpTotal[:, ahead] + 0.5 * hpTotal[:, tied]) / (hpTotal[:, ahead] + hpTotal[:, tied] + hpTotal[:, behind])
+        rows = np.stack([strength, np.where(den1 > 0, ppot, 0.0), np.where(den2 > 0, npot, 0.0)], axis=1)
+        return pockets, rows
+#end FlopTables
+
+
+if __name__ == '__main__':
+    FlopTables.Build(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -1,7 +1,26 @@
 from numpy.core.defchararray import less
 from HandAnalysis import HandAnalysis
 import unittest
-from HandEvaluator import Hand
+from HandEvaluator import Hand, FastHand
+from EvaluatorBackends import ColexIndex, SevenCardTableBackend, RankHashBackend, Evaluator
+from SuitIsomorphism import SuitIsomorphism
+from BoardContext import BoardContext, BoardRanking
+from HandTables import HandTables
+from EnumerationPool import EnumerationPool
+from HandRandom import HandRandom
+from MonteCarlo import MonteCarlo, StoppingRule
+from PocketHands import PocketHands
+from PreflopEquity import PreflopEquity
+from EquityCache import EquityCache
+from AnalysisMemo import AnalysisMemo
+from FlopTables import FlopTables
+from RiverEquity import RiverEquity
+from TurnEquity import TurnEquity
+from math import comb
+import os
+import tempfile
+import sqlite3
+import random
 import numpy as np
 from timeit import Timer, default_timer as timer
 import time
@@ -198,6 +217,769 @@ class HandEvaluatorTest(unittest.TestCase):
         self.assertTrue(40 == handTypes[Hand.HandTypes.STRAIGHT_FLUSH]);
         self.assertTrue(2598960 == count);
     
+    # The batch evaluator must return exactly what the scalar evaluator returns
+    def test_EvaluateBatch(self):
+        hands = ["As Ks Qs Js Ts", "Ad 2d 3d 4d 5d 9c 9h", "Kc Kd Kh Ks 2c", "7c 7d 7h 2s 2d Ac",
+                "Ac Kc 9c 5c 2c", "6h 7d 8s 9c Tc", "Qc Qd Qh 3s 4d", "Jc Jd 8h 8s 2c 2d 3h",
+                "Ac Ad 5h 6s 9c", "2c 4d 6h 8s Tc Qd", "As", "Kd Kh", "3c 3d 3h"]
+        masks = [Hand.ParseHand(hand)[0] for hand in hands]
+        for ncards in range(1, 8):
+            for trial in range(500):
+                masks.append(Hand.RandomHand(np.uint64(0), ncards))
+
+        values = Hand.EvaluateBatch(np.array(masks, dtype=np.uint64))
+        self.assertTrue(values.dtype == np.uint32)
+        self.assertTrue(len(values) == len(masks))
+        i = 0
+        while i < len(masks):
+            self.assertTrue(values[i] == Hand.Evaluate(masks[i], Hand.BitCount(masks[i])))
+            i += 1
+
+        # passing the card count must not change the result
+        sevenCards = np.array([Hand.RandomHand(np.uint64(0), 7) for trial in range(500)], dtype=np.uint64)
+        self.assertTrue((Hand.EvaluateBatch(sevenCards, 7) == Hand.EvaluateBatch(sevenCards)).all())
+
+    def test_FastHand(self):
+        for ncards in range(1, 8):
+            for trial in range(500):
+                mask = Hand.RandomHand(0, ncards)
+                self.assertTrue(FastHand.Evaluate(mask, ncards) == Hand.Evaluate(mask, ncards))
+                self.assertTrue(FastHand.EvaluateMask(mask) == Hand.Evaluate(mask))
+                self.assertTrue(FastHand.EvaluateType(mask, ncards) == Hand.EvaluateType(mask, ncards)[0])
+                if ncards == 7:
+                    self.assertTrue(FastHand.Evaluate7(mask) == Hand.Evaluate(mask, 7))
+
+        shared = Hand.ParseHand("As Kd")[0]
+        dead = Hand.ParseHand("2c 2d")[0]
+        self.assertTrue(list(FastHand.Hands(shared, dead, 4)) == list(Hand.Hands(shared, dead, 4)))
+        count = 0
+        for mask in FastHand.Hands(shared, dead, 4):
+            self.assertTrue(mask & shared == shared and mask & dead == 0 and Hand.BitCount(mask) == 4)
+            count += 1
+        self.assertTrue(count == 1128) # 48 choose 2
+
+        for trial in range(500):
+            mask = FastHand.RandomHand(shared, dead, 5)
+            self.assertTrue(mask & shared == shared and mask & dead == 0 and Hand.BitCount(mask) == 5)
+
+    def test_SevenCardTable(self):
+        # colex index against its definition
+        for trial in range(500):
+            mask = Hand.RandomHand(0, 7)
+            cards = [i for i in range(52) if mask & (1 << i) != 0]
+            index = sum(comb(cards[i], i + 1) for i in range(7))
+            self.assertTrue(ColexIndex.Index(mask) == index)
+            self.assertTrue(ColexIndex.IndexBatch(np.array([mask], dtype=np.uint64))[0] == index)
+        masks = ColexIndex.Masks(7, 12)
+        self.assertTrue((ColexIndex.IndexBatch(masks) == np.arange(comb(12, 7))).all())
+
+        # a table over the first 20 cards holds every 7 card hand of those cards
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.npy")
+            SevenCardTableBackend.Build(path, 20)
+            backend = SevenCardTableBackend(path)
+            dead = ((1 << 52) - 1) ^ ((1 << 20) - 1)
+            masks = list(FastHand.Hands(0, dead, 7))
+            self.assertTrue(len(masks) == len(np.load(path, mmap_mode='r')))
+            values = backend.EvaluateBatch(np.array(masks, dtype=np.uint64), 7)
+            i = 0
+            while i < len(masks):
+                self.assertTrue(values[i] == Hand.Evaluate(masks[i], 7))
+                self.assertTrue(backend.Evaluate(masks[i], 7) == values[i])
+                i += 1
+            ordinals = backend.EvaluateOrdinalBatch(np.array(masks, dtype=np.uint64), 7)
+            self.assertTrue((Hand.OrdinalToValueBatch(ordinals) == values).all())
+            self.assertTrue(backend.EvaluateOrdinal(masks[0], 7) == ordinals[0])
+
+            # the selected backend handles 7 cards, the default one the rest
+            Evaluator.Select(backend)
+            try:
+                self.assertTrue(Evaluator.Current() is backend)
+                self.assertTrue(Evaluator.Evaluate(masks[0], 7) == Hand.Evaluate(masks[0], 7))
+                pocket = Hand.ParseHand("Ac Kc")[0]
+                self.assertTrue(Evaluator.Evaluate(pocket, 2) == Hand.Evaluate(pocket, 2))
+            finally:
+                Evaluator.Select("Hand")
+                del backend
+
+    def test_RankHashBackend(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rankhash.npz")
+            RankHashBackend.Build(path)
+            backend = RankHashBackend(path)
+            self.assertTrue(not backend.Supports(4) and backend.Supports(5) and backend.Supports(7))
+
+            # every 5 card hand
+            masks = ColexIndex.Masks(5, 52)
+            self.assertTrue((backend.EvaluateBatch(masks, 5) == Hand.EvaluateBatch(masks, 5)).all())
+
+            for ncards in (5, 6, 7):
+                masks = [Hand.RandomHand(0, ncards) for trial in range(2000)]
+                masks += [Hand.ParseHand(hand)[0] for hand in ["As Ks Qs Js Ts 2c 2d", "2h 3h 4h 5h Ah Ad Ac",
+                    "Kc Kd Kh Ks 2c 2d 3h", "7c 7d 7h 2s 2d Ac 9c", "Ac Kc 9c 5c 2c 3d 3h"] if Hand.ParseHand(hand)[1] == ncards]
+                values = backend.EvaluateBatch(np.array(masks, dtype=np.uint64), ncards)
+                i = 0
+                while i < len(masks):
+                    self.assertTrue(values[i] == Hand.Evaluate(masks[i], ncards))
+                    self.assertTrue(backend.Evaluate(masks[i], ncards) == values[i])
+                    i += 1
+
+        Evaluator.Select("RankHash")
+        try:
+            self.assertTrue(Evaluator.Current().Name == "RankHash")
+            mask = Hand.ParseHand("As Ks Qs Js Ts 2c 2d")[0]
+            self.assertTrue(Evaluator.Evaluate(mask, 7) == Hand.Evaluate(mask, 7))
+        finally:
+            Evaluator.Select("Hand")
+
+        # the Monte Carlo kernels deal with the selected backend, to the same
+        # results
+        pocket, flop = Hand.ParseHand("As Ks")[0], Hand.ParseHand("Qs Ts 2c")[0]
+        rule = StoppingRule.FixedTrials(2000)
+        backend = RankHashBackend()
+        Evaluator.Select(backend)
+        try:
+            selected = HandAnalysis.WinOdds(pocket, flop, 0, 3, rule, rng=4)
+            self.assertTrue(backend.Tables is not None)
+            backend.Tables = None
+            ranged = HandAnalysis.RangeEquity(["AK", "QQ+", "JTs"], flop, rule=rule, rng=5)
+            self.assertTrue(backend.Tables is not None)
+        finally:
+            Evaluator.Select("Hand")
+        self.assertTrue(selected.Value == HandAnalysis.WinOdds(pocket, flop, 0, 3, rule, rng=4).Value)
+        self.assertTrue(ranged.Value == HandAnalysis.RangeEquity(["AK", "QQ+", "JTs"], flop, rule=rule, rng=5).Value)
+
+    def test_Ordinals(self):
+        values = Hand.OrdinalValues()
+        self.assertTrue(len(values) == Hand.ORDINAL_COUNT == 7462)
+        self.assertTrue((np.diff(values.astype(np.int64)) > 0).all())
+        self.assertTrue(Hand.OrdinalToValue(0) == Hand.Evaluate("7c 5d 4h 3s 2c"))
+        self.assertTrue(Hand.OrdinalToValue(7461) == Hand.Evaluate("As Ks Qs Js Ts"))
+        self.assertTrue(Hand.ValueToOrdinal(Hand.Evaluate("Ac Kd Qh Js Tc 2c 2d")) == Hand.ValueToOrdinal(Hand.Evaluate("Ad Kc Qs Jh Td")))
+
+        # every 5 card hand maps to an ordinal and back
+        masks = ColexIndex.Masks(5, 52)
+        ordinals = Hand.EvaluateOrdinalBatch(masks, 5)
+        self.assertTrue(ordinals.dtype == np.uint16)
+        self.assertTrue((np.bincount(ordinals, minlength=7462) != 0).all())
+        self.assertTrue((Hand.OrdinalToValueBatch(ordinals) == Hand.EvaluateBatch(masks, 5)).all())
+
+        # ordinals order hands the same way hand values do
+        for trial in range(1000):
+            a = Hand.Evaluate(Hand.RandomHand(0, 7), 7)
+            b = Hand.Evaluate(Hand.RandomHand(0, 7), 7)
+            self.assertTrue((a < b) == (Hand.ValueToOrdinal(a) < Hand.ValueToOrdinal(b)))
+            self.assertTrue(Hand.OrdinalToValue(Hand.ValueToOrdinal(a)) == a)
+
+        masks = np.array([Hand.RandomHand(0, 7) for trial in range(1000)], dtype=np.uint64)
+        ordinals = Hand.EvaluateOrdinalBatch(masks, 7)
+        self.assertTrue((Evaluator.EvaluateOrdinalBatch(masks, 7) == ordinals).all())
+        self.assertTrue(Evaluator.EvaluateOrdinal(int(masks[0]), 7) == ordinals[0])
+        backend = RankHashBackend()
+        self.assertTrue((backend.EvaluateOrdinalBatch(masks, 7) == ordinals).all())
+
+    def test_SuitIsomorphism(self):
+        self.assertTrue(SuitIsomorphism.IndexCount(0) == 169)
+        self.assertTrue(SuitIsomorphism.IndexCount(3) == 1286792)
+        self.assertTrue(SuitIsomorphism.IndexCount(4) == 13960050)
+        self.assertTrue(SuitIsomorphism.IndexCount(5) == 123156254)
+
+        # preflop the index is the PocketHand169 value
+        pockets = ColexIndex.Masks(2, 52)
+        for pocket in pockets[::7]:
+            self.assertTrue(SuitIsomorphism.Index(int(pocket)) == Hand.PocketHand169Type(int(pocket)).value)
+        self.assertTrue((SuitIsomorphism.IndexBatch(pockets) == [Hand.PocketHand169Type(int(m)).value for m in pockets]).all())
+
+        pocket = Hand.ParseHand("As Ks")[0]
+        board = Hand.ParseHand("Qs Ts 2c")[0]
+        self.assertTrue(SuitIsomorphism.Index(pocket, board) == SuitIsomorphism.Index(Hand.ParseHand("Ah Kh")[0], Hand.ParseHand("Qh Th 2d")[0]))
+        self.assertTrue(SuitIsomorphism.Index(pocket, board) != SuitIsomorphism.Index(pocket, Hand.ParseHand("Qs Ts 2s")[0]))
+
+        # relabeling the suits gives the same index and canonical form
+        def permute(mask, suits):
+            return sum(Hand.CardMask(mask, suit) << (13 * suits[suit]) for suit in range(4))
+
+        rows = []
+        for trial in range(500):
+            boardCards = random.choice([3, 4, 5])
+            deadCards = random.choice([0, 0, 1, 2])
+            cards = random.sample(range(52), 2 + boardCards + deadCards)
+            pocket = sum(1 << card for card in cards[:2])
+            board = sum(1 << card for card in cards[2:2 + boardCards])
+            dead = sum(1 << card for card in cards[2 + boardCards:])
+            suits = random.sample(range(4), 4)
+            index = SuitIsomorphism.Index(pocket, board, dead)
+            self.assertTrue(0 <= index < SuitIsomorphism.IndexCount(boardCards, deadCards))
+            self.assertTrue(index == SuitIsomorphism.Index(permute(pocket, suits), permute(board, suits), permute(dead, suits)))
+            canonical = SuitIsomorphism.Canonical(pocket, board, dead)
+            self.assertTrue(canonical == SuitIsomorphism.Canonical(permute(pocket, suits), permute(board, suits), permute(dead, suits)))
+            self.assertTrue(SuitIsomorphism.Index(*canonical) == index)
+            if boardCards == 3 and deadCards == 0:
+                rows.append((pocket, board, index))
+
+        pockets = np.array([row[0] for row in rows], dtype=np.uint64)
+        boards = np.array([row[1] for row in rows], dtype=np.uint64)
+        self.assertTrue((SuitIsomorphism.IndexBatch(pockets, boards) == [row[2] for row in rows]).all())
+        canonicalPockets, canonicalBoards, canonicalDeads = SuitIsomorphism.CanonicalBatch(pockets, boards)
+        self.assertTrue((SuitIsomorphism.IndexBatch(canonicalPockets, canonicalBoards) == [row[2] for row in rows]).all())
+
+    def test_BoardContext(self):
+        board = Hand.ParseHand("Qs Ts 2c 7d")[0]
+        dead = Hand.ParseHand("Ah")[0]
+        context = BoardContext(board, dead)
+        values = context.EvaluateAllPockets()
+        self.assertTrue(len(values) == BoardContext.POCKET_COUNT == len(BoardContext.Pockets))
+        for i in range(len(BoardContext.Pockets)):
+            pocket = int(BoardContext.Pockets[i])
+            self.assertTrue(BoardContext.PocketIndex(pocket) == i)
+            if (pocket & (board | dead)) != 0:
+                self.assertTrue(values[i] == 0)
+            else:
+                self.assertTrue(values[i] == Hand.Evaluate(pocket | board, 6) == context.Evaluate(pocket))
+
+        # the analysis routines built on it agree with a plain enumeration
+        pocket = Hand.ParseHand("As Ks")[0]
+        board = Hand.ParseHand("Qs Ts 2c")[0]
+        ourRank = Hand.Evaluate(pocket | board)
+        win = count = 0.0
+        for opponent in Hand.Hands(0, pocket | board, 2):
+            opponentRank = Hand.Evaluate(opponent | board)
+            win += 1.0 if ourRank > opponentRank else 0.5 if ourRank == opponentRank else 0.0
+            count += 1.0
+        self.assertTrue(HandAnalysis.HandStrength(pocket, board) == win / count)
+
+        ppot, npot = HandAnalysis.HandPotential(pocket, Hand.ParseHand("Qs Ts 2c 7d")[0])
+        self.assertTrue(0.0 <= ppot <= 1.0 and 0.0 <= npot <= 1.0)
+
+    def test_BoardRanking(self):
+        board = Hand.ParseHand("Qs Ts 2c 7d")[0]
+        dead = Hand.ParseHand("Ah 3c")[0]
+        ranking = BoardRanking(board, dead)
+        self.assertTrue(ranking.Total == int(ranking.Counts.sum()) == comb(46, 2))
+        self.assertTrue((np.diff(ranking.Values.astype(np.int64)) > 0).all())
+
+        # win/tie/loss against every opponent pocket left after card removal
+        for pocket in [Hand.ParseHand("As Ks")[0], Hand.ParseHand("Qc Qd")[0], Hand.ParseHand("2d 2h")[0], Hand.ParseHand("4c 5c")[0]]:
+            ourRank = Hand.Evaluate(pocket | board)
+            wins = ties = losses = 0
+            for opponent in Hand.Hands(0, pocket | board | dead, 2):
+                opponentRank = Hand.Evaluate(opponent | board)
+                if ourRank > opponentRank:
+                    wins += 1
+                elif ourRank == opponentRank:
+                    ties += 1
+                else:
+                    losses += 1
+            self.assertTrue(ranking.WinTieLoss(pocket) == (wins, ties, losses))
+            self.assertTrue(ranking.Strength(pocket) == (wins + 0.5 * ties) / (wins + ties + losses))
+
+        # Get returns the cached ranking and drops the least recently used
+        BoardRanking.ClearCache()
+        cacheSize = BoardRanking.CACHE_SIZE
+        BoardRanking.CACHE_SIZE = 2
+        first = BoardRanking.Get(board)
+        self.assertTrue(BoardRanking.Get(board) is first)
+        second = BoardRanking.Get(Hand.ParseHand("Qs Ts 2c")[0])
+        BoardRanking.Get(board)
+        BoardRanking.Get(Hand.ParseHand("Qs Ts 3c")[0])
+        self.assertTrue(BoardRanking.Get(board) is first)
+        self.assertTrue(BoardRanking.Get(Hand.ParseHand("Qs Ts 2c")[0]) is not second)
+        BoardRanking.CACHE_SIZE = cacheSize
+        BoardRanking.ClearCache()
+
+    def test_HandTables(self):
+        # the shipped tables match their definitions
+        for name in HandTables.Names():
+            table = HandTables.Compute(name)
+            if table is not None:
+                self.assertTrue(table.dtype == HandTables.Array(name).dtype)
+                self.assertTrue((table == HandTables.Array(name)).all())
+
+        self.assertTrue(len(HandTables.List("PreCalcPlayerOdds")) == len(HandTables.List("PreCalcOppOdds")) == 169)
+        self.assertTrue(Hand.nBitsTable[0x1FFF] == 13 and Hand.nBitsArray.dtype == np.uint32)
+        self.assertTrue(len(Hand.TwoCardMaskTable) == Hand.TwoCardMaskTableSize == 1326)
+        self.assertTrue(sorted(Hand.TwoCardMaskTable) == sorted(int(mask) for mask in Hand.Hands(2)))
+        self.assertTrue(sum(len(masks) for masks in Hand.Pocket169Table) == 1326)
+        for i in range(169):
+            for mask in Hand.Pocket169Table[i]:
+                self.assertTrue(type(mask) is int and Hand.PocketHand169Type(mask).value == i)
+
+        # building into another directory reproduces every file
+        with tempfile.TemporaryDirectory() as directory:
+            HandTables.Build(directory)
+            for name in HandTables.Names():
+                self.assertTrue(open(HandTables.Path(name), "rb").read() == open(HandTables.Path(name, directory), "rb").read())
+
+    def test_HandsArray(self):
+        # same masks in the same order as Hands, for any chunk size
+        cases = [(0, 0, 2), (0, 0, 3),
+                 (Hand.ParseHand("As Ks")[0], 0, 5),
+                 (Hand.ParseHand("As")[0], Hand.ParseHand("2c 3d 4h")[0], 6),
+                 (Hand.ParseHand("As Kd Qh")[0], 0, 3),
+                 (Hand.ParseHand("As Kd Qh")[0], 0, 2),
+                 (0, ((1 << 52) - 1) ^ 0xFF, 5),
+                 (Hand.ParseHand("2c 3c")[0], ((1 << 52) - 1) ^ 0x3F, 7),
+                 (0, ((1 << 52) - 1) ^ 0x7, 4)]
+        for shared, dead, ncards in cases:
+            expected = [int(mask) for mask in Hand.Hands(shared, dead, ncards)]
+            for chunkSize in (1, 7, 1000, Hand.HANDS_ARRAY_CHUNK_SIZE):
+                chunks = list(Hand.HandsArray(shared, dead, ncards, chunkSize))
+                self.assertTrue(all(chunk.dtype == np.uint64 for chunk in chunks))
+                self.assertTrue(all(len(chunk) == chunkSize for chunk in chunks[:-1]))
+                self.assertTrue(all(0 < len(chunk) <= chunkSize for chunk in chunks))
+                masks = np.concatenate(chunks).tolist() if chunks else []
+                self.assertTrue(masks == expected)
+
+        # the chunks feed EvaluateBatch directly
+        shared = Hand.ParseHand("As Kd")[0]
+        dead = Hand.ParseHand("2c 3c 4c 5c 6c 7c 8c 9c Tc Jc Qc Kc Ac 2d 3d 4d 5d 6d 7d 8d 9d Td Jd Qd")[0]
+        values = np.concatenate([Hand.EvaluateBatch(masks, 6) for masks in Hand.HandsArray(shared, dead, 6, 1000)])
+        self.assertTrue(values.tolist() == [Hand.Evaluate(mask, 6) for mask in Hand.Hands(shared, dead, 6)])
+
+    def test_HandIndex(self):
+        # HandAt and HandIndex agree with the position in Hands
+        cases = [(0, 0, 2),
+                 (Hand.ParseHand("As Ks")[0], Hand.ParseHand("2c")[0], 4),
+                 (Hand.ParseHand("As")[0], Hand.ParseHand("2c 3d 4h")[0], 3),
+                 (0, ((1 << 52) - 1) ^ 0xFFF, 5),
+                 (Hand.ParseHand("2c 3c")[0], ((1 << 52) - 1) ^ 0x3FF, 7)]
+        for shared, dead, ncards in cases:
+            masks = list(Hand.Hands(shared, dead, ncards))
+            self.assertTrue(Hand.HandCount(shared, dead, ncards) == len(masks))
+            for i, mask in enumerate(masks):
+                self.assertTrue(Hand.HandAt(i, shared, dead, ncards) == mask)
+                self.assertTrue(Hand.HandIndex(mask, dead, shared) == i)
+
+            # start/stop slices, and shards that cover the enumeration
+            count = len(masks)
+            for start, stop in ((0, 1), (1, 17), (count // 3, count // 2), (count - 5, count + 5), (count + 1, count + 2)):
+                self.assertTrue(list(Hand.Hands(shared, dead, ncards, start, stop)) == masks[start:stop])
+            self.assertTrue(list(Hand.Hands(shared, dead, ncards, count // 2)) == masks[count // 2:])
+            bounds = [0, 1, count // 7, count // 2, count]
+            shards = [list(Hand.Hands(shared, dead, ncards, bounds[i], bounds[i + 1])) for i in range(len(bounds) - 1)]
+            self.assertTrue(sum(shards, []) == masks)
+
+        # every 7 card hand
+        self.assertTrue(Hand.HandCount(0, 0, 7) == 133784560)
+        self.assertTrue(Hand.HandAt(0, 0, 0, 7) == 0x7F)
+        self.assertTrue(Hand.HandAt(133784559, 0, 0, 7) == 0x7F << 45)
+        for i in (1, 1000, 54321987, 133784558):
+            self.assertTrue(Hand.HandIndex(Hand.HandAt(i, 0, 0, 7), 0) == i)
+        resumed = Hand.Hands(0, 0, 7, 54321987, 54321990)
+        self.assertTrue(list(resumed) == [Hand.HandAt(i, 0, 0, 7) for i in range(54321987, 54321990)])
+
+    def test_EnumerationPool(self):
+        # the shards cover the enumeration once, in order
+        for count, shards in ((10, 3), (5, 8), (1081, 16)):
+            bounds = EnumerationPool.Shards(count, shards)
+            self.assertTrue(bounds[0][0] == 0 and bounds[-1][1] == count)
+            self.assertTrue(all(bounds[i][1] == bounds[i + 1][0] for i in range(len(bounds) - 1)))
+
+        # sharded results are identical to serial ones
+        pocket = Hand.ParseHand("As Ks")[0]
+        flop = Hand.ParseHand("Qs Ts 2c")[0]
+        turn = Hand.ParseHand("Qs Ts 2c 7d")[0]
+        dead = Hand.ParseHand("3h")[0]
+        try:
+            for workers in (2, 3):
+                self.assertTrue(HandAnalysis.HandWinOdds(pocket, turn, workers=workers) == HandAnalysis.HandWinOdds(pocket, turn))
+                self.assertTrue(HandAnalysis.HandPotential(pocket, turn, workers=workers) == HandAnalysis.HandPotential(pocket, turn))
+                self.assertTrue(HandAnalysis.WinOdds(pocket, turn, dead, workers=workers) == HandAnalysis.WinOdds(pocket, turn, dead))
+                pockets = ["As Ks", "7h 7d", "Jc Tc"]
+                self.assertTrue(HandAnalysis.HandWinOdds(pockets, "Qs Ts 2c", "3h", workers=workers) == HandAnalysis.HandWinOdds(pockets, "Qs Ts 2c", "3h"))
+            self.assertTrue(HandAnalysis.HandWinOdds(pocket, flop, workers=2) == HandAnalysis.HandWinOdds(pocket, flop))
+        finally:
+            EnumerationPool.Shutdown()
+
+        # the exhaustive win odds against a brute force count
+        wins = ties = losses = 0
+        for board in Hand.Hands(turn, pocket | dead, 5):
+            ourValue = Hand.Evaluate(pocket | board, 7)
+            for opponent in Hand.Hands(0, pocket | board | dead, 2):
+                oppValue = Hand.Evaluate(opponent | board, 7)
+                wins += ourValue > oppValue
+                ties += ourValue == oppValue
+                losses += ourValue < oppValue
+        self.assertTrue(HandAnalysis.WinOdds(pocket, turn, dead) == (wins + ties / 2.0) / (wins + ties + losses))
+
+        # every pocket gets its own wins, ties and losses
+        wins, ties, losses, totalHands = HandAnalysis.HandWinOdds(["As Ks", "Ah Kh", "Jc Tc"], "Qs Ts 2c 8d", "4h")
+        self.assertTrue((wins, ties, losses, totalHands) == ([9, 0, 26], [6, 6, 0], [26, 35, 15], 41))
+
+    def test_RandomHandsArray(self):
+        shared = Hand.ParseHand("As Kd")[0]
+        dead = Hand.ParseHand("2c 3c 4c 5c 6c 7c 8c 9c Tc Jc")[0]
+        masks = Hand.RandomHandsArray(shared, dead, 7, 20000, np.random.default_rng(7))
+        self.assertTrue(masks.dtype == np.uint64 and len(masks) == 20000)
+        self.assertTrue(((masks & np.uint64(shared)) == shared).all() and ((masks & np.uint64(dead)) == 0).all())
+        self.assertTrue(all(Hand.BitCount(mask) == 7 for mask in masks.tolist()))
+
+        # the same seed gives the same masks
+        self.assertTrue((Hand.RandomHandsArray(shared, dead, 7, 1000, 11) == Hand.RandomHandsArray(shared, dead, 7, 1000, 11)).all())
+        self.assertTrue((Hand.RandomHandsArray(shared, 0, 2, 5) == shared).all())
+        self.assertTrue(len(Hand.RandomHandsArray(0, 0, 5, 0)) == 0)
+
+        # every 3 card hand from 6 live cards comes up about equally often
+        dead = ((1 << 52) - 1) ^ Hand.ParseHand("2c 3c 4c 5c 6c 7c")[0]
+        expected = 200000 / 20
+        counts = {}
+        for mask in Hand.RandomHandsArray(0, dead, 3, 200000, 3).tolist():
+            counts[mask] = counts.get(mask, 0) + 1
+        self.assertTrue(sorted(counts) == sorted(Hand.Hands(0, dead, 3)))
+        chiSquare = sum((count - expected) ** 2 / expected for count in counts.values())
+        self.assertTrue(chiSquare < 43.8) # p = 0.001, 19 degrees of freedom
+
+    def test_HandRandom(self):
+        # the same seed gives the same hands, from every random API
+        masks = [Hand.ParseHand("As Ks")[0], Hand.ParseHand("Qh Qd")[0]]
+        self.assertTrue(Hand.RandomHand(0, 7, rng=3) == Hand.RandomHand(0, 7, rng=3))
+        self.assertTrue(Hand.RandomHand(masks[0], 0, 7, rng=3) == Hand.RandomHand(masks[0], 0, 7, rng=3))
+        self.assertTrue(Hand.RandomHandFromList(masks, 0, 5, rng=4) == Hand.RandomHandFromList(masks, 0, 5, rng=4))
+        self.assertTrue(list(Hand.RandomHands(0, masks[0], 5, 5000, rng=5)) == list(Hand.RandomHands(0, masks[0], 5, 5000, rng=5)))
+        self.assertTrue(list(Hand.RandomHands(5, 100, rng=5)) != list(Hand.RandomHands(5, 100, rng=6)))
+        self.assertTrue(all(Hand.BitCount(mask) == 5 and (mask & masks[0]) == 0 for mask in Hand.RandomHands(0, masks[0], 5, 5000, rng=5)))
+
+        # a Generator is advanced, and matches a new one with the same seed
+        rng = np.random.default_rng(9)
+        first = Hand.RandomHand(0, 7, rng=rng)
+        self.assertTrue(first == Hand.RandomHand(0, 7, rng=np.random.default_rng(9)))
+
+        # block streams depend only on the seed and the block number
+        seed = HandRandom.Seed(11)
+        seed.spawn(3)
+        self.assertTrue(HandRandom.BlockSeed(seed, 2).generate_state(4).tolist() == HandRandom.BlockSeed(HandRandom.Seed(11), 2).generate_state(4).tolist())
+        self.assertTrue(HandRandom.Blocks(2 * HandRandom.BLOCK_TRIALS + 5) == [HandRandom.BLOCK_TRIALS, HandRandom.BLOCK_TRIALS, 5])
+
+        # a fixed seed and trial count give the same odds for any number of workers
+        pocket = Hand.ParseHand("As Ks")[0]
+        flop = Hand.ParseHand("Qs Ts 2c")[0]
+        trials = 2 * HandRandom.BLOCK_TRIALS + 100
+        odds = HandAnalysis.WinOdds(pocket, flop, 0, 2, trials, rng=42)
+        try:
+            self.assertTrue(HandAnalysis.WinOdds(pocket, flop, 0, 2, trials, rng=42, workers=2) == odds)
+            self.assertTrue(HandAnalysis.WinOdds(pocket, flop, 0, 2, trials, rng=42, workers=3) == odds)
+        finally:
+            EnumerationPool.Shutdown()
+        self.assertTrue(HandAnalysis.WinOdds(pocket, flop, 0, 2, trials, rng=43) != odds)
+        self.assertTrue(abs(odds - HandAnalysis.WinOdds(pocket, flop, 0, 2, 0.05, rng=1)) < 0.05)
+
+    def test_MonteCarlo(self):
+        pocket = Hand.ParseHand("As Ks")[0]
+        flop = Hand.ParseHand("Qs Ts 2c")[0]
+        self.assertTrue(MonteCarlo.MeanError(3, 3, 1) == float("inf"))
+        self.assertTrue(abs(MonteCarlo.WinRateError(50, 0, 100) - 0.5 / 10.0) < 1e-3)
+
+        # a trial count is met exactly and reproduced by the seed
+        result = HandAnalysis.HandStrength(pocket, flop, 2, StoppingRule.FixedTrials(5000), rng=7)
+        self.assertTrue(result.Trials == 5000 and result.Elapsed > 0.0 and result.StandardError > 0.0)
+        self.assertTrue(HandAnalysis.HandStrength(pocket, flop, 2, StoppingRule.FixedTrials(5000), rng=7).Value == result.Value)
+
+        # a precision target stops once the interval is narrow enough, and the
+        # estimate agrees with the exact odds
+        rule = StoppingRule.Precision(0.01, 0.99)
+        result = HandAnalysis.WinOdds(pocket, flop, 0, 1, rule, rng=8)
+        self.assertTrue(result.Trials >= MonteCarlo.MIN_PRECISION_TRIALS)
+        self.assertTrue(rule.Z * result.StandardError <= 0.01)
+        self.assertTrue(abs(result.Value - HandAnalysis.WinOdds(pocket, flop, 0)) < 5 * result.StandardError)
+        rule = StoppingRule.Precision(0.01, trials=2000)
+        self.assertTrue(HandAnalysis.WinOdds(pocket, flop, 0, 1, rule, rng=8).Trials == 2000)
+
+        # a duration runs at least that long, with one timer check per batch
+        result = HandAnalysis.HandPotential(Hand.ParseHand("5c 6c")[0], flop, 2, StoppingRule.FixedDuration(0.1), rng=9)
+        self.assertTrue(result.Elapsed >= 0.1 and len(result.StandardError) == 2)
+        player, opponent = HandAnalysis.HandWinOdds(pocket, flop, 3, StoppingRule.FixedTrials(2000), rng=10).Value
+        self.assertTrue(abs(sum(player) + sum(opponent) - 1.0) < 1e-9)
+        result = HandAnalysis.HandPlayerMultiOpponentOdds(pocket, flop, 3, StoppingRule.FixedTrials(2000), rng=11)
+        self.assertTrue(all(0.0 <= odds <= 1.0 for odds in result.Value[0] + result.Value[1]))
+        self.assertTrue(abs(sum(HandAnalysis.HandWinOdds(pocket, flop, 2, 0.05)[0]) - 0.58) < 0.1)
+
+    def test_MonteCarloOpponents(self):
+        pocket = Hand.ParseHand("As Ks")[0]
+        flop = Hand.ParseHand("Qs Ts 2c")[0]
+        rule = StoppingRule.FixedTrials(100000)
+
+        # against one opponent the batch kernel agrees with the exhaustive counts
+        result = HandAnalysis.HandStrength(pocket, flop, 1, rule, rng=1)
+        self.assertTrue(abs(result.Value - HandAnalysis.HandStrength(pocket, flop)) < 5 * result.StandardError)
+        player, opponent = HandAnalysis.HandWinOdds(pocket, flop, 1, rule, rng=2).Value
+        exactPlayer, exactOpponent = HandAnalysis.HandWinOdds(pocket, flop)
+        self.assertTrue(all(abs(player[i] - exactPlayer[i]) < 0.01 for i in range(9)))
+
+        # any number of opponents up to 22 can be dealt, and the odds fall
+        # as opponents are added
+        odds = [HandAnalysis.WinOdds(pocket, 0, 0, n, StoppingRule.FixedTrials(5000), rng=3).Value for n in (1, 5, 12, 22)]
+        self.assertTrue(odds == sorted(odds, reverse=True))
+        ppot, npot = HandAnalysis.HandPotential(pocket, flop, HandAnalysis.MAX_OPPONENTS, StoppingRule.FixedTrials(1000), rng=4).Value
+        self.assertTrue(0.0 <= ppot <= 1.0 and 0.0 <= npot <= 1.0)
+        player, opponent = HandAnalysis.HandPlayerMultiOpponentOdds(pocket, flop, 22, StoppingRule.FixedTrials(1000), rng=5).Value
+        self.assertTrue(abs(sum(player) - HandAnalysis.WinOdds(pocket, flop, 0, 22, StoppingRule.FixedTrials(1000), rng=5).Value) < 0.1)
+        self.assertRaises(Exception, HandAnalysis.WinOdds, pocket, flop, 0, 23, rule)
+
+    def test_PocketHands(self):
+        self.assertTrue(all(PocketHands.Index(mask) == i for i, mask in enumerate(Hand.TwoCardMaskTable)))
+
+        def types(query):
+            return sorted(set(Hand.PocketHand169Type(int(mask)).name[7:] for mask in PocketHands.Query(query)))
+
+        self.assertTrue(len(PocketHands.Query("AKs")) == 4 and len(PocketHands.Query("AKo")) == 12 and len(PocketHands.Query("ak")) == 16)
+        self.assertTrue(types("QQ+") == ["AA", "KK", "QQ"])
+        self.assertTrue(types("QQ-TT") == types("TT-QQ") == ["JJ", "QQ", "TT"])
+        self.assertTrue(types("T9s-65s") == ["65S", "76S", "87S", "98S", "T9S"])
+        self.assertTrue(types("A9s-A7s") == ["A7S", "A8S", "A9S"])
+        self.assertTrue(types("KTo+") == ["KJO", "KQO", "KTO"])
+        self.assertTrue(len(PocketHands.Query("AKs, QQ+, T9s-65s, A5o+")) == 4 + 18 + 20 + 108)
+        self.assertTrue(list(PocketHands.Query("As Ks")) == [Hand.ParseHand("As Ks")[0]] and len(PocketHands.Query("*")) == 1326)
+        for query in ["AKx", "AK-QQ", "AsAs", "AKs:2", "", "QQs", "AKs-KJs", "AKs+-KQs"]:
+            self.assertFalse(PocketHands.ValidateQuery(query))
+
+        # dead cards, the membership vector and weights
+        self.assertTrue(len(PocketHands.Query("AA", Hand.ParseHand("As")[0])) == 3)
+        pocketRange = PocketHands.Compile("AKs:0.5, QQ, AsKs")
+        self.assertTrue(pocketRange.Vector.sum() == 10 and pocketRange.Vector[PocketHands.Index(Hand.ParseHand("Qc Qd")[0])])
+        self.assertTrue(sorted(pocketRange.Weights.tolist()) == [0.5] * 3 + [1.0] * 7)
+        self.assertTrue(PocketHands.Compile("AKs:0.5, QQ, AsKs") is pocketRange)
+        for i in range(PocketHands.CACHE_SIZE):
+            PocketHands.Compile("AKs:" + str((i + 1) / 1000.0))
+        self.assertTrue(PocketHands.Compile("AKs:0.5, QQ, AsKs") is not pocketRange)
+        self.assertRaises(ValueError, pocketRange.Masks.__setitem__, 0, 0)
+
+        # the query entry points average over the pockets of the range
+        flop = Hand.ParseHand("Qs Ts 2c")[0]
+        result = HandAnalysis.WinOdds("AKs", "Qs Ts 2c", "", 1, StoppingRule.FixedTrials(100000), rng=1)
+        exact = np.mean([HandAnalysis.WinOdds(int(mask), flop, 0) for mask in PocketHands.Query("AKs", flop)])
+        self.assertTrue(abs(result.Value - exact) < 5 * result.StandardError)
+        self.assertTrue(0.0 < HandAnalysis.HandStrength("QQ+, AK", "Qs Ts 2c", 2, 0.05) < 1.0)
+        player, opponent = HandAnalysis.HandWinOdds("As Ks", "Qs Ts 2c", 1, StoppingRule.FixedTrials(20000), rng=3).Value
+        exactPlayer, exactOpponent = HandAnalysis.HandWinOdds(Hand.ParseHand("As Ks")[0], flop)
+        self.assertTrue(all(abs(a - b) < 0.01 for a, b in zip(player + opponent, exactPlayer + exactOpponent)))
+        player, opponent = HandAnalysis.HandWinOdds("AKs", "Qs Ts 2c", 2, 0.05, rng=1)
+        self.assertTrue(len(player) == 9 and 0.0 < sum(player) < 1.0 and 0.0 < sum(opponent) < 1.0)
+        player, opponent = HandAnalysis.DetailedOddsWithMultiplePlayers("AKs, QQ", "Qs Ts 2c", "3h", 3, 5000, rng=2)
+        self.assertTrue(len(player) == 9 and 0.0 < sum(player) < 1.0 and 0.0 < sum(opponent) < 1.0)
+        self.assertTrue(abs(HandAnalysis.WinOdds(Hand.ParseHand("Ac Ad")[0], 0, 0) - 0.852) < 0.001)
+
+    def test_RangeEquity(self):
+        flop = Hand.ParseHand("Qs Ts 2c")[0]
+        exact = HandAnalysis.RangeEquity(["AK", "QQ+, JTs"], flop)
+        self.assertTrue(exact.StandardError == (0.0, 0.0) and abs(sum(exact.Value) - 1.0) < 1e-9)
+        result = HandAnalysis.RangeEquity(["AK", "QQ+, JTs"], flop, rule=StoppingRule.FixedTrials(100000), rng=1)
+        self.assertTrue(all(abs(result.Value[i] - exact.Value[i]) < 5 * result.StandardError[i] for i in range(2)))
+
+        # card removal: the board and the hero's cards take villain pockets
+        ours = [int(mask) for mask in PocketHands.Query("AKs, 87s")]
+        theirs = [int(mask) for mask in PocketHands.Query("TT, AQo")]
+        count = 0
+        player = [0.0] * 9
+        for pocket in ours:
+            for opp in theirs:
+                if (pocket | opp) & flop != 0 or pocket & opp != 0:
+                    continue
+                for board in Hand.Hands(flop, pocket | opp, 5):
+                    ourBest, oppBest = Hand.Evaluate(pocket | board, 7), Hand.Evaluate(opp | board, 7)
+                    if ourBest >= oppBest:
+                        player[Hand.HandType(ourBest)] += 1.0 if ourBest > oppBest else 0.5
+                    count += 1
+        odds = HandAnalysis.HandWinOdds(ours, theirs, flop)
+        self.assertTrue(not odds[2] and all(abs(odds[0][i] - player[i] / count) < 1e-9 for i in range(9)))
+
+        # a few pockets are exact on any board, here every runout of two cards
+        pocket, opp, board = Hand.ParseHand("As Ks")[0], Hand.ParseHand("Qh Qd")[0], Hand.ParseHand("2c 7d")[0]
+        boards = np.array(list(Hand.Hands(board, pocket | opp, 5)), dtype=np.uint64)
+        ourBest, oppBest = Hand.EvaluateBatch(boards | np.uint64(pocket), 7), Hand.EvaluateBatch(boards | np.uint64(opp), 7)
+        odds = HandAnalysis.HandWinOdds([pocket], [opp], board)
+        self.assertTrue(not odds[2] and len(boards) == 15180)
+        self.assertTrue(abs(sum(odds[0]) - ((ourBest > oppBest).sum() + (ourBest == oppBest).sum() / 2.0) / len(boards)) < 1e-12)
+
+        # multiway is Monte Carlo, and full ranges take seconds
+        result = HandAnalysis.RangeEquity(["AA", "KK", "QQ"], 0, rng=3)
+        self.assertTrue(abs(sum(result.Value) - 1.0) < 1e-9 and result.Value[0] > 0.6)
+        self.assertTrue(abs(HandAnalysis.RangeEquity(["*", "*"], Hand.ParseHand("Qs Ts 2c 8d")[0]).Value[0] - 0.5) < 1e-9)
+        self.assertRaises(Exception, HandAnalysis.RangeEquity, ["AA", "AsAh"], Hand.ParseHand("Ac Ad 2c")[0])
+
+    def test_PreflopEquity(self):
+        if not PreflopEquity.Available():
+            self.skipTest("build the table with: python PreflopEquity.py")
+
+        for ourCards, oppCards in [("As Ks", "Qc Qh"), ("Ts 9s", "Th 9h"), ("5c 4c", "Kd Qs")]:
+            ourMask, oppMask = Hand.ParseHand(ourCards)[0], Hand.ParseHand(oppCards)[0]
+            boards = np.concatenate(list(Hand.HandsArray(0, ourMask | oppMask, 5)))
+            ourBest = Hand.EvaluateBatch(boards | np.uint64(ourMask), 7)
+            oppBest = Hand.EvaluateBatch(boards | np.uint64(oppMask), 7)
+            tally = (int((ourBest > oppBest).sum()), int((ourBest == oppBest).sum()), int((ourBest < oppBest).sum()))
+            self.assertTrue(PreflopEquity.Tally(ourCards, oppCards) == tally)
+            self.assertTrue(PreflopEquity.Tally(oppMask, ourMask) == (tally[2], tally[1], tally[0]))
+
+        # heads up preflop ranges are exact, and agree with Monte Carlo
+        exact = HandAnalysis.RangeEquity(["AK", "QQ+, JTs"])
+        result = HandAnalysis.RangeEquity(["AK", "QQ+, JTs"], rule=StoppingRule.FixedTrials(100000), rng=1)
+        self.assertTrue(exact.StandardError == (0.0, 0.0) and abs(result.Value[0] - exact.Value[0]) < 5 * result.StandardError[0])
+        self.assertTrue(abs(HandAnalysis.RangeEquity(["AA", "KK"]).Value[0] - 0.8195) < 0.0001)
+
+    def test_EquityCache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = EquityCache(os.path.join(directory, "cache.sqlite"))
+            pocket, flop = Hand.ParseHand("As Ks")[0], Hand.ParseHand("Qs Ts 2c")[0]
+            odds = cache.WinOdds(pocket, flop)
+            self.assertTrue(odds == HandAnalysis.WinOdds(pocket, flop, 0) and cache.Misses == 1)
+
+            # an isomorphic situation, or another process, hits the same entry
+            self.assertTrue(cache.WinOdds(Hand.ParseHand("Ah Kh")[0], Hand.ParseHand("Qh Th 2d")[0]) == odds and cache.Hits == 1)
+            other = EquityCache(cache.Path)
+            self.assertTrue(other.WinOdds(pocket, flop) == odds and other.Hits == 1)
+            self.assertTrue(other.HandPotential(pocket, flop) == HandAnalysis.HandPotential(pocket, flop))
+            result = other.HandStrength(pocket, flop, 2, StoppingRule.FixedTrials(1000))
+            self.assertTrue(cache.HandStrength(pocket, flop, 2, StoppingRule.FixedTrials(1000)).Value == result.Value)
+            self.assertTrue(cache.HandStrength(pocket, flop, 2, StoppingRule.FixedTrials(2000)).Trials == 2000)
+            self.assertRaises(Exception, cache.WinOdds, pocket, flop, 0, 2)
+
+            # least recently used results go first
+            small = EquityCache(os.path.join(directory, "small.sqlite"), maxEntries=2)
+            for i in range(3):
+                small.Put(("WinOdds", i, 0, 0, 1, "exact"), float(i))
+                time.sleep(0.01)
+            small.Evict()
+            self.assertTrue(small.Count() == 2 and small.Get(("WinOdds", 0, 0, 0, 1, "exact")) is None)
+
+            # results of other evaluator tables are dropped
+            cache.Close()
+            other.Close()
+            small.Close()
+            with sqlite3.connect(cache.Path) as connection:
+                connection.execute("UPDATE meta SET value = 'old' WHERE name = 'stamp'")
+            connection.close()
+            reopened = EquityCache(cache.Path)
+            self.assertTrue(reopened.Count() == 0)
+            reopened.Close()
+
+            # so are those of another flop table
+            if FlopTables.Available():
+                stamp = EquityCache.Stamp()
+                tables = FlopTables.DIRECTORY
+                try:
+                    FlopTables.DIRECTORY = directory
+                    EquityCache._EquityCache__Stamp = None
+                    self.assertTrue(EquityCache.Stamp() != stamp)
+                finally:
+                    FlopTables.DIRECTORY = tables
+                    EquityCache._EquityCache__Stamp = None
+
+    def test_AnalysisMemo(self):
+        AnalysisMemo.Clear()
+        situations = []
+        for i in range(40):
+            pocket = Hand.RandomHand(0, 0, 2, rng=i)
+            board = Hand.RandomHand(0, pocket, 3 + i % 2, rng=100 + i)
+            opponent = Hand.RandomHand(0, pocket | board, 2, rng=200 + i)
+            situations.append((pocket, board, opponent))
+
+        def results():
+            return [(HandAnalysis.HandStrength(pocket, board), HandAnalysis.HandDistance(pocket, board),
+                     HandAnalysis.OutsMask(pocket, board, [opponent]), HandAnalysis.OutsMaskDiscounted(pocket, board, [opponent]),
+                     HandAnalysis.OutsMaskEx(pocket, board, opponent), HandAnalysis.StraightDrawCount(pocket, board, opponent),
+                     HandAnalysis.FlushDrawCount(pocket | board, opponent), HandAnalysis.DrawCount(pocket, board, opponent, 4))
+                    for pocket, board, opponent in situations]
+
+        memoized = results()
+        self.assertTrue(AnalysisMemo.Misses == 8 * 40 and AnalysisMemo.Hits == 0)
+        self.assertTrue(results() == memoized and AnalysisMemo.HitRatio() == 0.5)
+        AnalysisMemo.Configure(0, 0)
+        self.assertTrue(results() == memoized)
+
+        # suit isomorphic situations share an entry, masks come back in their suits
+        AnalysisMemo.Configure()
+        AnalysisMemo.Clear()
+        pocket, board = Hand.ParseHand("As Ks")[0], Hand.ParseHand("Qs Ts 2c")[0]
+        outs = HandAnalysis.OutsMaskEx(pocket, board, 0)
+        otherOuts = HandAnalysis.OutsMaskEx(Hand.ParseHand("Ah Kh")[0], Hand.ParseHand("Qh Th 2d")[0], 0)
+        self.assertTrue(AnalysisMemo.Hits == 1 and Hand.BitCount(outs) == Hand.BitCount(otherOuts) and outs != otherOuts)
+        self.assertTrue(Hand.MaskToString(otherOuts).count("h") == Hand.MaskToString(outs).count("s"))
+
+        # both limits evict the least recently used results
+        AnalysisMemo.Configure(10)
+        results()
+        self.assertTrue(AnalysisMemo.Count() == 10 and AnalysisMemo.Evictions > 0)
+        AnalysisMemo.Configure(maxBytes=AnalysisMemo.Bytes // 2)
+        self.assertTrue(AnalysisMemo.Count() <= 5 and AnalysisMemo.Bytes <= AnalysisMemo.MaxBytes)
+        AnalysisMemo.Configure()
+        AnalysisMemo.Clear()
+        self.assertTrue(AnalysisMemo.Count() == 0 and AnalysisMemo.Stats()["bytes"] == 0)
+
+    def test_FlopTables(self):
+        if not FlopTables.Available():
+            self.skipTest("build the table with: python FlopTables.py")
+
+        situations = [(Hand.ParseHand(pocket)[0], Hand.ParseHand(board)[0]) for pocket, board in
+                      [("As Ks", "Qs Ts 2c"), ("Ah Kh", "Qh Th 2d"), ("7c 7d", "7h 2s 2c"), ("5s 4s", "Ad Kc 9h")]]
+        tabled = [(HandAnalysis.HandStrength(pocket, board), HandAnalysis.HandPotential(pocket, board))
+                  for pocket, board in situations]
+
+        # the table holds the same floats as the enumeration
+        directory = FlopTables.DIRECTORY
+        AnalysisMemo.Configure(0, 0)
+        try:
+            with tempfile.TemporaryDirectory() as empty:
+                FlopTables.DIRECTORY = empty
+                self.assertTrue(not FlopTables.Available())
+                enumerated = [(HandAnalysis.HandStrength(pocket, board), HandAnalysis.HandPotential(pocket, board))
+                              for pocket, board in situations]
+        finally:
+            FlopTables.DIRECTORY = directory
+            AnalysisMemo.Configure()
+            AnalysisMemo.Clear()
+        self.assertTrue(tabled == enumerated and tabled[0] == tabled[1])
+
+        pockets = np.array([pocket for pocket, board in situations], dtype=np.uint64)
+        flops = np.array([board for pocket, board in situations], dtype=np.uint64)
+        self.assertTrue(FlopTables.LookupBatch(pockets, flops).tolist() == [[hs, ppot, npot] for hs, (ppot, npot) in tabled])
+
+        hs, (ppot, npot) = tabled[0]
+        self.assertTrue(HandAnalysis.EffectiveHandStrength("As Ks", "Qs Ts 2c") == hs * (1.0 - npot) + (1.0 - hs) * ppot)
+
+    def test_RiverEquity(self):
+        pocket, board, dead = Hand.ParseHand("As Qd")[0], Hand.ParseHand("Qs Ts 2c 8d 5s")[0], Hand.ParseHand("3h 9s")[0]
+        self.assertTrue(RiverEquity.Odds(pocket, board, dead, 1) == HandAnalysis.WinOdds(pocket, board, dead))
+
+        # every deal of two disjoint opponent pockets
+        live = np.array([mask for mask in BoardContext.Pockets.tolist() if mask & (pocket | board | dead) == 0], dtype=np.uint64)
+        values = Hand.EvaluateBatch(live | np.uint64(board), 7)
+        first, second = np.triu_indices(len(live), 1)
+        disjoint = (live[first] & live[second]) == 0
+        best = np.maximum(values[first], values[second])[disjoint]
+        ourValue = Hand.Evaluate(pocket | board, 7)
+        tally = (int((best < ourValue).sum()), int((best == ourValue).sum()), int((best > ourValue).sum()))
+        self.assertTrue(RiverEquity.Tally(pocket, board, dead, 2) == tally)
+
+        # WinOdds counts the river exactly, and agrees with Monte Carlo
+        for n in (3, 9):
+            result = HandAnalysis.WinOdds(pocket, board, dead, n, StoppingRule.FixedTrials(1000))
+            wins, ties, losses = RiverEquity.Tally("As Qd", "Qs Ts 2c 8d 5s", "3h 9s", n)
+            self.assertTrue(result.StandardError == 0.0 and result.Trials == wins + ties + losses == RiverEquity.Deals(43, n))
+            self.assertTrue(result.Value == RiverEquity.Odds(pocket, board, dead, n))
+            sampled = HandAnalysis.WinOdds("AsQd", "Qs Ts 2c 8d 5s", "3h 9s", n, StoppingRule.FixedTrials(20000), rng=n)
+            self.assertTrue(abs(sampled.Value - result.Value) < 5 * sampled.StandardError + 1e-9)
+        self.assertRaises(Exception, RiverEquity.Tally, pocket, board, dead, RiverEquity.MAX_OPPONENTS + 1)
+
+    def test_TurnEquity(self):
+        pocket, board, dead = Hand.ParseHand("As Qd")[0], Hand.ParseHand("Qs Ts 2c 8d")[0], Hand.ParseHand("3h 9s")[0]
+        turn = TurnEquity.Get(board, dead)
+        self.assertTrue(TurnEquity.Get(board, dead) is turn and len(turn.Rivers) == 46)
+
+        # the river rankings give the same tallies as enumerating the rivers
+        tally = EnumerationPool.Run(HandAnalysis._WinOddsTally, (pocket, board, dead), board, pocket | dead, 5, 1)
+        self.assertTrue((turn.Tally(pocket) == tally).all())
+        wins, ties, losses = tally.tolist()
+        self.assertTrue(HandAnalysis.WinOdds(pocket, board, dead) == (wins + ties / 2.0) / (wins + ties + losses))
+        tally = EnumerationPool.Run(HandAnalysis._HandWinOddsTally, (pocket, board), board, pocket, 5, 1)
+        self.assertTrue((TurnEquity.Get(board).HandTypeTally(pocket) == tally).all())
+
+        # several opponents add up the exact counts of every river
+        total = [0, 0, 0]
+        for river in turn.Rivers.tolist():
+            if river & pocket == 0:
+                total = [a + b for a, b in zip(total, RiverEquity.Tally(pocket, board | river, dead, 3))]
+        self.assertTrue(turn.MultiwayTally(pocket, 3) == tuple(total))
+        self.assertRaises(Exception, turn.Tally, Hand.ParseHand("As 9s")[0])
+
     # This function evaluates all possible 7 card poker hands and tallies the
     # results. The results should come up with know values. If not there is either
     # and error in the iterator function Hands() or the EvaluateType() function.
@@ -0,0 +1,58 @@
+import random
+import numpy as np
+
+# Random number streams for the random hand and Monte Carlo APIs.
+#
+# Every random API takes an optional rng argument: a numpy.random.Generator,
+# a seed (anything np.random.default_rng accepts) or None. None keeps the
+# old behaviour of drawing from the global random module.
+#
+# Scalar loops draw one card at a time, which numpy does slowly, so they
+# draw from a random.Random seeded from the Generator. Runs of a fixed
+# number of trials are cut into blocks of BLOCK_TRIALS; block i draws from
+# its own stream, spawned as child i of the run's SeedSequence, so the
+# trials come out the same however the blocks are spread over processes.
+class HandRandom:
+    # Trials drawn from one spawned stream
+    BLOCK_TRIALS = 4096
+
+    # Returns a numpy.random.Generator for an rng argument. A Generator is
+    # returned as is, so the caller's stream advances.
+    @staticmethod
+    def Generator(rng=None):
+        return np.random.default_rng(rng)
+
+    # Returns an object with a randint method to draw cards from: the
+    # random module for None, otherwise a random.Random seeded from the
+    # Generator for rng
+    @staticmethod
+    def Source(rng=None):
+        if rng is None:
+            return random
+        return random.Random(int(HandRandom.Generator(rng).integers(0, 1 << 63)))
+
+    # Returns the SeedSequence a run spawns its block streams from. A
+    # SeedSequence is used as is, a Generator gives up one draw for it, and
+    # None takes fresh entropy from the operating system.
+    @staticmethod
+    def Seed(rng=None):
+        if isinstance(rng, np.random.SeedSequence):
+            return rng
+        if isinstance(rng, np.random.Generator):
+            return np.random.SeedSequence(rng.integers(0, 1 << 32, size=4, dtype=np.uint64).tolist())
+        return np.random.SeedSequence(rng)
+
+    # Returns child block of seed. Unlike SeedSequence.spawn it does not
+    # depend on how many children were spawned before.
+    @staticmethod
+    def BlockSeed(seed, block: int):
+        return np.random.SeedSequence(seed.entropy, spawn_key=seed.spawn_key + (block,), pool_size=seed.pool_size)
+
+    # Returns the number of trials in every block of a run of trials
+    @staticmethod
+    def Blocks(trials: int):
+        blocks = [HandRandom.BLOCK_TRIALS] * (trials // HandRandom.BLOCK_TRIALS)
+        if trials % HandRandom.BLOCK_TRIALS != 0:
+            blocks.append(trials % HandRandom.BLOCK_TRIALS)
+        return blocks
+#end HandRandom
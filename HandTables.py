@@ -0,0 +1,202 @@
+import os
+import numpy as np
+
+# Lookup tables used by Hand and HandAnalysis.
+#
+# The tables are stored as .npy files in the tables directory next to this
+# module and are memory-mapped the first time they are used, instead of
+# being compiled from list literals on every import. Run
+# "python HandTables.py" to rebuild them; every table except the
+# precalculated preflop odds is computed from its definition.
+class HandTables:
+    TABLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tables")
+
+    # name -> (dtype, builder); a builder of None marks a table that is data
+    # rather than derived, and is only ever copied from its file
+    __Specs = {}
+    __Arrays = {}
+    __Lists = {}
+
+    # Returns a table as a read-only, memory-mapped numpy array
+    # name - table name, the file name without .npy
+    @staticmethod
+    def Array(name: str):
+        array = HandTables.__Arrays.get(name)
+        if array is None:
+            path = HandTables.Path(name)
+            if not os.path.exists(path):
+                raise Exception("Table " + path + " is missing, run \"python HandTables.py\" to build it")
+            array = np.load(path, mmap_mode='r')
+            HandTables.__Arrays[name] = array
+        return array
+
+    # Returns a table as a list of Python ints (or floats, or nested lists for
+    # 2D tables). Scalar code indexes lists much faster than numpy arrays.
+    # name - table name, the file name without .npy
+    @staticmethod
+    def List(name: str):
+        table = HandTables.__Lists.get(name)
+        if table is None:
+            table = HandTables.Array(name).tolist()
+            HandTables.__Lists[name] = table
+        return table
+
+    # Returns the path of a table file
+    @staticmethod
+    def Path(name: str, directory: str = None):
+        return os.path.join(HandTables.TABLE_DIR if directory is None else directory, name + ".npy")
+
+    # Returns the names of all tables
+    @staticmethod
+    def Names():
+        return list(HandTables.__Specs.keys())
+
+    # Computes a table from its definition, or None for data tables
+    @staticmethod
+    def Compute(name: str):
+        dtype, builder = HandTables.__Specs[name]
+        if builder is None:
+            return None
+        return np.array(builder(), dtype=dtype)
+
+    # Writes every derived table to directory. Data tables are copied from
+    # the current table directory when directory is a different one.
+    @staticmethod
+    def Build(directory: str = None):
+        directory = HandTables.TABLE_DIR if directory is None else directory
+        os.makedirs(directory, exist_ok=True)
+        for name in HandTables.__Specs:
+            table = HandTables.Compute(name)
+            if table is None:
+                if os.path.abspath(directory) == os.path.abspath(HandTables.TABLE_DIR):
+                    continue
+                table = np.array(HandTables.Array(name))
+            np.save(HandTables.Path(name, directory), table)
+
+    @staticmethod
+    def _Register(name: str, dtype, builder=None):
+        HandTables.__Specs[name] = (dtype, builder)
+#end HandTables
+
+
+# A class attribute holding a table that is loaded the first time the
+# attribute is read. The loaded table then replaces the attribute, so later
+# reads cost nothing extra.
+# name - table name
+# convert - optional function applied to the list form of the table
+class LazyTable:
+    def __init__(self, name: str, convert=None):
+        self.Name = name
+        self.Convert = convert
+
+    def __set_name__(self, owner, attribute):
+        self.Attribute = attribute
+
+    def __get__(self, instance, owner):
+        table = HandTables.List(self.Name)
+        if self.Convert is not None:
+            table = self.Convert(table)
+        setattr(owner, self.Attribute, table)
+        return table
+#end LazyTable
+
+
+# Number of set bits of every 13 bit rank mask
+def _NBits():
+    return [bin(ranks).count("1") for ranks in range(8192)]
+
+# Rank of the top card of the best straight in a rank mask, the five being
+# the top of the wheel, or 0 when there is no straight
+def _Straight():
+    table = [0] * 8192
+    for ranks in range(8192):
+        for top in range(12, 2, -1):
+            run = 0x1F << (top - 4) if top >= 4 else 0x100F
+            if (ranks & run) == run:
+                table[ranks] = top
+                break
+    return table
+
+# Bits 2 and up: number of ranks. Bit 1: a straight. Bit 0: five or more
+# ranks, so a straight or flush is possible
+def _NBitsAndStr():
+    nBits = _NBits()
+    straight = _Straight()
+    return [(nBits[ranks] << 2) | (2 if straight[ranks] != 0 else 0) | (1 if nBits[ranks] >= 5 else 0)
+            for ranks in range(8192)]
+
+# Rank of the highest card in a rank mask
+def _TopCard():
+    return [max(ranks.bit_length() - 1, 0) for ranks in range(8192)]
+
+# The top five ranks of a rank mask packed 4 bits each, highest first
+def _TopFiveCards():
+    table = [0] * 8192
+    for ranks in range(8192):
+        value = 0
+        shift = 16
+        for rank in range(12, -1, -1):
+            if shift < 0:
+                break
+            if ranks & (1 << rank):
+                value |= rank << shift
+                shift -= 4
+        table[ranks] = value
+    return table
+
+# Every two card mask, highest cards first
+def _TwoCardMasks():
+    return [(1 << hi) | (1 << lo) for hi in range(51, -1, -1) for lo in range(hi - 1, -1, -1)]
+
+# Length of the longest run of ranks, aces counting low too; 0 when no two
+# ranks are adjacent
+def _ContiguousCount():
+    table = [0] * 8191
+    for ranks in range(8191):
+        for count in range(13, 1, -1):
+            run = (1 << count) - 1
+            if any((ranks & (run << offset)) == run << offset for offset in range(13 - count, -1, -1)) \
+                    or (ranks & (0x1000 | (run >> 1))) == (0x1000 | (run >> 1)):
+                table[ranks] = count
+                break
+    return table
+
+# The 1326 pockets grouped by PocketHand169 type, one row of up to 12 masks
+# per type padded with 0: the pairs from aces down, then suited and offsuit
+# for every two ranks, highest first
+def _Pocket169():
+    suits = [3, 2, 1, 0]
+    def card(rank, suit):
+        return 1 << (13 * suit + rank)
+    table = []
+    for rank in range(12, -1, -1):
+        table.append([card(rank, a) | card(rank, b) for i, a in enumerate(suits) for b in suits[i + 1:]])
+    for high in range(12, -1, -1):
+        for low in range(high - 1, -1, -1):
+            table.append([card(high, suit) | card(low, suit) for suit in suits])
+            offsuit = []
+            for i, a in enumerate(suits):
+                offsuit += [card(high, a) | card(low, b) for b in suits[i + 1:]]
+                offsuit += [card(low, a) | card(high, b) for b in suits[i + 1:]]
+            table.append(offsuit)
+    return [row + [0] * (12 - len(row)) for row in table]
+
+HandTables._Register("nBits", np.uint8, _NBits)
+HandTables._Register("nBitsAndStr", np.uint8, _NBitsAndStr)
+HandTables._Register("Straight", np.uint8, _Straight)
+HandTables._Register("TopFiveCards", np.uint32, _TopFiveCards)
+HandTables._Register("TopCard", np.uint8, _TopCard)
+HandTables._Register("TwoCardMask", np.uint64, _TwoCardMasks)
+HandTables._Register("ContiguousCount", np.uint8, _ContiguousCount)
+HandTables._Register("Pocket169", np.uint64, _Pocket169)
+
+# The preflop odds of each PocketHand169 type against a random opponent.
+# These are data, not derived.
+HandTables._Register("PreCalcPlayerOdds", np.float64)
+HandTables._Register("PreCalcOppOdds", np.float64)
+
+
+if __name__ == '__main__':
+    HandTables.Build()
+    for name in HandTables.Names():
+        print(HandTables.Path(name), os.path.getsize(HandTables.Path(name)))
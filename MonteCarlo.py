@@ -0,0 +1,173 @@
+from math import inf, sqrt
+from statistics import NormalDist
+from timeit import default_timer as timer
+from EnumerationPool import EnumerationPool
+from HandRandom import HandRandom
+
+# When a Monte Carlo analysis stops. Any combination of a trial count, a
+# duration and a target error can be given; the run stops as soon as one of
+# them is met.
+# trials - stop after exactly this many trials
+# duration - stop once this many seconds have passed, checked between
+#            batches of trials
+# error - stop once the confidence interval of every estimate is no wider
+#         than error on either side, that is z * standard error <= error
+# confidence - confidence level of the interval, 0.95 by default
+class StoppingRule:
+    def __init__(self, trials: int = None, duration: float = None, error: float = None, confidence: float = 0.95):
+        if __debug__:
+            if trials is None and duration is None and error is None:
+                raise Exception("A stopping rule needs trials, a duration or an error")
+            if trials is not None and trials < 1:
+                raise Exception("Trials must be at least 1")
+            if duration is not None and duration <= 0.0:
+                raise Exception("Duration must not be 0.0 or negative")
+            if error is not None and error <= 0.0:
+                raise Exception("Error must be positive")
+            if confidence <= 0.0 or confidence >= 1.0:
+                raise Exception("Confidence must be between 0 and 1")
+
+        self.Trials = trials
+        self.Duration = duration
+        self.Error = error
+        self.Confidence = confidence
+        self.Z = NormalDist().inv_cdf((1.0 + confidence) / 2.0)
+
+    # Stops after a fixed number of trials
+    @staticmethod
+    def FixedTrials(trials: int):
+        return StoppingRule(trials=trials)
+
+    # Stops after a number of seconds
+    @staticmethod
+    def FixedDuration(duration: float):
+        return StoppingRule(duration=duration)
+
+    # Stops when the estimates are within error of the true values with the
+    # given confidence, or at the trials or duration limit if that comes first
+    @staticmethod
+    def Precision(error: float, confidence: float = 0.95, trials: int = None, duration: float = None):
+        return StoppingRule(trials, duration, error, confidence)
+
+    def __repr__(self):
+        return "StoppingRule(trials={0}, duration={1}, error={2}, confidence={3})".format(
+            self.Trials, self.Duration, self.Error, self.Confidence)
+#end StoppingRule
+
+
+# The outcome of a Monte Carlo analysis
+# Value - the estimate, in the form the plain routine returns it
+# StandardError - standard error of the estimate; a tuple when the routine
+#                 estimates more than one value
+# Trials - number of trials run
+# Elapsed - seconds taken
+class MonteCarloResult:
+    def __init__(self, value, standardError, trials: int, elapsed: float):
+        self.Value = value
+        self.StandardError = standardError
+        self.Trials = trials
+        self.Elapsed = elapsed
+
+    def __repr__(self):
+        return "MonteCarloResult(value={0}, standardError={1}, trials={2}, elapsed={3:.3f})".format(
+            self.Value, self.StandardError, self.Trials, self.Elapsed)
+#end MonteCarloResult
+
+
+# Runs Monte Carlo samplers under a StoppingRule.
+#
+# A sampler deals a block of trials from the SeedSequence it is given and
+# returns its integer tallies; the tallies of all blocks are summed and an
+# estimator turns them into values and standard errors. The clock and the
+# error are only checked between batches of blocks. A run of a fixed number
+# of trials is split into HandRandom blocks, so it gives the same result for
+# a seed whatever the number of workers.
+class MonteCarlo:
+    # Trials of the first batch of a timed run; later batches are sized from
+    # the measured time per trial
+    FIRST_BATCH_TRIALS = 256
+
+    # Trials needed before the standard error is trusted to stop a run
+    MIN_PRECISION_TRIALS = 1000
+
+    # Runs a sampler until rule stops it
+    # sample - picklable function, sample(*args, trials, seed) returns the
+    #          np.int64 tallies of trials trials
+    # args - the arguments sample takes before trials and seed
+    # estimate - function of the summed tallies returning (value, error),
+    #            error being a standard error or a tuple of them
+    # rule - the StoppingRule
+    # rng - a numpy.random.Generator, a seed or a SeedSequence; None for a
+    #       fresh seed
+    # workers - number of processes, 1 to run in this process, None for one
+    #           per CPU
+    # returns a MonteCarloResult
+    @staticmethod
+    def Run(sample, args, estimate, rule: StoppingRule, rng=None, workers: int = 1):
+        start = timer()
+        if rule.Duration is None and rule.Error is None:
+            tally = EnumerationPool.RunTrials(sample, args, rule.Trials, rng, workers)
+            value, error = estimate(tally)
+            return MonteCarloResult(value, error, rule.Trials, timer() - start)
+
+        workers = EnumerationPool.Workers(workers)
+        seed = HandRandom.Seed(rng)
+        batch = MonteCarlo.FIRST_BATCH_TRIALS if rule.Duration is not None else HandRandom.BLOCK_TRIALS
+        tally = None
+        trials = block = 0
+        while True:
+            blocks = [batch] * workers
+            if rule.Trials is not None:
+                blocks = MonteCarlo.__Clip(blocks, rule.Trials - trials)
+            result = EnumerationPool.RunBlocks(sample, args, seed, block, blocks, workers)
+            tally = result if tally is None else tally + result
+            trials += sum(blocks)
+            block += len(blocks)
+            elapsed = timer() - start
+
+            value, error = estimate(tally)
+            if rule.Trials is not None and trials >= rule.Trials:
+                break
+            if rule.Duration is not None and elapsed >= rule.Duration:
+                break
+            if rule.Error is not None and trials >= MonteCarlo.MIN_PRECISION_TRIALS \
+                    and rule.Z * MonteCarlo.__Largest(error) <= rule.Error:
+                break
+
+            if rule.Duration is not None:
+                # aim for about a quarter of the time left per batch
+                perBlock = (rule.Duration - elapsed) * trials / elapsed / 4 / workers
+                batch = int(max(MonteCarlo.FIRST_BATCH_TRIALS, min(HandRandom.BLOCK_TRIALS, perBlock)))
+
+        return MonteCarloResult(value, error, trials, timer() - start)
+
+    # Returns the standard error of the mean of count samples, given their
+    # sum and the sum of their squares
+    @staticmethod
+    def MeanError(total: float, squares: float, count: int):
+        if count < 2:
+            return inf
+        mean = total / count
+        variance = max(0.0, (squares - count * mean * mean) / (count - 1))
+        return sqrt(variance / count)
+
+    # Returns the standard error of a win rate counting ties as half a win
+    @staticmethod
+    def WinRateError(wins: int, ties: int, count: int):
+        return MonteCarlo.MeanError(wins + ties / 2.0, wins + ties / 4.0, count)
+
+    @staticmethod
+    def __Largest(error):
+        return max(error) if isinstance(error, tuple) else error
+
+    # Shortens a list of block sizes to add up to at most trials
+    @staticmethod
+    def __Clip(blocks, trials: int):
+        clipped = []
+        for size in blocks:
+            if trials <= 0:
+                break
+            clipped.append(min(size, trials))
+            trials -= clipped[-1]
+        return clipped
+#end MonteCarlo
@@ -0,0 +1,247 @@
+import re
+import numpy as np
+from collections import OrderedDict
+from HandEvaluator import Hand
+
+# A compiled pocket query: the pocket hands it matches and their weights.
+#
+# Vector and WeightVector are indexed like Hand.TwoCardMaskTable; Masks and
+# Weights list the matching pockets in the same order. All arrays are
+# read-only, since compiled ranges are shared through the PocketHands cache.
+# Query - the query the range was compiled from, None for a list of masks
+# Vector - np.bool_ membership of each of the 1326 pockets
+# WeightVector - np.float64 weight of each pocket, 0.0 outside the range
+# Masks - np.uint64 masks of the matching pockets
+# Weights - np.float64 weights of Masks
+class PocketRange:
+    def __init__(self, query: str, weights):
+        self.Query = query
+        self.WeightVector = PocketRange.__ReadOnly(np.asarray(weights, dtype=np.float64))
+        self.Vector = PocketRange.__ReadOnly(self.WeightVector > 0.0)
+        self.Masks = PocketRange.__ReadOnly(PocketHands.TwoCardMasks()[self.Vector])
+        self.Weights = PocketRange.__ReadOnly(self.WeightVector[self.Vector])
+
+    def __len__(self):
+        return len(self.Masks)
+
+    def __repr__(self):
+        return "PocketRange(" + repr(self.Query) + ", " + str(len(self)) + " pockets)"
+
+    # Returns (masks, weights) of the pockets that share no card with dead
+    def Live(self, dead: int = 0):
+        if dead == 0:
+            return self.Masks, self.Weights
+        live = (self.Masks & np.uint64(dead)) == 0
+        return self.Masks[live], self.Weights[live]
+
+    @staticmethod
+    def __ReadOnly(array):
+        array.flags.writeable = False
+        return array
+#end PocketRange
+
+
+# Pocket query language, after PocketHands in Keith Rule's C# evaluator.
+#
+# A query is a comma separated list of terms, each optionally weighted with
+# ":weight" (0 < weight <= 1, the last weight given for a pocket wins):
+#   AsKs, As Ks     one pocket
+#   QQ, AKs, AKo    a PocketHand169 class; AK is both AKs and AKo
+#   QQ+, A5o+       the pair and every higher pair; the kicker up to one
+#                   below the top card
+#   QQ-88, A9s-A5s  every pair, or every kicker, from one end to the other
+#   T9s-65s         the hands with the same gap between the two ends
+#   *               every pocket
+# Ranks are 2-9, T, J, Q, K and A, suits c, d, h and s, in either case.
+#
+# The CACHE_SIZE most recently compiled ranges are cached by query, so
+# compiling the same query again, as a hot loop does, is a dictionary lookup.
+class PocketHands:
+    RANKS = "23456789TJQKA"
+    SUITS = "cdhs"
+
+    # Number of compiled ranges Compile keeps
+    CACHE_SIZE = 256
+    __Cache = OrderedDict()
+    __TwoCardMasks = None
+
+    __CardPattern = re.compile(r"^([2-9TJQKA])([CDHS])\s*([2-9TJQKA])([CDHS])$")
+    __ClassPattern = re.compile(r"^([2-9TJQKA])([2-9TJQKA])([SO]?)(\+?)$")
+
+    # Returns the compiled PocketRange of a query
+    # query - pocket query string, see above
+    @staticmethod
+    def Compile(query: str):
+        cache = PocketHands.__Cache
+        pocketRange = cache.get(query)
+        if pocketRange is None:
+            pocketRange = PocketRange(query, PocketHands.__Weights(query))
+            cache[query] = pocketRange
+            while len(cache) > PocketHands.CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(query)
+        return pocketRange
+
+    # Returns the np.uint64 masks of the pockets a query matches that share
+    # no card with dead
+    # query - pocket query string
+    # dead - dead cards mask
+    @staticmethod
+    def Query(query: str, dead: int = 0):
+        return PocketHands.Compile(query).Live(int(dead))[0]
+
+    # Returns a PocketRange for a pocket query, a PocketRange, or a list of
+    # pocket masks, each weighted 1
+    @staticmethod
+    def Range(pockets):
+        if isinstance(pockets, PocketRange):
+            return pockets
+        if isinstance(pockets, str):
+            return PocketHands.Compile(pockets)
+        weights = np.zeros(Hand.TwoCardMaskTableSize, dtype=np.float64)
+        for mask in pockets:
+            if __debug__:
+                if Hand.BitCount(int(mask)) != 2:
+                    raise Exception(str(mask) + " is invalid. Expecting two cards only.")
+            weights[PocketHands.Index(mask)] = 1.0
+        return PocketRange(None, weights)
+
+    # Returns True when query is a valid pocket query matching some pocket
+    @staticmethod
+    def ValidateQuery(query: str):
+        try:
+            return len(PocketHands.Compile(query)) > 0
+        except Exception:
+            return False
+
+    # Returns the 1326 entry np.bool_ membership vector of a query, indexed
+    # like Hand.TwoCardMaskTable
+    @staticmethod
+    def Vector(query: str):
+        return PocketHands.Compile(query).Vector
+
+    # Empties the cache of compiled queries
+    @staticmethod
+    def ClearCache():
+        PocketHands.__Cache.clear()
+
+    # Returns Hand.TwoCardMaskTable as a read-only np.uint64 array
+    @staticmethod
+    def TwoCardMasks():
+        if PocketHands.__TwoCardMasks is None:
+            masks = np.array(Hand.TwoCardMaskTable, dtype=np.uint64)
+            masks.flags.writeable = False
+            PocketHands.__TwoCardMasks = masks
+        return PocketHands.__TwoCardMasks
+
+    # Returns the index of a pocket mask in Hand.TwoCardMaskTable, which
+    # lists the pockets by high card, then low card, both descending
+    @staticmethod
+    def Index(mask: int):
+        mask = int(mask)
+        low = (mask & -mask).bit_length() - 1
+        high = mask.bit_length() - 1
+        return Hand.TwoCardMaskTableSize - high * (high + 1) // 2 + high - 1 - low
+
+    # Returns the weights of the pockets of a query by TwoCardMaskTable
+    # index
+    @staticmethod
+    def __Weights(query: str):
+        weights = np.zeros(Hand.TwoCardMaskTableSize, dtype=np.float64)
+        for term in query.split(","):
+            term, weight = PocketHands.__SplitWeight(term.strip(), query)
+            for mask in PocketHands.__TermMasks(term, query):
+                weights[PocketHands.Index(mask)] = weight
+        return weights
+
+    @staticmethod
+    def __SplitWeight(term: str, query: str):
+        if ":" not in term:
+            return term, 1.0
+        term, weight = term.split(":", 1)
+        try:
+            weight = float(weight)
+        except ValueError:
+            raise Exception("Invalid weight in pocket query " + query)
+        if weight <= 0.0 or weight > 1.0:
+            raise Exception("Pocket query weights must be greater than 0 and at most 1: " + query)
+        return term.strip(), weight
+
+    # Returns the pocket masks of one term
+    @staticmethod
+    def __TermMasks(term: str, query: str):
+        if term == "*":
+            return Hand.TwoCardMaskTable
+
+        term = term.upper()
+        match = PocketHands.__CardPattern.match(term)
+        if match:
+            first = PocketHands.__Card(match.group(1), match.group(2))
+            second = PocketHands.__Card(match.group(3), match.group(4))
+            if first == second:
+                raise Exception("Duplicate card in pocket query " + query)
+            return [first | second]
+
+        ends = term.split("-")
+        if len(ends) == 1:
+            high, low, kind, plus = PocketHands.__Class(ends[0], query)
+            if not plus:
+                return PocketHands.__ClassMasks(high, low, kind)
+            if high == low:
+                return PocketHands.__Classes([(rank, rank) for rank in range(low, 13)], kind)
+            return PocketHands.__Classes([(high, kicker) for kicker in range(low, high)], kind)
+
+        if len(ends) != 2:
+            raise Exception("Invalid pocket query " + query)
+        high1, low1, kind1, plus1 = PocketHands.__Class(ends[0], query)
+        high2, low2, kind2, plus2 = PocketHands.__Class(ends[1], query)
+        if plus1 or plus2 or kind1 != kind2:
+            raise Exception("Invalid pocket query range " + term)
+        if high1 == low1 and high2 == low2:
+            return PocketHands.__Classes([(rank, rank) for rank in range(min(low1, low2), max(low1, low2) + 1)], kind1)
+        if high1 == high2 and low1 != high1 and low2 != high2:
+            return PocketHands.__Classes([(high1, kicker) for kicker in range(min(low1, low2), max(low1, low2) + 1)], kind1)
+        if high1 - low1 == high2 - low2 and low1 != high1:
+            step = min(high1, high2) - min(low1, low2)
+            return PocketHands.__Classes([(low + step, low) for low in range(min(low1, low2), max(low1, low2) + 1)], kind1)
+        raise Exception("Invalid pocket query range " + term)
+
+    # Parses a PocketHand169 class term such as AKs or QQ+. Returns
+    # (high rank, low rank, "S", "O" or "", whether it ends with a +).
+    @staticmethod
+    def __Class(term: str, query: str):
+        match = PocketHands.__ClassPattern.match(term)
+        if not match:
+            raise Exception("Invalid pocket query " + query)
+        first = PocketHands.RANKS.index(match.group(1))
+        second = PocketHands.RANKS.index(match.group(2))
+        high, low = max(first, second), min(first, second)
+        if high == low and match.group(3) != "":
+            raise Exception("A pair can not be suited or offsuit: " + term)
+        return high, low, match.group(3), match.group(4) == "+"
+
+    @staticmethod
+    def __Classes(ranks, kind: str):
+        masks = []
+        for high, low in ranks:
+            masks += PocketHands.__ClassMasks(high, low, kind)
+        return masks
+
+    # Returns the masks of a PocketHand169 class, both classes when kind is
+    # "" for two different ranks
+    @staticmethod
+    def __ClassMasks(high: int, low: int, kind: str):
+        name = "POCKET_" + PocketHands.RANKS[high] + PocketHands.RANKS[low]
+        if high == low:
+            return Hand.Pocket169Table[Hand.PocketHand169[name].value]
+        masks = []
+        for suffix in ("S", "O"):
+            if kind == "" or kind == suffix:
+                masks += Hand.Pocket169Table[Hand.PocketHand169[name + suffix].value]
+        return masks
+
+    @staticmethod
+    def __Card(rank: str, suit: str):
+        return 1 << (13 * PocketHands.SUITS.index(suit.lower()) + PocketHands.RANKS.index(rank))
+#end PocketHands
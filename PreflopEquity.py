@@ -0,0 +1,194 @@
+import os
+import sys
+import numpy as np
+from math import comb
+from itertools import permutations
+from multipledispatch import dispatch
+from HandEvaluator import Hand, FastHand, MaskType
+from BoardContext import BoardContext
+from EnumerationPool import EnumerationPool
+from SuitIsomorphism import SuitIsomorphism, HandIndexer
+
+# Exact heads up preflop equity of every pocket against every other pocket.
+#
+# Two pockets see C(48, 5) = 1,712,304 boards, too many to enumerate per
+# query. The generator walks the 134,459 suit isomorphic classes of 5 card
+# boards once instead, evaluates all 1326 pockets on each with
+# BoardContext.EvaluateAllPockets and counts, for every pair of pockets, the
+# boards the first one wins, weighted by the size of the board's class. The
+# counts are then folded into the 93,769 suit isomorphic classes of a pair
+# of pockets (the pocket and board rounds of SuitIsomorphism, with the
+# opponent's pocket as the board), whose pairs all have the same wins and
+# ties.
+#
+# The table keeps the wins and ties of every pair class, and a 1326 x 1326
+# matrix gives the class of every pair of pockets, -1 where they share a
+# card. Both are .npy files next to this module, memory-mapped on first use.
+# Build them once, on every CPU, with "python PreflopEquity.py [directory]".
+class PreflopEquity:
+    DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+    TABLE_NAME = "PreflopEquity"
+    CLASS_NAME = "PreflopEquityClass"
+
+    # Boards two pockets see
+    BOARDS = comb(48, 5)
+
+    __Table = None
+    __Classes = None
+
+    # The 24 relabelings of the suits, as the new suit of every suit
+    __Permutations = list(permutations(range(4)))
+
+    # Returns the path of the table or class matrix file
+    @staticmethod
+    def Path(name: str, directory: str = None):
+        return os.path.join(PreflopEquity.DIRECTORY if directory is None else directory, name + ".npy")
+
+    # Returns True when both files are built
+    @staticmethod
+    def Available():
+        return os.path.exists(PreflopEquity.Path(PreflopEquity.TABLE_NAME)) and \
+            os.path.exists(PreflopEquity.Path(PreflopEquity.CLASS_NAME))
+
+    # Maps the table and the class matrix into memory. Called on first use.
+    @staticmethod
+    def Load():
+        if not PreflopEquity.Available():
+            raise Exception("Preflop equity table " + PreflopEquity.Path(PreflopEquity.TABLE_NAME) +
+                            " is missing, build it with: python PreflopEquity.py")
+        PreflopEquity.__Table = np.load(PreflopEquity.Path(PreflopEquity.TABLE_NAME), mmap_mode='r')
+        PreflopEquity.__Classes = np.load(PreflopEquity.Path(PreflopEquity.CLASS_NAME), mmap_mode='r')
+
+    # Returns (wins, ties, losses) of ourCards against oppCards over all the
+    # boards they see
+    # ourCards - two card pocket mask
+    # oppCards - the opponent's two card pocket mask
+    @staticmethod
+    @dispatch(MaskType, MaskType)
+    def Tally(ourCards: int, oppCards: int):
+        if PreflopEquity.__Table is None:
+            PreflopEquity.Load()
+        if __debug__:
+            if Hand.BitCount(int(ourCards)) != 2 or Hand.BitCount(int(oppCards)) != 2:
+                raise Exception("Pockets must have exactly two cards")
+            if (int(ourCards) & int(oppCards)) != 0:
+                raise Exception("Pockets must not share a card")
+
+        pairClass = PreflopEquity.__Classes[BoardContext.PocketIndex(ourCards), BoardContext.PocketIndex(oppCards)]
+        wins, ties = PreflopEquity.__Table[pairClass].tolist()
+        return (wins, ties, PreflopEquity.BOARDS - wins - ties)
+
+    # Returns (wins, ties, losses) of two pockets given in ASCII
+    @staticmethod
+    @dispatch(str, str)
+    def Tally(ourCards: str, oppCards: str):
+        return PreflopEquity.Tally(Hand.ParseHand(ourCards)[0], Hand.ParseHand(oppCards)[0])
+
+    # Returns the equity of ourCards against oppCards, ties counting half
+    @staticmethod
+    @dispatch(MaskType, MaskType)
+    def Equity(ourCards: int, oppCards: int):
+        wins, ties, losses = PreflopEquity.Tally(ourCards, oppCards)
+        return (wins + ties / 2.0) / PreflopEquity.BOARDS
+
+    @staticmethod
+    @dispatch(str, str)
+    def Equity(ourCards: str, oppCards: str):
+        return PreflopEquity.Equity(Hand.ParseHand(ourCards)[0], Hand.ParseHand(oppCards)[0])
+
+    # Returns the wins and ties of every pocket of ourMasks against every
+    # pocket of oppMasks, as two len(ourMasks) x len(oppMasks) np.int64
+    # arrays, and a np.bool_ array that is False where the pockets share a
+    # card (their wins and ties are then meaningless)
+    @staticmethod
+    def Tallies(ourMasks, oppMasks):
+        if PreflopEquity.__Table is None:
+            PreflopEquity.Load()
+        classes = PreflopEquity.__Classes[np.ix_(PreflopEquity.__PocketIndices(ourMasks), PreflopEquity.__PocketIndices(oppMasks))]
+        valid = classes >= 0
+        tallies = PreflopEquity.__Table[np.where(valid, classes, 0)].astype(np.int64)
+        return tallies[:, :, 0], tallies[:, :, 1], valid
+
+    @staticmethod
+    def __PocketIndices(masks):
+        return np.array([BoardContext.PocketIndex(mask) for mask in np.asarray(masks, dtype=np.uint64).tolist()], dtype=np.intp)
+
+    # Computes the table and the class matrix and writes them to directory
+    # directory - where to write the files, this module's directory for None
+    # workers - number of processes, None for one per CPU
+    @staticmethod
+    def Build(directory: str = None, workers: int = None):
+        wins = EnumerationPool.Run(PreflopEquity._BuildTally, (), 0, 0, 5, workers)
+        classes = PreflopEquity.__PairClasses()
+        valid = classes >= 0
+        sizes = np.bincount(classes[valid])
+
+        # every pair of a class wins the same number of boards
+        classWins = np.bincount(classes[valid], weights=wins[valid]) / sizes
+        if __debug__:
+            if (classWins != np.rint(classWins)).any():
+                raise Exception("Pairs of one class won different numbers of boards")
+        pairWins = np.where(valid, classWins[np.where(valid, classes, 0)], 0.0)
+        pairTies = PreflopEquity.BOARDS - pairWins - pairWins.T
+        classTies = np.bincount(classes[valid], weights=pairTies[valid]) / sizes
+
+        table = np.stack([classWins, classTies], axis=1).astype(np.uint32)
+        np.save(PreflopEquity.Path(PreflopEquity.TABLE_NAME, directory), table)
+        np.save(PreflopEquity.Path(PreflopEquity.CLASS_NAME, directory), classes)
+        PreflopEquity.__Table = None
+        PreflopEquity.__Classes = None
+
+    # Returns the np.int32 pair class of every two pockets indexed like
+    # BoardContext.Pockets, -1 where they share a card
+    @staticmethod
+    def __PairClasses():
+        pockets = BoardContext.Pockets
+        ourCards = np.repeat(pockets, len(pockets))
+        oppCards = np.tile(pockets, len(pockets))
+        valid = (ourCards & oppCards) == 0
+        classes = np.full(len(ourCards), -1, dtype=np.int32)
+        classes[valid] = SuitIsomorphism.IndexBatch(ourCards[valid], oppCards[valid])
+        return classes.reshape(len(pockets), len(pockets))
+
+    # Counts the wins of every pocket against every other pocket on the
+    # canonical boards among boards start to stop of Hands(0, 0, 5), each
+    # counted as many times as its class has boards. Returns a 1326 x 1326
+    # np.int64 array indexed like BoardContext.Pockets, the winner first.
+    @staticmethod
+    def _BuildTally(start: int, stop: int):
+        boards = np.fromiter(FastHand.Hands(0, 0, 5, start, stop), dtype=np.uint64, count=stop - start)
+        boards = boards[HandIndexer.CanonicalBatch([boards])[0] == boards]
+        sizes = 24 // PreflopEquity.__Symmetries(boards)
+
+        # one count per class size, so a board costs a single addition
+        counts = {}
+        for board, size in zip(boards.tolist(), sizes.tolist()):
+            values = BoardContext(board).EvaluateAllPockets()
+            # pockets on the board have value 0, so they never win, and
+            # never lose either once they are the largest value
+            losers = np.where(values == 0, np.uint32(0xFFFFFFFF), values)
+            if size not in counts:
+                counts[size] = np.zeros((len(values), len(values)), dtype=np.int32)
+            np.add(counts[size], values[:, None] > losers[None, :], out=counts[size], casting='unsafe')
+
+        wins = np.zeros((len(BoardContext.Pockets), len(BoardContext.Pockets)), dtype=np.int64)
+        for size, count in counts.items():
+            wins += size * count.astype(np.int64)
+        return wins
+
+    # Returns the number of suit relabelings that leave every board as it is
+    @staticmethod
+    def __Symmetries(boards):
+        suits = [(boards >> np.uint64(13 * suit)) & np.uint64(0x1FFF) for suit in range(4)]
+        symmetries = np.zeros(len(boards), dtype=np.int64)
+        for permutation in PreflopEquity.__Permutations:
+            relabeled = np.zeros(len(boards), dtype=np.uint64)
+            for suit in range(4):
+                relabeled |= suits[suit] << np.uint64(13 * permutation[suit])
+            symmetries += relabeled == boards
+        return symmetries
+#end PreflopEquity
+
+
+if __name__ == '__main__':
+    PreflopEquity.Build(sys.argv[1] if len(sys.argv) > 1 else None)
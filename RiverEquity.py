@@ -0,0 +1,270 @@
+from math import comb
+from multipledispatch import dispatch
+from HandEvaluator import Hand, FastHand, MaskType
+from BoardContext import BoardContext
+
+# Exact odds of a pocket against several random opponents on a complete
+# board.
+#
+# The opponents hold a uniformly random set of n disjoint pockets out of the
+# m live cards, one of Deals(m, n) = C(m, 2n) (2n - 1)!! sets. We win when
+# none of them holds a pocket of B, the pockets that beat or tie ours, so by
+# inclusion-exclusion over the sets of k disjoint pockets of B, B_k of them,
+# the deals we win number
+#   sum over k of (-1)^k B_k Deals(m - 2k, n - k)
+# and the deals we win or tie number the same with B the pockets that beat
+# ours. No card removal between the opponents is approximated away.
+#
+# B_k counts the k edge matchings of a graph on the live cards. Cards of one
+# rank, the flush suit's card aside, make pockets of the same values, so the
+# graph is a graph of at most 26 classes of cards, each a clique or an
+# independent set, and classes with the same neighbours are merged. The
+# matchings of a disconnected graph are those of its components, those of a
+# graph whose complement is disconnected follow from the parts it joins, and
+# otherwise one card is either left out or matched to each of its
+# neighbours. Rivers take milliseconds; boards with a flush draw and several
+# ways to beat a middling hand take longer.
+class RiverEquity:
+    # Most opponents counted exactly
+    MAX_OPPONENTS = 9
+
+    # Returns the exact (wins, ties, losses) of pocket against
+    # numberOfOpponents random opponents, in Deals of the opponent pockets.
+    # A tie is a deal where the best opponent ties us.
+    # pocket - two card pocket mask
+    # board - five card board mask
+    # dead - cards no opponent holds
+    # numberOfOpponents - 1 to MAX_OPPONENTS
+    @staticmethod
+    @dispatch(MaskType, MaskType, MaskType, int)
+    def Tally(pocket: int, board: int, dead: int, numberOfOpponents: int):
+        pocket = int(pocket)
+        board = int(board)
+        dead = int(dead)
+        cards = 52 - Hand.BitCount(pocket | board | dead)
+        if __debug__:
+            if Hand.BitCount(pocket) != 2:
+                raise Exception("Pocket must contain exactly two cards")
+            if Hand.BitCount(board) != 5:
+                raise Exception("Board must contain exactly five cards")
+            if (pocket & board) != 0:
+                raise Exception("Pocket and board must not share a card")
+            if numberOfOpponents < 1 or numberOfOpponents > RiverEquity.MAX_OPPONENTS:
+                raise Exception("numberOfOpponents must be 1-" + str(RiverEquity.MAX_OPPONENTS))
+            if 2 * numberOfOpponents > cards:
+                raise Exception("Not enough live cards for " + str(numberOfOpponents) + " opponents")
+
+        values = BoardContext(board, dead & ~board).EvaluateAllPockets()
+        return RiverEquity.TallyValues(values, FastHand.Evaluate(pocket | board, 7), board, pocket | board | dead, numberOfOpponents)
+
+    # Tally from the values of the opponent pockets, for callers that have
+    # them already
+    # values - value of every pocket on the board, indexed like
+    #          BoardContext.Pockets; only live pockets are read
+    # ourValue - value of our pocket on the board
+    # board - five card board mask
+    # used - our pocket, the board and the dead cards
+    @staticmethod
+    def TallyValues(values, ourValue: int, board: int, used: int, numberOfOpponents: int):
+        cards = 52 - Hand.BitCount(used)
+        classes = RiverEquity.__Classes(board, used)
+        notLost = RiverEquity.__NotBeaten(values, classes, lambda value: value >= ourValue, numberOfOpponents, cards)
+        notWon = RiverEquity.__NotBeaten(values, classes, lambda value: value > ourValue, numberOfOpponents, cards)
+        return (notLost, notWon - notLost, RiverEquity.Deals(cards, numberOfOpponents) - notWon)
+
+    # Returns the exact (wins, ties, losses) of cards given in ASCII
+    @staticmethod
+    @dispatch(str, str, str, int)
+    def Tally(pocket: str, board: str, dead: str, numberOfOpponents: int):
+        deadMask = Hand.ParseHand(dead)[0] if dead.strip() != "" else 0
+        return RiverEquity.Tally(Hand.ParseHand(pocket)[0], Hand.ParseHand(board)[0], deadMask, numberOfOpponents)
+
+    # Returns the exact odds of pocket against numberOfOpponents random
+    # opponents, ties counting half as in HandAnalysis.WinOdds
+    @staticmethod
+    @dispatch(MaskType, MaskType, MaskType, int)
+    def Odds(pocket: int, board: int, dead: int, numberOfOpponents: int):
+        wins, ties, losses = RiverEquity.Tally(pocket, board, dead, numberOfOpponents)
+        return (wins + ties / 2.0) / (wins + ties + losses)
+
+    @staticmethod
+    @dispatch(str, str, str, int)
+    def Odds(pocket: str, board: str, dead: str, numberOfOpponents: int):
+        wins, ties, losses = RiverEquity.Tally(pocket, board, dead, numberOfOpponents)
+        return (wins + ties / 2.0) / (wins + ties + losses)
+
+    # Returns the number of sets of n disjoint pockets out of m cards
+    @staticmethod
+    def Deals(m: int, n: int):
+        deals = comb(m, 2 * n)
+        for i in range(2 * n - 1, 1, -2):
+            deals *= i
+        return deals
+
+    # Returns the live cards grouped into classes no pocket value tells
+    # apart: the cards of every rank, the flush suit's card of a rank in a
+    # class of its own
+    @staticmethod
+    def __Classes(board: int, used: int):
+        flushSuit = -1
+        for suit in range(4):
+            if Hand.BitCount((board >> (13 * suit)) & 0x1FFF) >= 3:
+                flushSuit = suit
+        classes = {}
+        for card in range(52):
+            if (used >> card) & 1 == 0:
+                suit = card // 13
+                classes.setdefault((card % 13, suit if suit == flushSuit else -1), []).append(card)
+        return list(classes.values())
+
+    # Returns the deals of numberOfOpponents pockets out of cards live cards
+    # with no pocket whose value is beaten, beaten being a function of the
+    # value
+    @staticmethod
+    def __NotBeaten(values, classes, beaten, numberOfOpponents: int, cards: int):
+        size = len(classes)
+        relation = [[False] * size for i in range(size)]
+        for i in range(size):
+            for j in range(i, size):
+                if i == j and len(classes[i]) < 2:
+                    continue
+                first = classes[i][0]
+                second = classes[j][1] if i == j else classes[j][0]
+                value = int(values[BoardContext.PocketIndex((1 << first) | (1 << second))])
+                relation[i][j] = relation[j][i] = beaten(value)
+
+        # merge the classes with the same neighbours, themselves included
+        merged = {}
+        for i in range(size):
+            merged.setdefault(tuple(relation[i]), []).append(i)
+        groups = list(merged.values())
+        neighbours = [sum(1 << j for j in range(len(groups)) if relation[a[0]][groups[j][0]]) for a in groups]
+        counts = tuple(sum(len(classes[i]) for i in group) for group in groups)
+
+        matchings = RiverEquity.__Matchings(neighbours, counts, numberOfOpponents, {})
+        return sum((-1) ** k * matchings[k] * RiverEquity.Deals(cards - 2 * k, numberOfOpponents - k)
+                   for k in range(len(matchings)))
+
+    # Returns [B_0, B_1, ...], the number of k edge matchings for k up to
+    # degree, of the graph of counts[i] cards of class i. Bit j of
+    # neighbours[i] is set when the cards of classes i and j are adjacent; a
+    # class adjacent to itself is a clique.
+    @staticmethod
+    def __Matchings(neighbours, counts, degree: int, memo):
+        result = memo.get(counts)
+        if result is not None:
+            return result
+
+        nodes = 0
+        for i in range(len(counts)):
+            if counts[i] != 0:
+                nodes |= 1 << i
+        if nodes & (nodes - 1) == 0:
+            i = nodes.bit_length() - 1
+            result = RiverEquity.__Clique(counts[i], degree) if nodes != 0 and (neighbours[i] >> i) & 1 else [1]
+        else:
+            parts = RiverEquity.__Components(nodes, neighbours)
+            if len(parts) > 1:
+                result = [1]
+                for part in parts:
+                    matchings = RiverEquity.__Matchings(neighbours, RiverEquity.__Restrict(counts, part), degree, memo)
+                    result = RiverEquity.__Product(result, matchings, degree)
+            else:
+                parts = RiverEquity.__Components(nodes, [~mask for mask in neighbours])
+                if len(parts) > 1:
+                    result = [1]
+                    joined = 0
+                    for part in parts:
+                        partCounts = RiverEquity.__Restrict(counts, part)
+                        matchings = RiverEquity.__Matchings(neighbours, partCounts, degree, memo)
+                        result = RiverEquity.__Join(result, joined, matchings, sum(partCounts), degree)
+                        joined += sum(partCounts)
+                else:
+                    result = RiverEquity.__Branch(neighbours, counts, nodes, degree, memo)
+
+        memo[counts] = result
+        return result
+
+    # Leaves a card of the class with the fewest neighbouring classes out,
+    # or matches it to each of its neighbours
+    @staticmethod
+    def __Branch(neighbours, counts, nodes: int, degree: int, memo):
+        card = min(RiverEquity.__Bits(nodes), key=lambda i: bin(neighbours[i] & nodes).count("1"))
+        rest = list(counts)
+        rest[card] -= 1
+        result = list(RiverEquity.__Matchings(neighbours, tuple(rest), degree, memo))
+        for other in RiverEquity.__Bits(neighbours[card] & nodes):
+            if rest[other] != 0:
+                matched = list(rest)
+                matched[other] -= 1
+                matchings = RiverEquity.__Matchings(neighbours, tuple(matched), degree, memo)
+                for k in range(min(len(matchings), degree)):
+                    if k + 1 == len(result):
+                        result.append(0)
+                    result[k + 1] += rest[other] * matchings[k]
+        return result
+
+    # Returns the matchings of a clique of size cards
+    @staticmethod
+    def __Clique(size: int, degree: int):
+        return [RiverEquity.Deals(size, k) for k in range(min(degree, size // 2) + 1)]
+
+    # Returns the matchings of two disjoint graphs together
+    @staticmethod
+    def __Product(first, second, degree: int):
+        result = [0] * min(len(first) + len(second) - 1, degree + 1)
+        for i in range(len(first)):
+            for j in range(min(len(second), degree + 1 - i)):
+                result[i + j] += first[i] * second[j]
+        return result
+
+    # Returns the matchings of two graphs of firstSize and secondSize cards
+    # with every card of one adjacent to every card of the other: i and j
+    # edges inside them and l edges across
+    @staticmethod
+    def __Join(first, firstSize: int, second, secondSize: int, degree: int):
+        result = [0] * (degree + 1)
+        for i in range(len(first)):
+            for j in range(min(len(second), degree + 1 - i)):
+                firstLeft = firstSize - 2 * i
+                secondLeft = secondSize - 2 * j
+                across = 1
+                for l in range(min(firstLeft, secondLeft, degree - i - j) + 1):
+                    if l > 0:
+                        across = across * (firstLeft - l + 1) * (secondLeft - l + 1) // l
+                    result[i + j + l] += first[i] * second[j] * across
+        while len(result) > 1 and result[-1] == 0:
+            result.pop()
+        return result
+
+    # Returns counts with the classes outside the part mask zeroed
+    @staticmethod
+    def __Restrict(counts, part: int):
+        return tuple(counts[i] if (part >> i) & 1 else 0 for i in range(len(counts)))
+
+    # Returns the connected components of the nodes mask, as masks, bit j of
+    # adjacent[i] being set when i and j are adjacent
+    @staticmethod
+    def __Components(nodes: int, adjacent):
+        components = []
+        while nodes != 0:
+            component = nodes & -nodes
+            frontier = component
+            while frontier != 0:
+                node = frontier.bit_length() - 1
+                frontier ^= 1 << node
+                reached = adjacent[node] & nodes & ~component
+                component |= reached
+                frontier |= reached
+            components.append(component)
+            nodes &= ~component
+        return components
+
+    @staticmethod
+    def __Bits(mask: int):
+        bits = []
+        while mask != 0:
+            bits.append(mask.bit_length() - 1)
+            mask &= ~(1 << bits[-1])
+        return bits
+#end RiverEquity
@@ -0,0 +1,386 @@
+import numpy as np
+from math import comb
+from itertools import combinations_with_replacement, product
+from HandEvaluator import Hand
+
+# Suit isomorphism.
+#
+# Two situations that differ only by a relabeling of the suits play the same:
+# AsKs on Qs Ts 2c is AhKh on Qh Th 2d. This module maps a pocket mask, a
+# board mask and an optional dead mask to a canonical suit-permuted form and
+# to a dense index, so that isomorphic situations share one cache entry.
+#
+# The indexing follows Waugh, "A Fast and Optimal Hand Isomorphism
+# Algorithm". The cards are dealt in rounds (pocket, board, dead). Each suit
+# gets an index for the ranks it holds in every round, computed from the
+# suit's 13 bit rank masks (the Hand.CardMask split), and a size tuple, the
+# number of cards it holds in every round. Suits with the same size tuple
+# can be swapped, so their indices are combined as a multiset; the groups of
+# suits are then combined in order of size tuple and the result is offset by
+# the position of the suit configuration (the sorted size tuples).
+
+
+# Colex index of every 13 bit rank mask: C(b1, 1) + C(b2, 2) + ... for the
+# set bits b1 < b2 < ...
+def _BuildRankColex():
+    table = [0] * 8192
+    for ranks in range(8192):
+        index = 0
+        i = 1
+        for bit in range(13):
+            if ranks & (1 << bit):
+                index += comb(bit, i)
+                i += 1
+        table[ranks] = index
+    return table
+
+
+# Dense isomorphism index for one deal, given as the number of cards in
+# each round. Use SuitIsomorphism rather than this class directly.
+class HandIndexer:
+    # Size tuples are packed into an int with 4 bits per round
+    __CODE_BITS = 4
+
+    RankColex = _BuildRankColex()
+    __RankColexArray = np.array(RankColex, dtype=np.int64)
+
+    # comb(13 - used, n), the number of ways to pick n of the unused ranks
+    __RankCombArray = np.array([[comb(13 - used, n) for n in range(14)] for used in range(14)], dtype=np.int64)
+
+    # index of the highest set bit of every 13 bit rank mask
+    __TopBitArray = np.array([max(ranks.bit_length() - 1, 0) for ranks in range(8192)], dtype=np.int64)
+
+    # rounds - number of cards in each round, e.g. (2, 3) for pocket and flop
+    def __init__(self, rounds: tuple):
+        if __debug__:
+            if len(rounds) < 1 or len(rounds) > 3 or sum(rounds) > 52:
+                raise Exception("Invalid rounds")
+
+        self.Rounds = tuple(rounds)
+        codeBits = HandIndexer.__CODE_BITS
+
+        # every way one suit can hold cards in the rounds, and the number of
+        # rank sets it can hold that way
+        sizeTuples = [t for t in product(*[range(min(n, 13) + 1) for n in rounds]) if sum(t) <= 13]
+        self.__SuitSize = {}
+        for t in sizeTuples:
+            size = 1
+            used = 0
+            for n in t:
+                size *= comb(13 - used, n)
+                used += n
+            self.__SuitSize[HandIndexer.Code(t)] = size
+
+        # every configuration: four size tuples in descending order whose
+        # cards add up to the cards of each round
+        configurations = []
+        for suits in combinations_with_replacement(sorted(sizeTuples, reverse=True), 4):
+            if all(sum(t[j] for t in suits) == rounds[j] for j in range(len(rounds))):
+                codes = [HandIndexer.Code(t) for t in suits]
+                configurations.append(self.__ConfigurationKey(codes))
+        configurations.sort()
+
+        # the index space of a configuration is the product, over groups of
+        # g suits with the same size tuple, of multisets of g suit indices
+        self.__Offsets = {}
+        offsets = []
+        offset = 0
+        for key in configurations:
+            self.__Offsets[key] = offset
+            offsets.append(offset)
+            codes = self.__ConfigurationCodes(key)
+            size = 1
+            i = 0
+            while i < 4:
+                g = 1
+                while i + g < 4 and codes[i + g] == codes[i]:
+                    g += 1
+                size *= comb(self.__SuitSize[codes[i]] + g - 1, g)
+                i += g
+            offset += size
+        self.Size = offset
+        self.__ConfigurationKeys = np.array(configurations, dtype=np.int64)
+        self.__ConfigurationOffsets = np.array(offsets, dtype=np.int64)
+
+        maxCode = 1 << (codeBits * len(rounds))
+        self.__SuitSizeArray = np.zeros(maxCode, dtype=np.int64)
+        for code, size in self.__SuitSize.items():
+            self.__SuitSizeArray[code] = size
+
+    # Packs a size tuple into an int; packed tuples sort like the tuples
+    @staticmethod
+    def Code(sizes):
+        code = 0
+        for n in sizes:
+            code = (code << HandIndexer.__CODE_BITS) | n
+        return code
+
+    def __ConfigurationKey(self, codes):
+        key = 0
+        for code in codes:
+            key = (key << (HandIndexer.__CODE_BITS * len(self.Rounds))) | code
+        return key
+
+    def __ConfigurationCodes(self, key):
+        bits = HandIndexer.__CODE_BITS * len(self.Rounds)
+        return [(key >> (bits * (3 - i))) & ((1 << bits) - 1) for i in range(4)]
+
+    # Returns the size tuple code, suit index and suit of every suit, sorted
+    # into canonical order, given the card mask of every round
+    @staticmethod
+    def __Suits(masks):
+        nBitsTable = Hand.nBitsTable
+        rankColex = HandIndexer.RankColex
+        suits = []
+        for suit in range(4):
+            used = 0
+            index = 0
+            multiplier = 1
+            code = 0
+            for mask in masks:
+                ranks = Hand.CardMask(mask, suit)
+                n = nBitsTable[ranks]
+                # drop the ranks used in earlier rounds from the rank mask
+                squeezed = ranks
+                remaining = used if ranks != 0 else 0
+                while remaining != 0:
+                    low = (1 << (remaining.bit_length() - 1)) - 1
+                    squeezed = (squeezed & low) | ((squeezed >> 1) & ~low)
+                    remaining &= low
+                index += multiplier * rankColex[squeezed]
+                multiplier *= comb(13 - nBitsTable[used], n)
+                used |= ranks
+                code = (code << HandIndexer.__CODE_BITS) | n
+            suits.append((code, index, suit))
+
+        # size tuples descending, then suit index ascending
+        suits.sort(key=lambda s: (-s[0], s[1]))
+        return suits
+
+    # Returns the dense index of a deal
+    # masks - the card mask of every round
+    def Index(self, masks):
+        suits = HandIndexer.__Suits(masks)
+        codes = [s[0] for s in suits]
+        index = self.__Offsets[self.__ConfigurationKey(codes)]
+        multiplier = 1
+        k = 0
+        for i in range(4):
+            k = k + 1 if i > 0 and codes[i] == codes[i - 1] else 0
+            index += multiplier * comb(suits[i][1] + k, k + 1)
+            if i == 3 or codes[i + 1] != codes[i]:
+                multiplier *= comb(self.__SuitSize[codes[i]] + k, k + 1)
+        return index
+
+    # Returns the masks of every round with the suits relabeled into
+    # canonical order. Isomorphic deals give the same masks.
+    @staticmethod
+    def Canonical(masks):
+        suits = HandIndexer.__Suits(masks)
+        result = []
+        for mask in masks:
+            canonical = 0
+            for newSuit in range(4):
+                canonical |= Hand.CardMask(mask, suits[newSuit][2]) << (13 * newSuit)
+            result.append(canonical)
+        return result
+
+    # Returns the np.int64 suit indices, size tuple codes and order that
+    # sorts the suits of every row, given the mask arrays of every round
+    @staticmethod
+    def __SuitsBatch(masks):
+        nBits = Hand.nBitsArray.astype(np.int64)
+        rankColex = HandIndexer.__RankColexArray
+        topBit = HandIndexer.__TopBitArray
+        shifts = np.array([0, 13, 26, 39], dtype=np.uint64)
+        rows = len(masks[0])
+        indices = np.zeros((rows, 4), dtype=np.int64)
+        codes = np.zeros((rows, 4), dtype=np.int64)
+        used = np.zeros((rows, 4), dtype=np.int64)
+        multiplier = np.ones((rows, 4), dtype=np.int64)
+        for mask in masks:
+            ranks = ((mask[:, None] >> shifts) & np.uint64(0x1FFF)).astype(np.int64)
+            n = nBits[ranks]
+            # drop the used ranks from the top down, one per pass
+            squeezed = ranks
+            remaining = used
+            for i in range(int(nBits[used].max()) if rows else 0):
+                low = np.where(remaining != 0, (1 << topBit[remaining]) - 1, 0x1FFF)
+                squeezed = (squeezed & low) | ((squeezed >> 1) & ~low)
+                remaining = remaining & low
+            indices += multiplier * rankColex[squeezed]
+            multiplier *= HandIndexer.__RankCombArray[nBits[used], n]
+            used = used | ranks
+            codes = (codes << HandIndexer.__CODE_BITS) | n
+
+        # size tuples descending, then suit index ascending; suit indices
+        # stay below 2^40
+        order = np.argsort((-codes << 40) + indices, axis=1, kind='stable')
+        return np.take_along_axis(indices, order, axis=1), np.take_along_axis(codes, order, axis=1), order
+
+    # Returns the dense indices of arrays of deals as a np.int64 array
+    # masks - one array of card masks for every round
+    def IndexBatch(self, masks):
+        masks = [np.asarray(mask, dtype=np.uint64) for mask in masks]
+        indices, codes, order = HandIndexer.__SuitsBatch(masks)
+
+        bits = HandIndexer.__CODE_BITS * len(self.Rounds)
+        key = np.zeros(len(masks[0]), dtype=np.int64)
+        for i in range(4):
+            key = (key << bits) | codes[:, i]
+        position = np.searchsorted(self.__ConfigurationKeys, key)
+        result = self.__ConfigurationOffsets[position].copy()
+
+        multiplier = np.ones(len(key), dtype=np.int64)
+        k = np.zeros(len(key), dtype=np.int64)
+        for i in range(4):
+            if i > 0:
+                k = np.where(codes[:, i] == codes[:, i - 1], k + 1, 0)
+            result += multiplier * HandIndexer.__MultisetComb(indices[:, i], k)
+            last = np.ones(len(key), dtype=bool) if i == 3 else codes[:, i + 1] != codes[:, i]
+            groupSize = HandIndexer.__MultisetComb(self.__SuitSizeArray[codes[:, i]], k)
+            multiplier = np.where(last, multiplier * groupSize, multiplier)
+        return result
+
+    # Returns comb(a + k, k + 1) elementwise for k from 0 to 3
+    @staticmethod
+    def __MultisetComb(a, k):
+        result = a.copy()
+        result = np.where(k >= 1, result * (a + 1) // 2, result)
+        result = np.where(k >= 2, result * (a + 2) // 3, result)
+        result = np.where(k >= 3, result * (a + 3) // 4, result)
+        return result
+
+    # Returns arrays of the round masks with the suits of every row
+    # relabeled into canonical order
+    @staticmethod
+    def CanonicalBatch(masks):
+        masks = [np.asarray(mask, dtype=np.uint64) for mask in masks]
+        indices, codes, order = HandIndexer.__SuitsBatch(masks)
+        result = []
+        for mask in masks:
+            canonical = np.zeros(len(mask), dtype=np.uint64)
+            for newSuit in range(4):
+                shift = (13 * order[:, newSuit]).astype(np.uint64)
+                canonical |= ((mask >> shift) & np.uint64(0x1FFF)) << np.uint64(13 * newSuit)
+            result.append(canonical)
+        return result
+#end HandIndexer
+
+
+# Canonical forms and dense indices of (pocket, board, dead) situations.
+#
+# The index space depends on the street (the number of board cards) and on
+# the number of dead cards. Preflop with no dead cards the index is the
+# PocketHand169 value, so it runs from 0 (AA) to 168 like Pocket169Table.
+class SuitIsomorphism:
+    __Indexers = {}
+    __Pocket169 = None
+
+    # Returns the indexer for a deal of pocket, board and dead cards
+    @staticmethod
+    def Indexer(boardCards: int, deadCards: int = 0):
+        rounds = (2, boardCards, deadCards) if deadCards != 0 else (2, boardCards) if boardCards != 0 else (2,)
+        indexer = SuitIsomorphism.__Indexers.get(rounds)
+        if indexer is None:
+            indexer = HandIndexer(rounds)
+            SuitIsomorphism.__Indexers[rounds] = indexer
+        return indexer
+
+    # Maps the preflop indexer onto PocketHand169 values
+    @staticmethod
+    def __FillPocket169():
+        indexer = SuitIsomorphism.Indexer(0)
+        pocket169 = np.zeros(indexer.Size, dtype=np.int64)
+        i = 0
+        while i < len(Hand.Pocket169Table):
+            pocket169[indexer.Index([Hand.Pocket169Table[i][0]])] = i
+            i += 1
+        SuitIsomorphism.__Pocket169 = pocket169
+
+    @staticmethod
+    def __Rounds(pocket, board, dead):
+        return [pocket, board, dead] if dead != 0 else [pocket, board] if board != 0 else [pocket]
+
+    # Returns the number of distinct indices for a street
+    # boardCards - number of board cards (0, 3, 4 or 5)
+    # deadCards - number of dead cards
+    @staticmethod
+    def IndexCount(boardCards: int, deadCards: int = 0):
+        return SuitIsomorphism.Indexer(boardCards, deadCards).Size
+
+    # Returns the dense index, from 0 to IndexCount - 1, of a situation
+    # pocket - two card pocket mask
+    # board - board mask (0, 3, 4 or 5 cards)
+    # dead - dead card mask
+    @staticmethod
+    def Index(pocket: int, board: int = 0, dead: int = 0):
+        pocket = int(pocket)
+        board = int(board)
+        dead = int(dead)
+        if __debug__:
+            if Hand.BitCount(pocket) != 2:
+                raise Exception("Pocket must have exactly two cards")
+            if (pocket & board) != 0 or ((pocket | board) & dead) != 0:
+                raise Exception("Pocket, board and dead cards must not overlap")
+
+        indexer = SuitIsomorphism.Indexer(Hand.BitCount(board), Hand.BitCount(dead))
+        index = indexer.Index(SuitIsomorphism.__Rounds(pocket, board, dead))
+        if board == 0 and dead == 0:
+            if SuitIsomorphism.__Pocket169 is None:
+                SuitIsomorphism.__FillPocket169()
+            return int(SuitIsomorphism.__Pocket169[index])
+        return index
+
+    # Returns the (pocket, board, dead) masks with the suits relabeled into
+    # canonical order
+    @staticmethod
+    def Canonical(pocket: int, board: int = 0, dead: int = 0):
+        masks = HandIndexer.Canonical([int(pocket), int(board), int(dead)])
+        return (masks[0], masks[1], masks[2])
+
+    # Returns the dense indices of arrays of situations as a np.int64 array.
+    # Every row must have the same number of board cards and of dead cards.
+    @staticmethod
+    def IndexBatch(pockets, boards=None, deads=None):
+        pockets = np.asarray(pockets, dtype=np.uint64)
+        boards = np.zeros(len(pockets), dtype=np.uint64) if boards is None else np.asarray(boards, dtype=np.uint64)
+        deads = np.zeros(len(pockets), dtype=np.uint64) if deads is None else np.asarray(deads, dtype=np.uint64)
+        if len(pockets) == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        boardCards = Hand.BitCount(int(boards[0]))
+        deadCards = Hand.BitCount(int(deads[0]))
+        if __debug__:
+            counts = SuitIsomorphism.__CardCounts
+            if (counts(pockets) != 2).any() or (counts(boards) != boardCards).any() or (counts(deads) != deadCards).any():
+                raise Exception("Every row must have two pocket cards and the same number of board and dead cards")
+
+        indexer = SuitIsomorphism.Indexer(boardCards, deadCards)
+        rounds = [pockets, boards, deads] if deadCards != 0 else [pockets, boards] if boardCards != 0 else [pockets]
+        indices = indexer.IndexBatch(rounds)
+        if boardCards == 0 and deadCards == 0:
+            if SuitIsomorphism.__Pocket169 is None:
+                SuitIsomorphism.__FillPocket169()
+            return SuitIsomorphism.__Pocket169[indices]
+        return indices
+
+    # Returns arrays of (pocket, board, dead) masks with the suits of every
+    # row relabeled into canonical order
+    @staticmethod
+    def CanonicalBatch(pockets, boards=None, deads=None):
+        pockets = np.asarray(pockets, dtype=np.uint64)
+        boards = np.zeros(len(pockets), dtype=np.uint64) if boards is None else np.asarray(boards, dtype=np.uint64)
+        deads = np.zeros(len(pockets), dtype=np.uint64) if deads is None else np.asarray(deads, dtype=np.uint64)
+        masks = HandIndexer.CanonicalBatch([pockets, boards, deads])
+        return (masks[0], masks[1], masks[2])
+
+    # Number of cards in each mask of an array
+    @staticmethod
+    def __CardCounts(masks):
+        nBits = Hand.nBitsArray
+        return nBits[(masks & np.uint64(0x1FFF)).astype(np.intp)] + \
+            nBits[((masks >> np.uint64(13)) & np.uint64(0x1FFF)).astype(np.intp)] + \
+            nBits[((masks >> np.uint64(26)) & np.uint64(0x1FFF)).astype(np.intp)] + \
+            nBits[((masks >> np.uint64(39)) & np.uint64(0x1FFF)).astype(np.intp)]
+#end SuitIsomorphism
@@ -0,0 +1,121 @@
+import numpy as np
+from collections import OrderedDict
+from HandEvaluator import Hand, FastHand
+from BoardContext import BoardContext
+from RiverEquity import RiverEquity
+
+# Exact equity on a turn from the rankings of all its rivers.
+#
+# A turn board leaves at most 48 river cards. TurnEquity evaluates every
+# pocket on every river in a single batch, a rivers x 1326 matrix of hand
+# values, and answers the turn queries from it: heads up win, tie and loss
+# counts are comparisons along its rows, the hand type tallies of
+# HandAnalysis.HandWinOdds are bincounts of them, and multiway counts are a
+# RiverEquity count per row. Get keeps the matrices of recent turns, so
+# every pocket after the first on a turn only compares.
+class TurnEquity:
+    # Number of turns Get keeps
+    CACHE_SIZE = 64
+    __Cache = OrderedDict()
+
+    # board - board mask, exactly 4 cards
+    # dead - cards that neither the river nor any pocket holds
+    def __init__(self, board: int, dead: int = 0):
+        board = int(board)
+        dead = int(dead)
+        if __debug__:
+            if Hand.BitCount(board) != 4:
+                raise Exception("Board must have exactly 4 cards")
+            if (board & dead) != 0:
+                raise Exception("Board and dead cards must not overlap")
+
+        self.Board = board
+        self.Dead = dead
+
+        # Rivers - np.uint64 masks of the river cards
+        # Values - np.uint32 value of every pocket with the board and every
+        #          river, indexed like Rivers and BoardContext.Pockets; 0 for
+        #          the pockets holding a board, dead or river card
+        self.Rivers = np.array(FastHand.LiveCards(board | dead), dtype=np.uint64)
+        hands = BoardContext.Pockets[None, :] | (self.Rivers[:, None] | np.uint64(board))
+        values = Hand.EvaluateBatch(hands.ravel(), 7).reshape(hands.shape)
+        values[(BoardContext.Pockets[None, :] & (self.Rivers[:, None] | np.uint64(board | dead))) != 0] = 0
+        values.flags.writeable = False
+        self.Values = values
+
+    # Returns the TurnEquity of a board, from the cache when it was asked
+    # for recently
+    @staticmethod
+    def Get(board: int, dead: int = 0):
+        key = (int(board), int(dead))
+        cache = TurnEquity.__Cache
+        turn = cache.get(key)
+        if turn is None:
+            turn = TurnEquity(board, dead)
+            cache[key] = turn
+            while len(cache) > TurnEquity.CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return turn
+
+    # Empties the Get cache
+    @staticmethod
+    def ClearCache():
+        TurnEquity.__Cache.clear()
+
+    # Returns the np.int64 array [wins, ties, losses] of pocket against one
+    # random opponent, over every river and every opponent pocket left
+    # pocket - two card pocket mask, holding no board or dead card
+    def Tally(self, pocket: int):
+        ours, values, valid = self.__Rows(pocket)
+        ours = ours[:, None]
+        return np.array([np.count_nonzero((values < ours) & valid), np.count_nonzero((values == ours) & valid),
+                         np.count_nonzero((values > ours) & valid)], dtype=np.int64)
+
+    # Returns the 3 x 9 np.int64 tally of HandAnalysis.HandWinOdds: the wins
+    # and ties by our hand type, the losses by the opponent's
+    def HandTypeTally(self, pocket: int):
+        ours, values, valid = self.__Rows(pocket)
+        ourTypes = ours >> Hand.HANDTYPE_SHIFT
+        tally = np.zeros((3, 9), dtype=np.int64)
+        tally[0] = np.bincount(ourTypes, weights=((values < ours[:, None]) & valid).sum(axis=1), minlength=9)
+        tally[1] = np.bincount(ourTypes, weights=((values == ours[:, None]) & valid).sum(axis=1), minlength=9)
+        tally[2] = np.bincount(values[(values > ours[:, None]) & valid] >> Hand.HANDTYPE_SHIFT, minlength=9)
+        return tally
+
+    # Returns the exact (wins, ties, losses) of pocket against
+    # numberOfOpponents random opponents, in deals of a river and the
+    # opponent pockets; see RiverEquity
+    def MultiwayTally(self, pocket: int, numberOfOpponents: int):
+        if __debug__:
+            if numberOfOpponents < 1 or numberOfOpponents > RiverEquity.MAX_OPPONENTS:
+                raise Exception("numberOfOpponents must be 1-" + str(RiverEquity.MAX_OPPONENTS))
+
+        pocket = int(pocket)
+        pocketIndex = BoardContext.PocketIndex(pocket)
+        wins = ties = losses = 0
+        for river, values in zip(self.Rivers.tolist(), self.Values):
+            if (river & pocket) == 0:
+                used = pocket | self.Board | self.Dead | river
+                tally = RiverEquity.TallyValues(values, int(values[pocketIndex]), self.Board | river, used, numberOfOpponents)
+                wins += tally[0]
+                ties += tally[1]
+                losses += tally[2]
+        return (wins, ties, losses)
+
+    # Returns our value on every river that misses our pocket, the values of
+    # the pockets on those rivers, and where they are opponent pockets
+    def __Rows(self, pocket: int):
+        pocket = int(pocket)
+        if __debug__:
+            if Hand.BitCount(pocket) != 2:
+                raise Exception("Pocket must have exactly two cards")
+            if (pocket & (self.Board | self.Dead)) != 0:
+                raise Exception("Pocket must not hold a board or dead card")
+
+        values = self.Values[(self.Rivers & np.uint64(pocket)) == 0]
+        ours = values[:, BoardContext.PocketIndex(pocket)]
+        valid = (values != 0) & ((BoardContext.Pockets & np.uint64(pocket)) == 0)[None, :]
+        return ours, values, valid
+#end TurnEquity